@@ -0,0 +1,23 @@
+# backend/app/clock.py
+
+"""
+Relógio único da aplicação.
+
+Os timestamps são gravados em UTC sem fuso (datetime.utcnow) e os
+rollups agrupam os dias pela data UTC; os intervalos dos endpoints
+usam o mesmo relógio. Datas recebidas com fuso (ex.: toISOString() do
+frontend) são convertidas para UTC antes de comparar com as colunas.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+def utc_now() -> datetime:
+    """Agora em UTC, sem fuso, como as colunas DateTime."""
+    return datetime.utcnow()
+
+def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Converte uma data com fuso para UTC sem fuso; datas sem fuso já são UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -1,9 +1,11 @@
 # backend/app/database.py
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, make_url, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from config import settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from config import settings, DEFAULT_KEYWORDS
 import logging
 
 # Configurar logging
@@ -14,12 +16,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Aplicar os PRAGMAs de produção em cada nova conexão SQLite
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+# Função para criar o engine síncrono de uma URL (também usada pelos testes)
+def create_db_engine(url: str):
+    if make_url(url).get_backend_name() == "sqlite":
+        connect_args = {"check_same_thread": False}  # Necessário para SQLite
+    else:
+        connect_args = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+
+    db_engine = create_engine(url, connect_args=connect_args, **settings.DB_POOL)
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine, "connect", set_sqlite_pragmas)
+    return db_engine
+
 # Criar engine do SQLAlchemy
 try:
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={"check_same_thread": False}  # Necessário para SQLite
-    )
+    engine = create_db_engine(settings.DATABASE_URL)
     logger.info("Database engine created successfully")
 except Exception as e:
     logger.error(f"Error creating database engine: {str(e)}")
@@ -33,6 +53,30 @@ except Exception as e:
     logger.error(f"Error creating session maker: {str(e)}")
     raise
 
+# Engine assíncrono dos endpoints de leitura: as consultas não bloqueiam o
+# event loop do FastAPI. O pool (ASYNC_DB_POOL) vale também para o SQLite,
+# cujo padrão no aiosqlite (NullPool) reabriria a conexão e os PRAGMAs a
+# cada requisição.
+try:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        connect_args=(
+            {} if make_url(settings.ASYNC_DATABASE_URL).get_backend_name() == "sqlite"
+            else {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+        ),
+        **settings.ASYNC_DB_POOL
+    )
+    logger.info("Async database engine created successfully")
+except Exception as e:
+    logger.error(f"Error creating async database engine: {str(e)}")
+    raise
+
+if async_engine.dialect.name == "sqlite":
+    event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Criar Base para os modelos
 Base = declarative_base()
 
@@ -44,6 +88,19 @@ def get_db():
     finally:
         db.close()
 
+# Função para obter uma sessão assíncrona (endpoints de leitura)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Função para obter um insert() com ON CONFLICT do dialeto em uso
+def dialect_insert(db, table):
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
 # Função para inicializar o banco de dados
 def init_db():
     try:
@@ -53,11 +110,25 @@ def init_db():
         from models.contact import Contact
         from models.keyword import Keyword
         from models.execution import Execution
+        from models.execution_keyword import ExecutionKeyword
         from models.competitor_appearance import CompetitorAppearance
+        from models.daily_keyword_stat import DailyKeywordStat
+        from models.daily_lidery_position import DailyLideryPosition
+        from models.daily_competitor_stat import DailyCompetitorStat
+        from models.daily_competitor_keyword_stat import DailyCompetitorKeywordStat
+        from migrations import run_migrations
+        from partitions import ensure_partitions
         
         # Criar todas as tabelas
         Base.metadata.create_all(bind=engine)
+        add_missing_columns()
         logger.info("Database tables created successfully")
+
+        # Aplicar as migrações versionadas pendentes
+        run_migrations(engine)
+
+        # Partições mensais dos próximos meses (PostgreSQL)
+        ensure_partitions(engine)
         
         # Inicializar dados padrão se necessário
         db = SessionLocal()
@@ -65,8 +136,8 @@ def init_db():
             # Verificar se já existem palavras-chave
             existing_keywords = db.query(Keyword).first()
             if not existing_keywords:
-                # Inserir palavras-chave padrão
-                for keyword in settings.DEFAULT_KEYWORDS:
+                # Inserir palavras-chave padrão (a lista tem repetições)
+                for keyword in dict.fromkeys(DEFAULT_KEYWORDS):
                     db_keyword = Keyword(text=keyword)
                     db.add(db_keyword)
                 db.commit()
@@ -81,6 +152,35 @@ def init_db():
         logger.error(f"Error initializing database: {str(e)}")
         raise
 
+# Função para adicionar colunas novas dos modelos em tabelas já existentes
+def add_missing_columns():
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                column_type = column.type.compile(dialect=engine.dialect)
+                statement = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+
+                # Preencher linhas antigas com o default escalar do modelo
+                default = column.default.arg if column.default is not None and column.default.is_scalar else None
+                if isinstance(default, bool):
+                    value = str(default).upper() if engine.dialect.name == "postgresql" else int(default)
+                    statement += f" DEFAULT {value}"
+                elif isinstance(default, (int, float)):
+                    statement += f" DEFAULT {default}"
+                elif isinstance(default, str):
+                    statement += " DEFAULT '{}'".format(default.replace("'", "''"))
+
+                connection.execute(text(statement))
+                logger.info(f"Added column {table.name}.{column.name}")
+
 # Função para limpar o banco de dados (útil para testes)
 def clear_db():
     try:
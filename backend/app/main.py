@@ -1,9 +1,12 @@
 # backend/app/main.py
 
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routers import execution, keywords, performance, competition, contacts
-from database import init_db
+from routers import execution, keywords, performance, competition, contacts, exports, metrics
+from database import async_engine, init_db
+from services.execution_engine import execution_engine
+from services.driver_pool import driver_pool
 from config import settings
 
 app = FastAPI(
@@ -22,17 +25,36 @@ app.add_middleware(
 )
 
 # Incluir routers
-app.include_router(execution.router, prefix=settings.API_V1_STR)
-app.include_router(keywords.router, prefix=settings.API_V1_STR)
-app.include_router(performance.router, prefix=settings.API_V1_STR)
-app.include_router(competition.router, prefix=settings.API_V1_STR)
-app.include_router(contacts.router, prefix=settings.API_V1_STR)
+app.include_router(execution.router, prefix=settings.API_PREFIX)
+app.include_router(keywords.router, prefix=settings.API_PREFIX)
+app.include_router(performance.router, prefix=settings.API_PREFIX)
+app.include_router(competition.router, prefix=settings.API_PREFIX)
+app.include_router(contacts.router, prefix=settings.API_PREFIX)
+app.include_router(exports.router, prefix=settings.API_PREFIX)
+
+# /metrics fica fora do prefixo da API, no caminho padrão dos coletores
+app.include_router(metrics.router)
 
 @app.on_event("startup")
 async def startup_event():
     """Executa ações necessárias na inicialização da API."""
     init_db()
 
+    # Retomar ou encerrar execuções interrompidas por uma queda da API
+    execution_engine.recover_orphans()
+
+    # Pré-aquecer drivers headless do Chrome sem bloquear a inicialização
+    # (drivers visíveis só são abertos quando uma execução os pede)
+    if settings.DRIVER_POOL_PREWARM > 0:
+        threading.Thread(target=driver_pool.warm_up, kwargs={"headless": True}, daemon=True).start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cancela as execuções em andamento antes de encerrar a API."""
+    execution_engine.shutdown()
+    driver_pool.shutdown()
+    await async_engine.dispose()
+
 @app.get("/")
 async def root():
     """Rota raiz para verificar se a API está funcionando."""
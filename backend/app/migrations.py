@@ -0,0 +1,190 @@
+# backend/app/migrations.py
+
+"""
+Migrações versionadas do banco.
+
+create_all() só cria tabelas novas e add_missing_columns() só adiciona
+colunas; mudanças que não se resumem a isso (índices em tabelas já
+existentes, correção de dados) entram aqui como uma migração numerada.
+As versões aplicadas ficam registradas na tabela schema_migrations e
+cada migração roda na sua própria transação.
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection, Engine
+from database import Base
+
+logger = logging.getLogger(__name__)
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String),
+    Column("applied_at", DateTime, default=datetime.utcnow)
+)
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = []
+
+def migration(version: int, description: str):
+    """Registra uma função como a migração de número version."""
+    def register(func: Callable[[Connection], None]):
+        MIGRATIONS.append((version, description, func))
+        MIGRATIONS.sort(key=lambda item: item[0])
+        return func
+    return register
+
+def create_indexes(connection: Connection, table_name: str, index_names: List[str]) -> None:
+    """Cria, se ainda não existirem, índices declarados no modelo da tabela."""
+    table = Base.metadata.tables[table_name]
+    indexes = {index.name: index for index in table.indexes}
+    for name in index_names:
+        indexes[name].create(connection, checkfirst=True)
+
+@migration(1, "Composite indexes for the analytics queries")
+def add_analytics_indexes(connection: Connection) -> None:
+    create_indexes(connection, "searches", [
+        "ix_searches_timestamp_lidery_position",
+        "ix_searches_keyword_id_timestamp",
+        "ix_searches_execution_id"
+    ])
+    create_indexes(connection, "competitor_appearances", [
+        "ix_competitor_appearances_search_competitor",
+        "ix_competitor_appearances_competitor_search"
+    ])
+    create_indexes(connection, "contacts", [
+        "ix_contacts_first_seen",
+        "ix_contacts_competitor_id"
+    ])
+    create_indexes(connection, "executions", [
+        "ix_executions_start_time"
+    ])
+
+    # Atualizar as estatísticas usadas pelo planner para escolher os índices
+    if connection.dialect.name in ("sqlite", "postgresql"):
+        connection.exec_driver_sql("ANALYZE")
+
+@migration(2, "Backfill the daily rollup tables")
+def backfill_rollups(connection: Connection) -> None:
+    from services.rollups import rebuild_rollups
+    rebuild_rollups(connection)
+
+@migration(3, "Deduplicate contacts and add the unique (competitor, type, value) index")
+def deduplicate_contacts(connection: Connection) -> None:
+    # Marcadores gravados pela antiga detecção de WhatsApp, sem número real
+    connection.exec_driver_sql("DELETE FROM contacts WHERE value = 'found_whatsapp'")
+    connection.exec_driver_sql(
+        "DELETE FROM contacts WHERE competitor_id IS NULL OR type IS NULL OR value IS NULL"
+    )
+
+    # A linha mais antiga de cada grupo recebe os totais das repetições
+    connection.exec_driver_sql("""
+        UPDATE contacts SET
+            times_found = (
+                SELECT SUM(COALESCE(d.times_found, 1)) FROM contacts d
+                WHERE d.competitor_id = contacts.competitor_id
+                  AND d.type = contacts.type AND d.value = contacts.value
+            ),
+            first_seen = (
+                SELECT MIN(d.first_seen) FROM contacts d
+                WHERE d.competitor_id = contacts.competitor_id
+                  AND d.type = contacts.type AND d.value = contacts.value
+            ),
+            last_seen = (
+                SELECT MAX(d.last_seen) FROM contacts d
+                WHERE d.competitor_id = contacts.competitor_id
+                  AND d.type = contacts.type AND d.value = contacts.value
+            )
+        WHERE id IN (
+            SELECT MIN(id) FROM contacts
+            GROUP BY competitor_id, type, value
+            HAVING COUNT(*) > 1
+        )
+    """)
+    connection.exec_driver_sql("""
+        DELETE FROM contacts WHERE id NOT IN (
+            SELECT MIN(id) FROM contacts GROUP BY competitor_id, type, value
+        )
+    """)
+
+    create_indexes(connection, "contacts", ["ux_contacts_competitor_type_value"])
+
+@migration(4, "Split the execution mode (full/serp_only) from the headless flag")
+def split_execution_mode(connection: Connection) -> None:
+    # execution_mode guardava a visibilidade do Chrome; toda execução antiga visitava os anunciantes
+    connection.exec_driver_sql(
+        "UPDATE executions SET headless = CASE WHEN execution_mode = 'headless' THEN TRUE ELSE FALSE END"
+    )
+    connection.exec_driver_sql(
+        "UPDATE executions SET execution_mode = 'full' "
+        "WHERE execution_mode IS NULL OR execution_mode IN ('visible', 'headless')"
+    )
+
+@migration(5, "Monthly partitions for searches and competitor_appearances (PostgreSQL)")
+def partition_history_tables(connection: Connection) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+
+    from partitions import PARTITIONED_TABLES, partition_table
+    for table, column in PARTITIONED_TABLES.items():
+        partition_table(connection, table, column)
+
+# Colunas usadas como chave de paginação por keyset e o valor das linhas
+# antigas sem valor: uma comparação (coluna, id) > (:v, :id) nunca casa com NULL
+PAGINATION_KEY_BACKFILL = {
+    "contacts": [
+        ("first_seen", "COALESCE(last_seen, :now)"),
+        ("last_seen", "first_seen"),
+        ("times_found", "1")
+    ],
+    "keywords": [
+        ("created_at", ":now"),
+        ("use_count", "0")
+    ],
+    "executions": [
+        ("start_time", "COALESCE(end_time, :now)")
+    ]
+}
+
+@migration(6, "Backfill and forbid NULLs in the pagination sort columns")
+def require_pagination_keys(connection: Connection) -> None:
+    now = datetime.utcnow()
+    for table, columns in PAGINATION_KEY_BACKFILL.items():
+        for column, value in columns:
+            connection.execute(
+                text(f"UPDATE {table} SET {column} = {value} WHERE {column} IS NULL"),
+                {"now": now}
+            )
+            # O SQLite não altera colunas existentes sem recriar a tabela; lá o
+            # NOT NULL vale para bancos novos e as gravações sempre preenchem o valor
+            if connection.dialect.name == "postgresql":
+                connection.exec_driver_sql(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL")
+
+def applied_versions(engine: Engine) -> List[int]:
+    schema_migrations.create(engine, checkfirst=True)
+    with engine.connect() as connection:
+        return list(connection.execute(select(schema_migrations.c.version)).scalars())
+
+def run_migrations(engine: Engine) -> int:
+    """Aplica as migrações pendentes em ordem. Retorna quantas foram aplicadas."""
+    applied = set(applied_versions(engine))
+    pending = [item for item in MIGRATIONS if item[0] not in applied]
+
+    for version, description, func in pending:
+        try:
+            with engine.begin() as connection:
+                func(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=version,
+                    description=description,
+                    applied_at=datetime.utcnow()
+                ))
+            logger.info(f"Applied migration {version}: {description}")
+        except Exception as e:
+            logger.error(f"Error applying migration {version}: {str(e)}")
+            raise
+
+    return len(pending)
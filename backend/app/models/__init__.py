@@ -1,17 +1,27 @@
 # backend/app/models/__init__.py
 
 from .execution import Execution
+from .execution_keyword import ExecutionKeyword
 from .keyword import Keyword
 from .search import Search
 from .competitor import Competitor
 from .competitor_appearance import CompetitorAppearance
 from .contact import Contact
+from .daily_keyword_stat import DailyKeywordStat
+from .daily_lidery_position import DailyLideryPosition
+from .daily_competitor_stat import DailyCompetitorStat
+from .daily_competitor_keyword_stat import DailyCompetitorKeywordStat
 
 __all__ = [
     'Execution',
+    'ExecutionKeyword',
     'Keyword',
     'Search',
     'Competitor',
     'CompetitorAppearance',
-    'Contact'
+    'Contact',
+    'DailyKeywordStat',
+    'DailyLideryPosition',
+    'DailyCompetitorStat',
+    'DailyCompetitorKeywordStat'
 ]
\ No newline at end of file
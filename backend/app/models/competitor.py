@@ -14,6 +14,7 @@ class Competitor(Base):
     first_seen = Column(DateTime, default=datetime.utcnow)
     last_seen = Column(DateTime, default=datetime.utcnow)
     total_appearances = Column(Integer, default=0)
+    last_visited = Column(DateTime, nullable=True)  # Última visita completa ao site
 
     appearances = relationship("CompetitorAppearance", back_populates="competitor")
     contacts = relationship("Contact", back_populates="competitor")
@@ -25,5 +26,6 @@ class Competitor(Base):
             "business_name": self.business_name,
             "first_seen": self.first_seen.isoformat() if self.first_seen else None,
             "last_seen": self.last_seen.isoformat() if self.last_seen else None,
-            "total_appearances": self.total_appearances
+            "total_appearances": self.total_appearances,
+            "last_visited": self.last_visited.isoformat() if self.last_visited else None
         }
\ No newline at end of file
@@ -1,12 +1,17 @@
 # backend/app/models/competitor_appearance.py
 
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
 
 class CompetitorAppearance(Base):
     __tablename__ = "competitor_appearances"
+    __table_args__ = (
+        # Cobre o join a partir das pesquisas do período (top-competitors)
+        Index("ix_competitor_appearances_search_competitor", "search_id", "competitor_id", "position"),
+        Index("ix_competitor_appearances_competitor_search", "competitor_id", "search_id", "position"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     competitor_id = Column(Integer, ForeignKey("competitors.id"))
@@ -1,20 +1,26 @@
 # backend/app/models/contact.py
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_first_seen", "first_seen"),
+        Index("ix_contacts_competitor_id", "competitor_id"),
+        Index("ux_contacts_competitor_type_value", "competitor_id", "type", "value", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     competitor_id = Column(Integer, ForeignKey("competitors.id"))
-    type = Column(String)  # whatsapp, telefone, etc
-    value = Column(String)
-    first_seen = Column(DateTime, default=datetime.utcnow)
-    last_seen = Column(DateTime, default=datetime.utcnow)
-    times_found = Column(Integer, default=1)
+    type = Column(String)  # whatsapp, phone ou email
+    value = Column(String)  # Normalizado: telefones em E.164, emails em minúsculas
+    # Chaves de ordenação da listagem paginada: não podem ser nulas (migração 6)
+    first_seen = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_seen = Column(DateTime, default=datetime.utcnow, nullable=False)
+    times_found = Column(Integer, default=1, nullable=False)
 
     competitor = relationship("Competitor", back_populates="contacts")
 
@@ -0,0 +1,26 @@
+# backend/app/models/daily_competitor_keyword_stat.py
+
+from sqlalchemy import Column, Integer, Date, ForeignKey, Index
+from database import Base
+
+class DailyCompetitorKeywordStat(Base):
+    """Aparições diárias de cada competidor por palavra-chave (rollup)."""
+    __tablename__ = "daily_competitor_keyword_stats"
+    __table_args__ = (
+        Index("ix_daily_competitor_keyword_stats_competitor_day", "competitor_id", "day"),
+    )
+
+    day = Column(Date, primary_key=True)
+    competitor_id = Column(Integer, ForeignKey("competitors.id"), primary_key=True)
+    keyword_id = Column(Integer, ForeignKey("keywords.id"), primary_key=True)
+    appearances = Column(Integer, default=0)
+    position_sum = Column(Integer, default=0)
+
+    def to_dict(self):
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "competitor_id": self.competitor_id,
+            "keyword_id": self.keyword_id,
+            "appearances": self.appearances,
+            "position_sum": self.position_sum
+        }
@@ -0,0 +1,23 @@
+# backend/app/models/daily_competitor_stat.py
+
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from database import Base
+
+class DailyCompetitorStat(Base):
+    """Aparições diárias de cada competidor (rollup)."""
+    __tablename__ = "daily_competitor_stats"
+
+    day = Column(Date, primary_key=True)
+    competitor_id = Column(Integer, ForeignKey("competitors.id"), primary_key=True)
+    appearances = Column(Integer, default=0)
+    position_sum = Column(Integer, default=0)
+    clicks = Column(Integer, default=0)
+
+    def to_dict(self):
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "competitor_id": self.competitor_id,
+            "appearances": self.appearances,
+            "position_sum": self.position_sum,
+            "clicks": self.clicks
+        }
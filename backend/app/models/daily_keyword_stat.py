@@ -0,0 +1,27 @@
+# backend/app/models/daily_keyword_stat.py
+
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from database import Base
+
+class DailyKeywordStat(Base):
+    """Totais diários das pesquisas de cada palavra-chave (rollup)."""
+    __tablename__ = "daily_keyword_stats"
+
+    day = Column(Date, primary_key=True)
+    keyword_id = Column(Integer, ForeignKey("keywords.id"), primary_key=True)
+    searches = Column(Integer, default=0)
+    total_ads = Column(Integer, default=0)
+    clicks = Column(Integer, default=0)
+    lidery_found = Column(Integer, default=0)
+    lidery_position_sum = Column(Integer, default=0)
+
+    def to_dict(self):
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "keyword_id": self.keyword_id,
+            "searches": self.searches,
+            "total_ads": self.total_ads,
+            "clicks": self.clicks,
+            "lidery_found": self.lidery_found,
+            "lidery_position_sum": self.lidery_position_sum
+        }
@@ -0,0 +1,21 @@
+# backend/app/models/daily_lidery_position.py
+
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from database import Base
+
+class DailyLideryPosition(Base):
+    """Histograma diário das posições da Lidery por palavra-chave (rollup)."""
+    __tablename__ = "daily_lidery_positions"
+
+    day = Column(Date, primary_key=True)
+    keyword_id = Column(Integer, ForeignKey("keywords.id"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    count = Column(Integer, default=0)
+
+    def to_dict(self):
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "keyword_id": self.keyword_id,
+            "position": self.position,
+            "count": self.count
+        }
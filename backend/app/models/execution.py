@@ -1,22 +1,30 @@
 # backend/app/models/execution.py
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Index, JSON
 from datetime import datetime
 from database import Base
 
 class Execution(Base):
     __tablename__ = "executions"
+    __table_args__ = (
+        Index("ix_executions_start_time", "start_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    start_time = Column(DateTime, default=datetime.utcnow)
+    start_time = Column(DateTime, default=datetime.utcnow, nullable=False)
     end_time = Column(DateTime, nullable=True)
     total_searches = Column(Integer, default=0)
     total_clicks = Column(Integer, default=0)
     total_lidery_found = Column(Integer, default=0)
+    delay_seconds = Column(Float, default=0.0)  # Tempo gasto em atrasos deliberados
     is_running = Column(Boolean, default=True)
-    execution_mode = Column(String, default="visible")  # visible ou headless
+    execution_mode = Column(String, default="full")  # full ou serp_only
+    headless = Column(Boolean, default=False)
+    workers = Column(Integer, nullable=True)  # Tamanho do pool de workers usado
+    delay_profile = Column(String, nullable=True)  # Perfil de atrasos usado
     status = Column(String, default="running")
     error_message = Column(String, nullable=True)
+    metrics_summary = Column(JSON, nullable=True)  # Tempos por etapa, contadores e erros
 
     def to_dict(self):
         return {
@@ -26,8 +34,13 @@ class Execution(Base):
             "total_searches": self.total_searches,
             "total_clicks": self.total_clicks,
             "total_lidery_found": self.total_lidery_found,
+            "delay_seconds": self.delay_seconds,
             "is_running": self.is_running,
             "execution_mode": self.execution_mode,
+            "headless": self.headless,
+            "workers": self.workers,
+            "delay_profile": self.delay_profile,
             "status": self.status,
-            "error_message": self.error_message
+            "error_message": self.error_message,
+            "metrics_summary": self.metrics_summary
         }
\ No newline at end of file
@@ -0,0 +1,38 @@
+# backend/app/models/execution_keyword.py
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from database import Base
+
+class ExecutionKeyword(Base):
+    """Plano de trabalho de uma execução: uma linha por keyword a pesquisar."""
+
+    __tablename__ = "execution_keywords"
+    __table_args__ = (
+        Index("ux_execution_keywords_execution_keyword", "execution_id", "keyword_id", unique=True),
+        Index("ix_execution_keywords_execution_status", "execution_id", "status"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    execution_id = Column(Integer, ForeignKey("executions.id"), nullable=False)
+    keyword_id = Column(Integer, ForeignKey("keywords.id"), nullable=False)
+    position = Column(Integer, default=0)  # Ordem (embaralhada) no plano
+    status = Column(String, default="pending")  # pending, running, completed ou failed
+    attempts = Column(Integer, default=0)
+    last_error = Column(String, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "execution_id": self.execution_id,
+            "keyword_id": self.keyword_id,
+            "position": self.position,
+            "status": self.status,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
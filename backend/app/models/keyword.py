@@ -11,9 +11,9 @@ class Keyword(Base):
     id = Column(Integer, primary_key=True, index=True)
     text = Column(String, unique=True, index=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     last_used = Column(DateTime, nullable=True)
-    use_count = Column(Integer, default=0)
+    use_count = Column(Integer, default=0, nullable=False)
 
     searches = relationship("Search", back_populates="keyword")
 
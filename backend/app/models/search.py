@@ -1,12 +1,17 @@
 # backend/app/models/search.py
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
 
 class Search(Base):
     __tablename__ = "searches"
+    __table_args__ = (
+        Index("ix_searches_timestamp_lidery_position", "timestamp", "lidery_position"),
+        Index("ix_searches_keyword_id_timestamp", "keyword_id", "timestamp"),
+        Index("ix_searches_execution_id", "execution_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     keyword_id = Column(Integer, ForeignKey("keywords.id"))
@@ -0,0 +1,160 @@
+# backend/app/partitions.py
+
+"""
+Particionamento mensal de searches e competitor_appearances (PostgreSQL).
+
+As duas tabelas crescem a cada pesquisa e as consultas por período
+(exports, reconstrução dos rollups) filtram pela coluna timestamp; com
+uma partição RANGE por mês o planner descarta os meses fora do período.
+A migração 5 converte as tabelas criadas pelo create_all() e
+ensure_partitions(), chamada pelo init_db(), mantém as partições dos
+próximos PARTITION_MONTHS_AHEAD meses. Linhas fora das partições
+existentes caem na partição default e são movidas para a do seu mês
+quando ela é criada.
+
+No PostgreSQL a chave primária dessas tabelas passa a ser
+(id, timestamp), e competitor_appearances.search_id fica sem FOREIGN
+KEY: uma FK só pode apontar para uma chave única que contenha a coluna
+de particionamento. O SearchWriter grava a pesquisa e as aparições na
+mesma transação. No SQLite nada muda.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterator
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from config import settings
+from database import Base
+
+logger = logging.getLogger(__name__)
+
+# Tabelas particionadas e a coluna de particionamento
+PARTITIONED_TABLES = {
+    "searches": "timestamp",
+    "competitor_appearances": "timestamp"
+}
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+def months_between(first: date, last: date) -> Iterator[date]:
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_{month.year}_{month.month:02d}"
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    return connection.execute(text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+    ), {"table": table}).first() is not None
+
+def create_partition(connection: Connection, table: str, column: str, month: date) -> bool:
+    """Cria a partição do mês, se ainda não existir. Retorna se criou."""
+    name = partition_name(table, month)
+    if connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+        return False
+
+    bounds = f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    in_month = f'"{column}" >= :start AND "{column}" < :end'
+    params = {"start": month, "end": add_months(month, 1)}
+    default = f"{table}_default"
+
+    stranded = connection.execute(
+        text(f"SELECT 1 FROM {default} WHERE {in_month} LIMIT 1"), params
+    ).first() is not None
+    if not stranded:
+        connection.exec_driver_sql(f"CREATE TABLE {name} PARTITION OF {table} {bounds}")
+    else:
+        # A default não pode ficar com linhas do intervalo de uma partição nova
+        connection.exec_driver_sql(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)")
+        connection.execute(text(f"INSERT INTO {name} SELECT * FROM {default} WHERE {in_month}"), params)
+        connection.execute(text(f"DELETE FROM {default} WHERE {in_month}"), params)
+        connection.exec_driver_sql(f"ALTER TABLE {table} ATTACH PARTITION {name} {bounds}")
+
+    logger.info(f"Created partition {name}")
+    return True
+
+def partition_table(connection: Connection, table: str, column: str) -> None:
+    """
+    Converte uma tabela comum numa tabela particionada por mês, com os
+    mesmos dados, sequência de IDs, FKs e índices declarados no modelo.
+    """
+    if is_partitioned(connection, table):
+        return
+
+    legacy = f"{table}_unpartitioned"
+    now = datetime.utcnow()
+    sequence = connection.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}
+    ).scalar()
+
+    connection.exec_driver_sql(f"ALTER TABLE {table} RENAME TO {legacy}")
+    connection.execute(text(f'UPDATE {legacy} SET "{column}" = :now WHERE "{column}" IS NULL'), {"now": now})
+    if sequence:
+        # A sequência sobrevive ao DROP da tabela antiga e passa para a nova
+        connection.exec_driver_sql(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+
+    connection.exec_driver_sql(
+        f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ("{column}")'
+    )
+    connection.exec_driver_sql(f'ALTER TABLE {table} ALTER COLUMN "{column}" SET NOT NULL')
+    connection.exec_driver_sql(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    first, last = connection.execute(text(f'SELECT MIN("{column}"), MAX("{column}") FROM {legacy}')).first()
+    for month in months_between((first or now).date(), (last or now).date()):
+        create_partition(connection, table, column, month)
+
+    connection.exec_driver_sql(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    connection.exec_driver_sql(f"DROP TABLE {legacy} CASCADE")
+    if sequence:
+        connection.exec_driver_sql(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+    # Chave, FKs e índices só depois do DROP, que libera os nomes da tabela antiga
+    connection.exec_driver_sql(f'ALTER TABLE {table} ADD PRIMARY KEY (id, "{column}")')
+    model = Base.metadata.tables[table]
+    for foreign_key in model.foreign_keys:
+        target = foreign_key.column.table.name
+        if target in PARTITIONED_TABLES:
+            continue
+        connection.exec_driver_sql(
+            f"ALTER TABLE {table} ADD FOREIGN KEY ({foreign_key.parent.name}) "
+            f"REFERENCES {target} ({foreign_key.column.name})"
+        )
+    for index in model.indexes:
+        index.create(connection)
+
+    logger.info(f"Partitioned table {table} by month of {column}")
+
+def ensure_partitions(engine: Engine, months_ahead: int = settings.PARTITION_MONTHS_AHEAD) -> Dict[str, int]:
+    """
+    Cria as partições do mês corrente e dos months_ahead seguintes, e as
+    dos meses que tiverem linhas paradas na partição default. Retorna
+    quantas partições foram criadas por tabela.
+    """
+    if engine.dialect.name != "postgresql":
+        return {}
+
+    # Os timestamps são gravados em UTC (utcnow)
+    current = datetime.utcnow().date().replace(day=1)
+    created = {}
+    with engine.begin() as connection:
+        for table, column in PARTITIONED_TABLES.items():
+            if not is_partitioned(connection, table):
+                continue
+
+            months = {add_months(current, offset) for offset in range(months_ahead + 1)}
+            months.update(
+                month.date() for month in connection.execute(text(
+                    f"SELECT DISTINCT date_trunc('month', \"{column}\") FROM {table}_default"
+                )).scalars()
+            )
+            created[table] = sum(
+                create_partition(connection, table, column, month) for month in sorted(months)
+            )
+    return created
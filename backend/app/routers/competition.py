@@ -1,48 +1,58 @@
 # backend/app/routers/competition.py
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import datetime, timedelta
-from sqlalchemy import func
-from database import get_db
-from models import Competitor, CompetitorAppearance, Search, Keyword
+from datetime import timedelta
+from sqlalchemy import func, select
+from database import get_async_db
+from clock import utc_now
+from services.response_cache import CachedRoute
+from models import Competitor, Keyword, DailyCompetitorStat, DailyCompetitorKeywordStat
 
 router = APIRouter(
     prefix="/competition",
-    tags=["competition"]
+    tags=["competition"],
+    route_class=CachedRoute
 )
 
 @router.get("/top-competitors")
 async def get_top_competitors(
     limit: int = 10,
     days: int = 30,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Obtém os principais competidores."""
-    start_date = datetime.now() - timedelta(days=days)
+    start_date = utc_now() - timedelta(days=days)
     
-    competitors = db.query(
+    # Soma os rollups diários e busca os competidores no final
+    ranking = select(
+        DailyCompetitorStat.competitor_id.label('competitor_id'),
+        func.sum(DailyCompetitorStat.appearances).label('appearances'),
+        func.sum(DailyCompetitorStat.position_sum).label('position_sum')
+    ).where(
+        DailyCompetitorStat.day >= start_date.date()
+    ).group_by(
+        DailyCompetitorStat.competitor_id
+    ).order_by(
+        func.sum(DailyCompetitorStat.appearances).desc()
+    ).limit(limit).subquery()
+
+    competitors = (await db.execute(select(
         Competitor,
-        func.count(CompetitorAppearance.id).label('appearances'),
-        func.avg(CompetitorAppearance.position).label('avg_position')
+        ranking.c.appearances,
+        ranking.c.position_sum
     ).join(
-        CompetitorAppearance
-    ).join(
-        Search
-    ).filter(
-        Search.timestamp >= start_date
-    ).group_by(
-        Competitor.id
+        ranking, ranking.c.competitor_id == Competitor.id
     ).order_by(
-        func.count(CompetitorAppearance.id).desc()
-    ).limit(limit).all()
+        ranking.c.appearances.desc()
+    ))).all()
 
     return [
         {
             **competitor[0].to_dict(),
             "appearances": competitor[1],
-            "average_position": float(competitor[2])
+            "average_position": competitor[2] / competitor[1]
         }
         for competitor in competitors
     ]
@@ -51,33 +61,29 @@ async def get_top_competitors(
 async def get_competitor_details(
     competitor_id: int,
     days: int = 30,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Obtém detalhes específicos de um competidor."""
-    competitor = db.query(Competitor).filter(
-        Competitor.id == competitor_id
-    ).first()
+    competitor = await db.get(Competitor, competitor_id)
     
     if not competitor:
         raise HTTPException(status_code=404, detail="Competitor not found")
 
-    start_date = datetime.now() - timedelta(days=days)
+    start_date = utc_now() - timedelta(days=days)
     
     # Análise por palavra-chave
-    keyword_analysis = db.query(
+    keyword_analysis = (await db.execute(select(
         Keyword.text,
-        func.count(CompetitorAppearance.id).label('appearances'),
-        func.avg(CompetitorAppearance.position).label('avg_position')
-    ).join(
-        Search, Search.keyword_id == Keyword.id
+        func.sum(DailyCompetitorKeywordStat.appearances).label('appearances'),
+        func.sum(DailyCompetitorKeywordStat.position_sum).label('position_sum')
     ).join(
-        CompetitorAppearance
-    ).filter(
-        CompetitorAppearance.competitor_id == competitor_id,
-        Search.timestamp >= start_date
+        DailyCompetitorKeywordStat, DailyCompetitorKeywordStat.keyword_id == Keyword.id
+    ).where(
+        DailyCompetitorKeywordStat.competitor_id == competitor_id,
+        DailyCompetitorKeywordStat.day >= start_date.date()
     ).group_by(
         Keyword.id
-    ).all()
+    ))).all()
 
     return {
         **competitor.to_dict(),
@@ -85,7 +91,7 @@ async def get_competitor_details(
             {
                 "keyword": ka[0],
                 "appearances": ka[1],
-                "average_position": float(ka[2])
+                "average_position": ka[2] / ka[1]
             }
             for ka in keyword_analysis
         ]
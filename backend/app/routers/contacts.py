@@ -1,53 +1,91 @@
 # backend/app/routers/contacts.py
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import datetime, timedelta
-from database import get_db
+from datetime import timedelta
+from sqlalchemy import or_, select
+from database import get_async_db
+from clock import utc_now
 from models import Contact, Competitor
+from services.pagination import paginate
 
 router = APIRouter(
     prefix="/contacts",
     tags=["contacts"]
 )
 
+CONTACT_SORTS = {
+    "times_found": Contact.times_found,
+    "first_seen": Contact.first_seen,
+    "last_seen": Contact.last_seen
+}
+
 @router.get("/")
 async def list_contacts(
     contact_type: Optional[str] = None,
     days: int = 30,
-    db: Session = Depends(get_db)
+    search: Optional[str] = None,
+    sort: str = "-times_found",
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Lista todos os contatos encontrados."""
-    query = db.query(Contact, Competitor)\
+    """Lista os contatos encontrados, paginados por cursor."""
+    statement = select(Contact, Competitor)\
         .join(Competitor)
     
     if contact_type:
-        query = query.filter(Contact.type == contact_type)
+        statement = statement.where(Contact.type == contact_type)
     
     if days:
-        start_date = datetime.now() - timedelta(days=days)
-        query = query.filter(Contact.first_seen >= start_date)
-    
-    contacts = query.order_by(Contact.times_found.desc()).all()
+        start_date = utc_now() - timedelta(days=days)
+        statement = statement.where(Contact.first_seen >= start_date)
+
+    if search:
+        pattern = f"%{search.strip()}%"
+        statement = statement.where(or_(Competitor.domain.ilike(pattern), Contact.value.ilike(pattern)))
     
-    return [
-        {
-            **contact[0].to_dict(),
-            "competitor_domain": contact[1].domain,
-            "competitor_name": contact[1].business_name
+    return await paginate(
+        db,
+        statement,
+        sort,
+        CONTACT_SORTS,
+        Contact.id,
+        cursor=cursor,
+        limit=limit,
+        include_total=include_total,
+        serialize=lambda row: {
+            **row[0].to_dict(),
+            "competitor_domain": row[1].domain,
+            "competitor_name": row[1].business_name
         }
-        for contact in contacts
-    ]
+    )
 
 @router.get("/competitor/{competitor_id}")
 async def get_competitor_contacts(
     competitor_id: int,
-    db: Session = Depends(get_db)
+    contact_type: Optional[str] = None,
+    sort: str = "-times_found",
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Obtém todos os contatos de um competidor específico."""
-    contacts = db.query(Contact).filter(
+    """Obtém os contatos de um competidor específico, paginados por cursor."""
+    statement = select(Contact).where(
         Contact.competitor_id == competitor_id
-    ).all()
+    )
+    if contact_type:
+        statement = statement.where(Contact.type == contact_type)
     
-    return [contact.to_dict() for contact in contacts]
\ No newline at end of file
+    return await paginate(
+        db,
+        statement,
+        sort,
+        CONTACT_SORTS,
+        Contact.id,
+        cursor=cursor,
+        limit=limit,
+        serialize=lambda contact: contact.to_dict()
+    )
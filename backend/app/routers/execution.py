@@ -1,12 +1,23 @@
 # backend/app/routers/execution.py
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-from database import get_db
-from services.scraping_manager import ScrapingManager
+from database import get_async_db, get_db
+from services.execution_engine import execution_engine
+from services.driver_pool import driver_pool
+from services.response_cache import response_cache
+from services.event_bus import event_bus, to_sse
+from services.pagination import paginate
+from services.metrics import metrics
+from services.execution_plan import execution_plan
 from models import Execution
+from config import settings
 
 router = APIRouter(
     prefix="/execution",
@@ -16,14 +27,31 @@ router = APIRouter(
 @router.post("/start")
 async def start_execution(
     headless: bool = False,
+    workers: Optional[int] = None,
+    delay_profile: Optional[str] = None,
+    mode: str = "full",
     db: Session = Depends(get_db)
 ):
-    """Inicia uma nova execução do scraper."""
+    """
+    Inicia uma nova execução do scraper em background.
+    Com mode=serp_only só as posições dos anúncios são registradas, sem
+    visitar os sites dos anunciantes.
+    Retorna imediatamente o ID da execução.
+    """
+    if delay_profile and delay_profile not in settings.DELAY_PROFILES:
+        raise HTTPException(status_code=400, detail=f"Unknown delay profile: {delay_profile}")
+    if mode not in settings.EXECUTION_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown execution mode: {mode}")
+    if workers is not None and not 1 <= workers <= settings.DRIVER_POOL_MAX_SIZE:
+        # Cada worker usa um Chrome; acima do limite do pool eles só esperariam
+        raise HTTPException(
+            status_code=400,
+            detail=f"workers must be between 1 and {settings.DRIVER_POOL_MAX_SIZE}"
+        )
+
     try:
-        manager = ScrapingManager(db)
-        execution = await manager.start_execution(headless)
-        await manager.run_scraping()
-        return {"message": "Execution started", "execution_id": execution.id}
+        execution_id = execution_engine.start(db, headless, workers, delay_profile, mode)
+        return {"message": "Execution started", "execution_id": execution_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -37,36 +65,142 @@ async def stop_execution(
     if not execution:
         raise HTTPException(status_code=404, detail="Execution not found")
     
+    if execution_engine.stop(execution_id):
+        return {"message": "Execution stop requested"}
+
+    if not execution.is_running:
+        raise HTTPException(status_code=400, detail="Execution is not running")
+
+    # Execução marcada como ativa mas sem job no engine (ex.: API reiniciada)
     try:
-        manager = ScrapingManager(db)
-        await manager.stop_execution()
+        execution.is_running = False
+        execution.status = "stopped"
+        execution.end_time = datetime.utcnow()
+        db.commit()
+        response_cache.invalidate()
+        event_bus.publish(execution_id, "execution_finished", status="stopped", error_message=None)
         return {"message": "Execution stopped successfully"}
     except Exception as e:
+        db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/status/{execution_id}")
 async def get_execution_status(
     execution_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Obtém o status de uma execução específica."""
-    execution = db.query(Execution).filter(Execution.id == execution_id).first()
+    execution = await db.get(Execution, execution_id)
     if not execution:
         raise HTTPException(status_code=404, detail="Execution not found")
     
-    return execution.to_dict()
+    result = execution.to_dict()
+    result["progress"] = await db.run_sync(execution_plan.progress, execution_id)
+    if execution.is_running:
+        # Resumo parcial, ainda em memória
+        result["metrics_summary"] = metrics.summary(execution_id)
+    return result
+
+@router.get("/events/{execution_id}")
+async def stream_execution_events(
+    execution_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream (Server-Sent Events) dos eventos de uma execução.
+    O primeiro evento é um snapshot com o status atual; o stream termina
+    com o evento execution_finished.
+    """
+    # Assinar antes do snapshot para não perder eventos entre os dois
+    subscription = event_bus.subscribe(execution_id)
+    try:
+        execution = await db.get(Execution, execution_id)
+        if not execution:
+            raise HTTPException(status_code=404, detail="Execution not found")
+        snapshot = execution.to_dict()
+    except Exception:
+        event_bus.unsubscribe(subscription)
+        raise
+    finally:
+        # Não segurar a conexão do banco enquanto o stream estiver aberto
+        await db.close()
+
+    async def stream():
+        try:
+            yield to_sse({
+                "id": 0,
+                "type": "snapshot",
+                "execution_id": execution_id,
+                "timestamp": datetime.utcnow().isoformat(),
+                "data": snapshot
+            })
+            if not snapshot["is_running"]:
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=settings.EVENT_STREAM_KEEPALIVE
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield to_sse(event)
+                if event["type"] == "execution_finished":
+                    break
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/active")
+async def list_active_executions():
+    """Lista as execuções em andamento no engine."""
+    return execution_engine.list_jobs()
+
+@router.get("/driver-pool")
+async def get_driver_pool_stats():
+    """Obtém a ocupação do pool de drivers e a latência de inicialização."""
+    return driver_pool.stats()
+
+EXECUTION_SORTS = {
+    "start_time": Execution.start_time
+}
 
 @router.get("/list")
 async def list_executions(
+    status: Optional[str] = None,
+    mode: Optional[str] = None,
+    sort: str = "-start_time",
+    cursor: Optional[str] = None,
     limit: int = 10,
-    offset: int = 0,
-    db: Session = Depends(get_db)
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Lista todas as execuções com paginação."""
-    executions = db.query(Execution)\
-        .order_by(Execution.start_time.desc())\
-        .offset(offset)\
-        .limit(limit)\
-        .all()
-    
-    return [execution.to_dict() for execution in executions]
\ No newline at end of file
+    """Lista as execuções, paginadas por cursor."""
+    statement = select(Execution)
+    if status:
+        statement = statement.where(Execution.status == status)
+    if mode:
+        statement = statement.where(Execution.execution_mode == mode)
+
+    return await paginate(
+        db,
+        statement,
+        sort,
+        EXECUTION_SORTS,
+        Execution.id,
+        cursor=cursor,
+        limit=limit,
+        include_total=include_total,
+        serialize=lambda execution: execution.to_dict()
+    )
@@ -0,0 +1,182 @@
+# backend/app/routers/exports.py
+
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from openpyxl import Workbook
+from sqlalchemy import Select, select
+from starlette.background import BackgroundTask
+from database import SessionLocal
+from clock import to_utc, utc_now
+from models import Search, Keyword, Competitor, CompetitorAppearance, Contact
+from config import settings
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["exports"]
+)
+
+def searches_export(start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[List[str], Select]:
+    """Pesquisas com a posição da Lidery."""
+    query = select(
+        Search.id,
+        Search.timestamp,
+        Search.execution_id,
+        Keyword.text,
+        Search.total_ads,
+        Search.lidery_position
+    ).join(Keyword, Keyword.id == Search.keyword_id)
+    if start_date:
+        query = query.where(Search.timestamp >= start_date)
+    if end_date:
+        query = query.where(Search.timestamp <= end_date)
+
+    headers = ["search_id", "timestamp", "execution_id", "keyword", "total_ads", "lidery_position"]
+    return headers, query.order_by(Search.id)
+
+def appearances_export(start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[List[str], Select]:
+    """Aparições de competidores por palavra-chave."""
+    query = select(
+        CompetitorAppearance.id,
+        Search.timestamp,
+        Search.id,
+        Keyword.text,
+        Competitor.domain,
+        Competitor.business_name,
+        CompetitorAppearance.position,
+        CompetitorAppearance.clicked
+    ).join(
+        Search, Search.id == CompetitorAppearance.search_id
+    ).join(
+        Keyword, Keyword.id == Search.keyword_id
+    ).join(
+        Competitor, Competitor.id == CompetitorAppearance.competitor_id
+    )
+    if start_date:
+        # A aparição é gravada depois da pesquisa; o filtro nela poda as partições (PostgreSQL)
+        query = query.where(Search.timestamp >= start_date, CompetitorAppearance.timestamp >= start_date)
+    if end_date:
+        query = query.where(Search.timestamp <= end_date)
+
+    headers = [
+        "appearance_id", "timestamp", "search_id", "keyword",
+        "domain", "business_name", "position", "clicked"
+    ]
+    return headers, query.order_by(CompetitorAppearance.id)
+
+def contacts_export(start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[List[str], Select]:
+    """Contatos encontrados nos sites dos competidores."""
+    query = select(
+        Contact.id,
+        Competitor.domain,
+        Competitor.business_name,
+        Contact.type,
+        Contact.value,
+        Contact.first_seen,
+        Contact.last_seen,
+        Contact.times_found
+    ).join(Competitor, Competitor.id == Contact.competitor_id)
+    if start_date:
+        query = query.where(Contact.first_seen >= start_date)
+    if end_date:
+        query = query.where(Contact.first_seen <= end_date)
+
+    headers = [
+        "contact_id", "domain", "business_name", "type",
+        "value", "first_seen", "last_seen", "times_found"
+    ]
+    return headers, query.order_by(Contact.id)
+
+EXPORTS = {
+    "searches": searches_export,
+    "appearances": appearances_export,
+    "contacts": contacts_export
+}
+
+def iter_rows(query: Select) -> Iterator[tuple]:
+    """
+    Percorre o resultado em lotes de EXPORT_CHUNK_SIZE com cursor no
+    servidor, sem carregar tudo em memória. A sessão vive só durante a
+    iteração, independente do ciclo de vida do request.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE))
+        for partition in result.partitions():
+            yield from partition
+    finally:
+        db.close()
+
+def csv_chunks(headers: List[str], query: Select) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # BOM para o Excel reconhecer UTF-8 (acentos das keywords)
+    buffer.write("\ufeff")
+    writer.writerow(headers)
+
+    for index, row in enumerate(iter_rows(query), start=1):
+        writer.writerow([value.isoformat() if isinstance(value, datetime) else value for value in row])
+        if index % settings.EXPORT_CHUNK_SIZE == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+def write_xlsx(dataset: str, headers: List[str], query: Select) -> str:
+    """Gera a planilha em modo write-only num arquivo temporário e retorna o caminho."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=dataset)
+    sheet.append(headers)
+    for row in iter_rows(query):
+        sheet.append(list(row))
+
+    handle, path = tempfile.mkstemp(suffix=".xlsx", dir=settings.DATA_DIR)
+    os.close(handle)
+    try:
+        workbook.save(path)
+    except Exception:
+        os.unlink(path)
+        raise
+    return path
+
+@router.get("/{dataset}")
+def export_dataset(
+    dataset: str,
+    format: str = "csv",
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    """
+    Exporta searches, appearances ou contacts em CSV (streaming) ou XLSX,
+    filtrando pelo período informado.
+    """
+    if dataset not in EXPORTS:
+        raise HTTPException(status_code=404, detail=f"Unknown export: {dataset}")
+    if format not in ("csv", "xlsx"):
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+
+    headers, query = EXPORTS[dataset](to_utc(start_date), to_utc(end_date))
+    filename = f"{dataset}_{utc_now().strftime('%Y%m%d_%H%M%S')}.{format}"
+
+    if format == "csv":
+        return StreamingResponse(
+            csv_chunks(headers, query),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+
+    # Endpoint síncrono: a planilha é gerada no threadpool, fora do event loop
+    path = write_xlsx(dataset, headers, query)
+    return FileResponse(
+        path,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        filename=filename,
+        background=BackgroundTask(os.unlink, path)
+    )
@@ -1,10 +1,14 @@
 # backend/app/routers/keywords.py
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from database import get_db
+from typing import List, Optional
+from database import get_async_db, get_db
 from models import Keyword
+from services.response_cache import response_cache
+from services.pagination import paginate
 from config import settings
 
 router = APIRouter(
@@ -12,11 +16,40 @@ router = APIRouter(
     tags=["keywords"]
 )
 
+KEYWORD_SORTS = {
+    "text": Keyword.text,
+    "created_at": Keyword.created_at,
+    "use_count": Keyword.use_count
+}
+
 @router.get("/")
-async def list_keywords(db: Session = Depends(get_db)):
-    """Lista todas as palavras-chave."""
-    keywords = db.query(Keyword).all()
-    return [keyword.to_dict() for keyword in keywords]
+async def list_keywords(
+    search: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    sort: str = "text",
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Lista as palavras-chave, paginadas por cursor."""
+    statement = select(Keyword)
+    if search:
+        statement = statement.where(Keyword.text.ilike(f"%{search.strip()}%"))
+    if is_active is not None:
+        statement = statement.where(Keyword.is_active == is_active)
+
+    return await paginate(
+        db,
+        statement,
+        sort,
+        KEYWORD_SORTS,
+        Keyword.id,
+        cursor=cursor,
+        limit=limit,
+        include_total=include_total,
+        serialize=lambda keyword: keyword.to_dict()
+    )
 
 @router.post("/")
 async def add_keywords(
@@ -59,6 +92,7 @@ async def delete_keyword(
     try:
         db.delete(keyword)
         db.commit()
+        response_cache.invalidate()
         return {"message": "Keyword deleted successfully"}
     except Exception as e:
         db.rollback()
@@ -1,70 +1,89 @@
 # backend/app/routers/performance.py
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, timedelta
-from sqlalchemy import func
-from database import get_db
-from models import Execution, Search, CompetitorAppearance, Competitor
+from sqlalchemy import func, select
+from database import get_async_db
+from clock import to_utc, utc_now
+from services.response_cache import CachedRoute
+from models import Execution, DailyKeywordStat, DailyLideryPosition
 
 router = APIRouter(
     prefix="/performance",
-    tags=["performance"]
+    tags=["performance"],
+    route_class=CachedRoute
 )
 
 @router.get("/daily-stats")
 async def get_daily_stats(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Obtém estatísticas diárias de desempenho."""
-    if not start_date:
-        start_date = datetime.now() - timedelta(days=30)
-    if not end_date:
-        end_date = datetime.now()
+    """Obtém estatísticas diárias de desempenho (dias em UTC, como os rollups)."""
+    start_date = to_utc(start_date) or utc_now() - timedelta(days=30)
+    end_date = to_utc(end_date) or utc_now()
 
-    stats = db.query(
+    # Pesquisas, cliques e Lidery vêm do rollup diário das keywords
+    stats = (await db.execute(select(
+        DailyKeywordStat.day,
+        func.sum(DailyKeywordStat.searches).label('total_searches'),
+        func.sum(DailyKeywordStat.clicks).label('total_clicks'),
+        func.sum(DailyKeywordStat.lidery_found).label('total_lidery')
+    ).where(
+        DailyKeywordStat.day.between(start_date.date(), end_date.date())
+    ).group_by(
+        DailyKeywordStat.day
+    ))).all()
+
+    executions = (await db.execute(select(
         func.date(Execution.start_time).label('date'),
-        func.count(Execution.id).label('total_executions'),
-        func.sum(Execution.total_searches).label('total_searches'),
-        func.sum(Execution.total_clicks).label('total_clicks'),
-        func.sum(Execution.total_lidery_found).label('total_lidery')
-    ).filter(
+        func.count(Execution.id).label('total_executions')
+    ).where(
         Execution.start_time.between(start_date, end_date)
     ).group_by(
         func.date(Execution.start_time)
-    ).all()
+    ))).all()
 
-    return [
-        {
-            "date": stat.date.isoformat(),
-            "total_executions": stat.total_executions,
+    # SQLite devolve as datas como texto
+    days = {
+        str(stat.day): {
+            "date": str(stat.day),
+            "total_executions": 0,
             "total_searches": stat.total_searches or 0,
             "total_clicks": stat.total_clicks or 0,
             "total_lidery": stat.total_lidery or 0
         }
         for stat in stats
-    ]
+    }
+    for execution in executions:
+        days.setdefault(str(execution.date), {
+            "date": str(execution.date),
+            "total_searches": 0,
+            "total_clicks": 0,
+            "total_lidery": 0
+        })["total_executions"] = execution.total_executions
+
+    return [days[date] for date in sorted(days)]
 
 @router.get("/lidery-positions")
 async def get_lidery_positions(
     days: int = 30,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Obtém estatísticas de posicionamento da Lidery."""
-    start_date = datetime.now() - timedelta(days=days)
+    start_date = utc_now() - timedelta(days=days)
     
-    positions = db.query(
-        Search.lidery_position,
-        func.count(Search.id).label('count')
-    ).filter(
-        Search.timestamp >= start_date,
-        Search.lidery_position.isnot(None)
+    positions = (await db.execute(select(
+        DailyLideryPosition.position.label('lidery_position'),
+        func.sum(DailyLideryPosition.count).label('count')
+    ).where(
+        DailyLideryPosition.day >= start_date.date()
     ).group_by(
-        Search.lidery_position
-    ).all()
+        DailyLideryPosition.position
+    ))).all()
 
     return [
         {
@@ -77,28 +96,29 @@ async def get_lidery_positions(
 
 @router.get("/execution-calendar")
 async def get_execution_calendar(
-    year: int = datetime.now().year,
+    year: Optional[int] = None,
     month: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Obtém dados de execução para visualização em calendário."""
-    query = db.query(
+    """Obtém dados de execução para visualização em calendário (ano corrente por padrão)."""
+    year = year or utc_now().year
+    statement = select(
         func.date(Execution.start_time).label('date'),
         func.count(Execution.id).label('executions')
-    ).filter(
+    ).where(
         func.extract('year', Execution.start_time) == year
     )
 
     if month:
-        query = query.filter(func.extract('month', Execution.start_time) == month)
+        statement = statement.where(func.extract('month', Execution.start_time) == month)
 
-    data = query.group_by(
+    data = (await db.execute(statement.group_by(
         func.date(Execution.start_time)
-    ).all()
+    ))).all()
 
     return [
         {
-            "date": date.date.isoformat(),
+            "date": str(date.date),
             "executions": date.executions
         }
         for date in data
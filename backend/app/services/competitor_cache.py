@@ -0,0 +1,134 @@
+# backend/app/services/competitor_cache.py
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import DateTime, String, bindparam, func, update
+from sqlalchemy.orm import Session
+from database import dialect_insert
+from models import Competitor
+from services.rollups import UPSERT_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+class CompetitorCache:
+    """
+    Cache de domínio -> ID de competidor compartilhado pelo processo.
+
+    É aquecido a partir da tabela competitors no início de cada execução
+    e mantido atualizado pelos upserts, que usam ON CONFLICT(domain) em
+    vez de ler e depois gravar, evitando corrida entre workers.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def warm(self, db: Session) -> int:
+        """Carrega todos os domínios conhecidos. Retorna o total em cache."""
+        rows = db.query(Competitor.domain, Competitor.id).all()
+        with self._lock:
+            self._ids.update({domain: competitor_id for domain, competitor_id in rows})
+            total = len(self._ids)
+        logger.info(f"Competitor cache warmed with {total} domains")
+        return total
+
+    def get(self, domain: str) -> Optional[int]:
+        with self._lock:
+            return self._ids.get(domain)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+    def upsert(self, db: Session, sightings: Dict[str, Dict]) -> Dict[str, int]:
+        """
+        Cria ou atualiza os competidores vistos num lote.
+
+        sightings mapeia domínio -> {"business_name", "appearances", "seen_at",
+        "visited_at"}. O ID dos domínios já em cache vem do dicionário, e
+        os contadores deles são atualizados por ID num único executemany;
+        só os domínios desconhecidos passam pelo INSERT ... ON CONFLICT
+        com RETURNING. Competidores novos já começam com o total de
+        aparições do lote; last_visited só avança. Os dois comandos vão em
+        blocos de UPSERT_CHUNK_SIZE.
+        Retorna o ID de cada domínio; o cache só é atualizado via remember().
+        """
+        if not sightings:
+            return {}
+
+        with self._lock:
+            ids = {domain: self._ids[domain] for domain in sightings if domain in self._ids}
+        unknown = [domain for domain in sightings if domain not in ids]
+
+        table = Competitor.__table__
+        # max() escalar no SQLite equivale ao greatest() do PostgreSQL
+        latest = func.max if db.get_bind().dialect.name == "sqlite" else func.greatest
+
+        if ids:
+            statement = update(table).where(table.c.id == bindparam("b_competitor_id")).values(
+                total_appearances=table.c.total_appearances + bindparam("b_appearances"),
+                last_seen=latest(
+                    func.coalesce(table.c.last_seen, bindparam("b_seen_at", type_=DateTime)),
+                    bindparam("b_seen_at", type_=DateTime)
+                ),
+                business_name=func.coalesce(table.c.business_name, bindparam("b_business_name", type_=String)),
+                last_visited=latest(
+                    func.coalesce(table.c.last_visited, bindparam("b_visited_at", type_=DateTime)),
+                    func.coalesce(bindparam("b_visited_at", type_=DateTime), table.c.last_visited)
+                )
+            )
+            params = [
+                {
+                    "b_competitor_id": competitor_id,
+                    "b_appearances": sightings[domain].get("appearances", 0),
+                    "b_seen_at": sightings[domain].get("seen_at") or datetime.utcnow(),
+                    "b_business_name": sightings[domain].get("business_name") or None,
+                    "b_visited_at": sightings[domain].get("visited_at")
+                }
+                for domain, competitor_id in ids.items()
+            ]
+            for start in range(0, len(params), UPSERT_CHUNK_SIZE):
+                db.execute(statement, params[start:start + UPSERT_CHUNK_SIZE])
+
+        rows = [
+            {
+                "domain": domain,
+                "business_name": sightings[domain].get("business_name") or None,
+                "first_seen": sightings[domain].get("seen_at") or datetime.utcnow(),
+                "last_seen": sightings[domain].get("seen_at") or datetime.utcnow(),
+                "total_appearances": sightings[domain].get("appearances", 0),
+                "last_visited": sightings[domain].get("visited_at")
+            }
+            for domain in unknown
+        ]
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            statement = dialect_insert(db, table).values(rows[start:start + UPSERT_CHUNK_SIZE])
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.domain],
+                set_={
+                    "total_appearances": table.c.total_appearances + excluded.total_appearances,
+                    "last_seen": latest(
+                        func.coalesce(table.c.last_seen, excluded.last_seen),
+                        excluded.last_seen
+                    ),
+                    "business_name": func.coalesce(table.c.business_name, excluded.business_name),
+                    "last_visited": latest(
+                        func.coalesce(table.c.last_visited, excluded.last_visited),
+                        func.coalesce(excluded.last_visited, table.c.last_visited)
+                    )
+                }
+            ).returning(table.c.domain, table.c.id)
+            ids.update({domain: competitor_id for domain, competitor_id in db.execute(statement)})
+
+        return ids
+
+    def remember(self, ids: Dict[str, int]) -> None:
+        """Guarda IDs já confirmados no banco (chamar após o commit)."""
+        with self._lock:
+            self._ids.update(ids)
+
+# Instância global do cache de competidores
+competitor_cache = CompetitorCache()
@@ -0,0 +1,262 @@
+# backend/app/services/contact_extractor.py
+
+import re
+from typing import Dict, List, Optional
+from config import settings
+
+# Uma única expressão com todas as alternativas, percorrida uma vez sobre o HTML.
+# As tags de script entram no mesmo passe para sabermos quando um número está
+# dentro de código (JSON, analytics) e não no conteúdo da página.
+#
+# Cada alternativa começa por um caractere fixo ("<", "w", "t", "@") ou, nos
+# telefones, por "(", "+" ou dígito seguido de um lookbehind barato; assim o
+# sre descarta rápido as posições que não interessam. Sem IGNORECASE, que
+# desliga essas otimizações: links de contato são escritos em minúsculas.
+# Pelo mesmo motivo o grupo phone só abre depois do primeiro caractere, e o
+# número completo é lido de match.group(0).
+# O email é ancorado no "@" e a parte local é lida para trás (LOCAL_PART).
+# Números com "+" que não seguem o formato brasileiro caem na alternativa
+# intl, depois de phone: código do país e blocos de dígitos com separadores.
+CONTACT_PATTERN = re.compile(
+    r"""
+    <(?P<script_open>script\b)
+    | <(?P<script_close>/script\s*>)
+    | wa\.me/(?:%2[bB]|\+)?(?P<wa_me>\d{8,15})
+    | whatsapp(?:\.com/send/?\?(?:[^"'\s<>]*?[&;])?|://send/?\?)phone=
+      (?:%2[bB]|\+)?(?P<whatsapp>\d{8,15})
+    | tel:(?P<tel>(?:%2[bB]|\+)?(?:[\d().\-\s]|%20){8,25})
+    | @(?P<email_domain>[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,24})
+    | [(+1-9](?<![\w+].)
+      (?P<phone>(?:0?[1-9]{2}\)|55[\s.-]?[1-9]{2}|[1-9])[\s.-]?9?\d{4}[\s.-]\d{4})(?!\d)
+    | \+(?<![\w+]\+)
+      (?P<intl>[1-9]\d{0,2}(?:[\s.-]?(?:\(\d{1,4}\)|\d{1,5})){2,6})(?!\d)
+    """,
+    re.VERBOSE
+)
+LOCAL_PART = re.compile(r"[\w.%+-]{1,64}$")
+
+# Extensões que aparecem como "domínio" em nomes de arquivo com @ (logo@2x.png)
+NON_EMAIL_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".css", ".js")
+
+# Pontuação base de cada origem
+SOURCE_SCORES = {
+    "whatsapp_link": 1.0,
+    "tel_link": 0.9,
+    "mailto": 0.9,
+    "email_text": 0.6,
+    "phone_text": 0.5
+}
+WHATSAPP_HINT_BONUS = 0.2
+SCRIPT_PENALTY = 0.3
+
+# Roda no navegador (execute_script) e devolve só os trechos candidatos, em vez
+# de trafegar o page_source inteiro pelo WebDriver: os links tel:/mailto:/WhatsApp,
+# com o texto ao redor como contexto, e as linhas do texto visível (innerText,
+# sem scripts nem elementos ocultos) que têm cara de telefone ou email.
+# Argumentos: caracteres de contexto e máximo de candidatos.
+IN_PAGE_SCRIPT = r"""
+const maxContext = arguments[0];
+const maxCandidates = arguments[1];
+const candidates = [];
+const squash = (text) => (text || '').replace(/\s+/g, ' ').trim();
+
+const contactHref = /^(tel:|mailto:)|wa\.me\/|whatsapp/i;
+for (const anchor of document.querySelectorAll('a[href]')) {
+  const href = anchor.getAttribute('href') || '';
+  if (!contactHref.test(href)) continue;
+  const parent = anchor.parentElement;
+  const context = squash([
+    anchor.className,
+    anchor.getAttribute('aria-label'),
+    anchor.getAttribute('title'),
+    parent ? parent.textContent : anchor.textContent
+  ].join(' '));
+  candidates.push({source: 'link', text: href, context: context.slice(0, maxContext)});
+  if (candidates.length >= maxCandidates) return candidates;
+}
+
+const lines = document.body ? document.body.innerText.split('\n') : [];
+const looksLikeContact = /\d{4}[\s.-]?\d{4}|@|\+\d/;
+for (let i = 0; i < lines.length; i++) {
+  if (!looksLikeContact.test(lines[i])) continue;
+  const context = squash(lines.slice(Math.max(0, i - 2), i).join(' '));
+  candidates.push({source: 'text', text: lines[i].slice(0, 500), context: context.slice(-maxContext)});
+  if (candidates.length >= maxCandidates) break;
+}
+return candidates;
+"""
+
+def normalize_phone(raw: str) -> Optional[str]:
+    """
+    Normaliza um telefone para E.164. Números com 10 ou 11 dígitos (DDD +
+    número, com ou sem o 0 de operadora) são tratados como brasileiros.
+    Com "+" explícito, números de outros países são aceitos como estão
+    (8 a 15 dígitos), sem validação do plano de numeração do país.
+    Retorna None se o número não for plausível.
+    """
+    explicit = raw.lstrip().startswith("+") or raw.lower().startswith("%2b")
+    digits = re.sub(r"\D", "", raw.replace("%2B", "").replace("%2b", "").replace("%20", ""))
+    if digits.startswith("0") and not explicit:
+        digits = digits.lstrip("0")
+
+    if len(digits) in (12, 13) and digits.startswith("55"):
+        national = digits[2:]
+    elif explicit:
+        # Número internacional explícito
+        return f"+{digits}" if 8 <= len(digits) <= 15 and digits[0] != "0" else None
+    elif len(digits) in (10, 11):
+        national = digits
+    else:
+        return None
+
+    ddd, number = national[:2], national[2:]
+    if "0" in ddd:
+        return None
+    # Celulares têm 9 dígitos começando com 9; fixos têm 8 começando com 2-5
+    if len(number) == 9 and number[0] != "9":
+        return None
+    if len(number) == 8 and number[0] not in "2345":
+        return None
+    return f"+55{national}"
+
+def is_mobile(e164: str) -> bool:
+    return e164.startswith("+55") and len(e164) == 14
+
+class ContactExtractor:
+    """
+    Extrai WhatsApp, telefones e emails do HTML de um anunciante em um
+    único passe de CONTACT_PATTERN.
+
+    Cada contato é normalizado (E.164 para telefones) e pontuado pela
+    origem: links wa.me/api.whatsapp valem mais que tel:/mailto:, que
+    valem mais que números soltos no texto. Uma menção a WhatsApp perto
+    do número aumenta a pontuação (e o classifica como WhatsApp, se for
+    celular); ocorrências dentro de <script> são penalizadas.
+
+    Sem "+", números soltos só são reconhecidos no formato brasileiro;
+    números de outros países precisam do código do país com "+" (no texto
+    ou em tel:) ou de um link de WhatsApp. A classificação como WhatsApp
+    por menção próxima vale só para celulares brasileiros.
+    """
+
+    def __init__(
+        self,
+        min_score: float = settings.CONTACT_MIN_SCORE,
+        context_chars: int = settings.CONTACT_CONTEXT_CHARS,
+        whatsapp_hints: List[str] = settings.WHATSAPP_PATTERNS
+    ):
+        self.min_score = min_score
+        self.context_chars = context_chars
+        self.whatsapp_hints = [hint.lower() for hint in whatsapp_hints]
+
+    def extract(self, html: str) -> List[Dict]:
+        """
+        Retorna os contatos encontrados, sem repetição, do maior para o
+        menor score: [{"type", "value", "score", "source"}].
+        """
+        found: Dict[tuple, Dict] = {}
+        self._scan(html, found)
+        return self._ranked(found)
+
+    def extract_candidates(self, candidates: List[Dict]) -> List[Dict]:
+        """
+        Mesmo resultado de extract(), a partir dos candidatos devolvidos por
+        IN_PAGE_SCRIPT ([{"source", "text", "context"}]). O contexto vem antes
+        do trecho, para a menção a WhatsApp ser encontrada como no HTML.
+        """
+        found: Dict[tuple, Dict] = {}
+        for candidate in candidates:
+            text = candidate.get("text") or ""
+            context = candidate.get("context") or ""
+            self._scan(f"{context}\n{text}" if context else text, found)
+        return self._ranked(found)
+
+    def _ranked(self, found: Dict[tuple, Dict]) -> List[Dict]:
+        """Ordena por score; um número já reconhecido como WhatsApp não se repete como telefone."""
+        whatsapp = {value for contact_type, value in found if contact_type == "whatsapp"}
+        contacts = [
+            contact for (contact_type, value), contact in found.items()
+            if not (contact_type == "phone" and value in whatsapp)
+        ]
+        return sorted(contacts, key=lambda contact: contact["score"], reverse=True)
+
+    def _scan(self, html: str, found: Dict[tuple, Dict]) -> None:
+        """Percorre o texto com CONTACT_PATTERN, guardando em found o maior score de cada contato."""
+        in_script = False
+
+        for match in CONTACT_PATTERN.finditer(html):
+            kind = match.lastgroup
+            if kind == "script_open":
+                in_script = True
+                continue
+            if kind == "script_close":
+                in_script = False
+                continue
+
+            contact = self._classify(html, match, kind)
+            if contact is None:
+                continue
+
+            if in_script:
+                contact["score"] -= SCRIPT_PENALTY
+            contact["score"] = round(max(0.0, min(1.0, contact["score"])), 2)
+            if contact["score"] < self.min_score:
+                continue
+
+            key = (contact["type"], contact["value"])
+            if key not in found or found[key]["score"] < contact["score"]:
+                found[key] = contact
+
+    def _classify(self, html: str, match: "re.Match", kind: str) -> Optional[Dict]:
+        if kind in ("wa_me", "whatsapp"):
+            number = match.group(kind)
+            value = normalize_phone(number) or f"+{number}"
+            return self._contact("whatsapp", value, "whatsapp_link")
+
+        if kind == "tel":
+            value = normalize_phone(match.group("tel").strip())
+            if value is None:
+                return None
+            if is_mobile(value) and self._near_whatsapp_hint(html, match):
+                return self._contact("whatsapp", value, "tel_link", WHATSAPP_HINT_BONUS)
+            return self._contact("phone", value, "tel_link")
+
+        if kind == "email_domain":
+            domain = match.group("email_domain").lower().rstrip(".")
+            if domain.endswith(NON_EMAIL_SUFFIXES):
+                return None
+            before = html[max(0, match.start() - 64):match.start()]
+            local = LOCAL_PART.search(before)
+            if local is None:
+                return None
+            local_start = match.start() - len(local.group(0))
+            mailto = html[max(0, local_start - 7):local_start].lower() == "mailto:"
+            value = f"{local.group(0).lower()}@{domain}"
+            return self._contact("email", value, "mailto" if mailto else "email_text")
+
+        if kind in ("phone", "intl"):
+            value = normalize_phone(match.group(0))
+            if value is None:
+                return None
+            if is_mobile(value) and self._near_whatsapp_hint(html, match):
+                return self._contact("whatsapp", value, "phone_text", WHATSAPP_HINT_BONUS)
+            return self._contact("phone", value, "phone_text")
+
+        return None
+
+    def _contact(self, contact_type: str, value: str, source: str, bonus: float = 0.0) -> Dict:
+        return {
+            "type": contact_type,
+            "value": value,
+            "score": SOURCE_SCORES[source] + bonus,
+            "source": source
+        }
+
+    def _near_whatsapp_hint(self, html: str, match: "re.Match") -> bool:
+        """Procura menções a WhatsApp no elemento ao redor (texto, classe ou link)."""
+        start = max(0, match.start() - self.context_chars)
+        window = html[start:match.end() + self.context_chars // 2].lower()
+        return any(hint in window for hint in self.whatsapp_hints)
+
+# Instância global do extrator de contatos
+contact_extractor = ContactExtractor()
@@ -0,0 +1,115 @@
+# backend/app/services/contact_store.py
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Tuple
+from sqlalchemy import case
+from sqlalchemy.orm import Session
+from database import dialect_insert
+from services.contact_extractor import normalize_phone
+from services.rollups import UPSERT_CHUNK_SIZE
+from models import Contact
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+def normalize_contact(contact_type: str, value: str) -> Tuple[str, str]:
+    """Chave normalizada do contato: telefones em E.164, emails em minúsculas."""
+    contact_type = (contact_type or "").strip().lower()
+    value = (value or "").strip()
+    if contact_type in ("whatsapp", "phone"):
+        value = normalize_phone(value) or value
+    elif contact_type == "email":
+        value = value.lower()
+    return contact_type, value
+
+class ContactStore:
+    """
+    Contatos únicos por (competitor_id, type, value).
+
+    As gravações são upserts em lote (ON CONFLICT no índice único) que
+    somam times_found e avançam last_seen, então a tabela cresce com os
+    contatos distintos e não com as visitas. Um cache LRU por execução
+    guarda os contatos vistos recentemente, para o scraper saber se um
+    contato é novo na execução sem consultar o banco.
+    """
+
+    def __init__(self, recent_size: int = settings.CONTACT_RECENT_CACHE_SIZE):
+        self.recent_size = recent_size
+        self._recent: Dict[int, "OrderedDict[Tuple, None]"] = {}
+        self._lock = threading.Lock()
+
+    def seen(self, execution_id: int, domain: str, contact_type: str, value: str) -> bool:
+        """
+        Registra o contato no cache da execução.
+        Retorna True se ele já tinha sido visto recentemente nela.
+        """
+        key = (domain, *normalize_contact(contact_type, value))
+        with self._lock:
+            recent = self._recent.setdefault(execution_id, OrderedDict())
+            if key in recent:
+                recent.move_to_end(key)
+                return True
+            recent[key] = None
+            while len(recent) > self.recent_size:
+                recent.popitem(last=False)
+            return False
+
+    def forget(self, execution_id: int) -> None:
+        """Descarta o cache da execução (chamar quando ela termina)."""
+        with self._lock:
+            self._recent.pop(execution_id, None)
+
+    def upsert(self, db: Session, contacts: List[Dict]) -> int:
+        """
+        Grava os contatos do lote na transação corrente.
+
+        contacts é uma lista de {"competitor_id", "type", "value", "seen_at"};
+        repetições no lote são somadas antes do comando. Retorna quantos
+        contatos distintos foram gravados.
+        """
+        rows: Dict[Tuple, Dict] = {}
+        for contact in contacts:
+            contact_type, value = normalize_contact(contact["type"], contact["value"])
+            if not value:
+                continue
+            key = (contact["competitor_id"], contact_type, value)
+            seen_at = contact.get("seen_at") or datetime.utcnow()
+            row = rows.get(key)
+            if row is None:
+                rows[key] = {
+                    "competitor_id": key[0],
+                    "type": contact_type,
+                    "value": value,
+                    "first_seen": seen_at,
+                    "last_seen": seen_at,
+                    "times_found": 1
+                }
+            else:
+                row["first_seen"] = min(row["first_seen"], seen_at)
+                row["last_seen"] = max(row["last_seen"], seen_at)
+                row["times_found"] += 1
+
+        table = Contact.__table__
+        values = list(rows.values())
+        for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+            statement = dialect_insert(db, table).values(values[start:start + UPSERT_CHUNK_SIZE])
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.competitor_id, table.c.type, table.c.value],
+                set_={
+                    "times_found": table.c.times_found + excluded.times_found,
+                    "last_seen": case(
+                        (table.c.last_seen > excluded.last_seen, table.c.last_seen),
+                        else_=excluded.last_seen
+                    )
+                }
+            )
+            db.execute(statement)
+
+        return len(values)
+
+# Instância global do armazenamento de contatos
+contact_store = ContactStore()
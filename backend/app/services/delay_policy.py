@@ -0,0 +1,65 @@
+# backend/app/services/delay_policy.py
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Optional
+from config import settings
+
+class DelayPolicy:
+    """
+    Atrasos deliberados do scraper, definidos por perfis nomeados
+    em settings.DELAY_PROFILES (humanlike, reduced, zero).
+
+    Os atrasos são aguardados com asyncio.sleep, em fatias curtas para
+    responder rapidamente ao cancelamento da execução, e o tempo gasto
+    é acumulado para separar espera deliberada de trabalho real.
+    """
+
+    SLICE_SECONDS = 0.25
+
+    def __init__(
+        self,
+        profile: str = settings.DELAY_PROFILE,
+        stop_event: Optional[threading.Event] = None
+    ):
+        if profile not in settings.DELAY_PROFILES:
+            raise ValueError(f"Unknown delay profile: {profile}")
+
+        self.profile = profile
+        self.ranges = settings.DELAY_PROFILES[profile]
+        self.stop_event = stop_event or threading.Event()
+        self.total_seconds = 0.0
+        self.by_name: Dict[str, float] = {}
+
+    def duration(self, name: str) -> float:
+        """Sorteia a duração do atraso; atrasos ausentes no perfil valem zero."""
+        bounds = self.ranges.get(name)
+        if not bounds:
+            return 0.0
+        return random.uniform(bounds["MIN"], bounds["MAX"])
+
+    async def sleep(self, name: str) -> float:
+        """Aguarda o atraso sem bloquear o event loop e retorna o tempo gasto."""
+        remaining = self.duration(name)
+        if remaining <= 0:
+            return 0.0
+
+        started = time.monotonic()
+        while remaining > 0 and not self.stop_event.is_set():
+            step = min(self.SLICE_SECONDS, remaining)
+            await asyncio.sleep(step)
+            remaining -= step
+
+        elapsed = time.monotonic() - started
+        self.total_seconds += elapsed
+        self.by_name[name] = self.by_name.get(name, 0.0) + elapsed
+        return elapsed
+
+    def reset(self) -> float:
+        """Retorna o total acumulado desde a última chamada e zera os contadores."""
+        total = self.total_seconds
+        self.total_seconds = 0.0
+        self.by_name = {}
+        return total
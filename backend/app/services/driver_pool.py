@@ -0,0 +1,354 @@
+# backend/app/services/driver_pool.py
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from services.metrics import metrics
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+def page_origin(url: str) -> Optional[str]:
+    """Origem (esquema://host[:porta]) de uma página web; None para about:, data: etc."""
+    parsed = urlparse(url or "")
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+class PooledDriver:
+    """Driver do Chrome mantido pelo pool, com seus dados de uso."""
+
+    def __init__(self, driver: webdriver.Chrome, headless: bool, startup_seconds: float):
+        self.driver = driver
+        self.headless = headless
+        self.startup_seconds = startup_seconds
+        self.created_at = time.monotonic()
+        self.uses = 0
+        self.origins: Set[str] = set()  # Origens visitadas desde a última limpeza
+
+class DriverPool:
+    """
+    Pool de drivers do Chrome de longa duração.
+
+    Os drivers são pré-aquecidos, verificados antes de cada entrega,
+    limpos entre usos e reciclados após um número máximo de pesquisas
+    ou quando o heap JS da página passa do limite configurado. No
+    máximo max_size Chromes ficam abertos ao mesmo tempo (ociosos ou em
+    uso); acima disso acquire() espera um driver ser devolvido.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = settings.DRIVER_POOL_MAX_IDLE,
+        max_uses: int = settings.DRIVER_MAX_USES,
+        max_js_heap_mb: float = settings.DRIVER_MAX_JS_HEAP_MB,
+        max_size: int = settings.DRIVER_POOL_MAX_SIZE,
+        acquire_timeout: float = settings.DRIVER_POOL_ACQUIRE_TIMEOUT
+    ):
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self.max_js_heap_mb = max_js_heap_mb
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self._idle: Dict[bool, List[PooledDriver]] = {True: [], False: []}
+        self._in_use: Dict[int, PooledDriver] = {}
+        self._alive = 0  # Drivers abertos ou sendo iniciados
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+        self._counters = {
+            "created": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+            "startup_seconds_total": 0.0,
+            "last_startup_seconds": 0.0
+        }
+        metrics.active_drivers.set_function(lambda: len(self._in_use))
+        metrics.idle_drivers.set_function(lambda: len(self._idle[True]) + len(self._idle[False]))
+
+    def create_driver(self, headless: bool = False) -> webdriver.Chrome:
+        """Configura o driver do Chrome com as opções necessárias."""
+        chrome_options = Options()
+
+        # Configuração de emulação mobile
+        mobile_emulation = {
+            "deviceName": "iPhone X"
+        }
+        chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
+
+        # Modo incognito e headless (se solicitado)
+        chrome_options.add_argument("--incognito")
+        if headless:
+            chrome_options.add_argument("--headless")
+
+        # Outras configurações úteis
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument(f"user-agent={settings.USER_AGENT}")
+
+        # Sinais de carregamento acompanhados pelo PageReadiness
+        chrome_options.page_load_strategy = settings.PAGE_LOAD_STRATEGY
+
+        # Log de performance usado na contabilização de recursos bloqueados e na rede ociosa
+        if settings.RESOURCE_BLOCKING_ENABLED or settings.READINESS_NETWORK_IDLE:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(settings.PAGE_LOAD_TIMEOUT)
+        return driver
+
+    def _spawn(self, headless: bool) -> PooledDriver:
+        """Inicia um driver numa vaga já reservada em _alive."""
+        started = time.monotonic()
+        try:
+            driver = self.create_driver(headless)
+        except Exception:
+            self._free_slot()
+            raise
+        startup_seconds = time.monotonic() - started
+        metrics.observe("driver_startup", startup_seconds)
+
+        with self._lock:
+            self._counters["created"] += 1
+            self._counters["startup_seconds_total"] += startup_seconds
+            self._counters["last_startup_seconds"] = startup_seconds
+
+        logger.info(f"Chrome driver started in {startup_seconds:.2f}s")
+        return PooledDriver(driver, headless, startup_seconds)
+
+    def warm_up(self, headless: bool = True, count: int = settings.DRIVER_POOL_PREWARM) -> None:
+        """
+        Inicia drivers antecipadamente até haver `count` disponíveis, sem
+        passar do tamanho máximo do pool. O padrão é headless: o pré-aquecimento
+        não deve abrir janelas do Chrome; drivers visíveis são criados sob demanda.
+        """
+        while not self._closed:
+            with self._lock:
+                if len(self._idle[headless]) >= min(count, self.max_idle) or self._alive >= self.max_size:
+                    return
+                self._alive += 1
+            try:
+                pooled = self._spawn(headless)
+            except Exception as e:
+                logger.error(f"Error warming up driver pool: {str(e)}")
+                return
+            self._return_to_idle(pooled)
+
+    def acquire(self, headless: bool = False) -> webdriver.Chrome:
+        """
+        Entrega um driver saudável, reaproveitando um ocioso quando possível.
+        Com o pool cheio, espera até acquire_timeout segundos por uma vaga.
+        """
+        while True:
+            pooled = self._take_idle_or_slot(headless)
+            if pooled is None:
+                pooled = self._spawn(headless)
+            elif not self._is_healthy(pooled.driver):
+                logger.warning("Discarding unhealthy pooled driver")
+                with self._lock:
+                    self._counters["unhealthy"] += 1
+                self._quit(pooled)
+                continue
+
+            with self._lock:
+                self._in_use[id(pooled.driver)] = pooled
+            return pooled.driver
+
+    def _take_idle_or_slot(self, headless: bool) -> Optional[PooledDriver]:
+        """Retira um driver ocioso do modo pedido ou reserva a vaga para um novo (None)."""
+        deadline = time.monotonic() + self.acquire_timeout
+        evicted = None
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+                if self._idle[headless]:
+                    return self._idle[headless].pop()
+                if self._alive < self.max_size:
+                    self._alive += 1
+                    return None
+                if self._idle[not headless]:
+                    # Pool cheio com drivers ociosos do outro modo: troca um deles
+                    evicted = self._idle[not headless].pop()
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No Chrome driver available after {self.acquire_timeout:.0f}s "
+                        f"(pool limit {self.max_size})"
+                    )
+                self._available.wait(remaining)
+
+        # A vaga do driver descartado passa direto para o novo
+        self._close_driver(evicted.driver)
+        return None
+
+    def release(self, driver: webdriver.Chrome, broken: bool = False) -> None:
+        """Devolve um driver ao pool, limpando seu estado ou reciclando-o."""
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+
+        if pooled is None:
+            # Driver que não pertence ao pool
+            self._close_driver(driver)
+            return
+
+        pooled.uses += 1
+
+        if broken or self._closed or self._should_recycle(pooled) or not self._reset(pooled):
+            with self._lock:
+                self._counters["recycled"] += 1
+            self._quit(pooled)
+            self._replenish(pooled.headless)
+            return
+
+        self._return_to_idle(pooled)
+
+    def _return_to_idle(self, pooled: PooledDriver) -> None:
+        with self._available:
+            if not self._closed and len(self._idle[pooled.headless]) < self.max_idle:
+                self._idle[pooled.headless].append(pooled)
+                self._available.notify()
+                return
+        self._quit(pooled)
+
+    def _free_slot(self) -> None:
+        with self._available:
+            self._alive -= 1
+            self._available.notify()
+
+    def _replenish(self, headless: bool) -> None:
+        """Repõe drivers pré-aquecidos em background após uma reciclagem."""
+        if settings.DRIVER_POOL_PREWARM <= 0 or self._closed:
+            return
+        threading.Thread(
+            target=self.warm_up,
+            args=(headless,),
+            name="driver-pool-warmup",
+            daemon=True
+        ).start()
+
+    def _should_recycle(self, pooled: PooledDriver) -> bool:
+        if pooled.uses >= self.max_uses:
+            logger.info(f"Recycling driver after {pooled.uses} uses")
+            return True
+
+        js_heap_mb = self._js_heap_mb(pooled.driver)
+        if js_heap_mb is not None and js_heap_mb > self.max_js_heap_mb:
+            logger.info(f"Recycling driver using {js_heap_mb:.0f}MB of JS heap")
+            return True
+
+        return False
+
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        """Verificação barata: o driver responde a um script trivial."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _js_heap_mb(self, driver: webdriver.Chrome) -> Optional[float]:
+        """
+        Heap JS alocado pela página atual (JSHeapTotalSize). Não é a memória
+        do processo do Chrome, mas cresce com o vazamento entre usos.
+        """
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})
+            for metric in metrics.get("metrics", []):
+                if metric["name"] == "JSHeapTotalSize":
+                    return metric["value"] / (1024 * 1024)
+        except Exception:
+            pass
+        return None
+
+    def record_visit(self, driver: webdriver.Chrome, url: Optional[str]) -> None:
+        """
+        Anota a origem de uma página aberta pelo driver emprestado, para que
+        o storage dela seja limpo na devolução mesmo que a aba já tenha fechado.
+        """
+        origin = page_origin(url)
+        if origin is None:
+            return
+        with self._lock:
+            pooled = self._in_use.get(id(driver))
+            if pooled is not None:
+                pooled.origins.add(origin)
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """Fecha abas extras e limpa cookies, cache e storage do driver."""
+        driver = pooled.driver
+        try:
+            handles = driver.window_handles
+            origins = set(pooled.origins)
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                origins.add(page_origin(driver.current_url))
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            # Storage.clearDataForOrigin não aceita curinga: limpa cada origem
+            # visitada no empréstimo e as das abas ainda abertas
+            for origin in origins - {None}:
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"}
+                )
+            driver.get("about:blank")
+            pooled.origins.clear()
+            return True
+        except Exception as e:
+            logger.warning(f"Error resetting pooled driver: {str(e)}")
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        self._close_driver(pooled.driver)
+        self._free_slot()
+
+    def _close_driver(self, driver: webdriver.Chrome) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def stats(self) -> Dict:
+        """Ocupação do pool e latência de inicialização dos drivers."""
+        with self._lock:
+            created = self._counters["created"]
+            return {
+                "idle": len(self._idle[True]) + len(self._idle[False]),
+                "idle_headless": len(self._idle[True]),
+                "idle_visible": len(self._idle[False]),
+                "in_use": len(self._in_use),
+                "max_size": self.max_size,
+                "created": created,
+                "recycled": self._counters["recycled"],
+                "unhealthy": self._counters["unhealthy"],
+                "avg_startup_seconds": (
+                    self._counters["startup_seconds_total"] / created if created else 0.0
+                ),
+                "last_startup_seconds": self._counters["last_startup_seconds"]
+            }
+
+    def shutdown(self) -> None:
+        """Encerra todos os drivers ociosos e impede novos retornos ao pool."""
+        with self._available:
+            self._closed = True
+            idle = self._idle[True] + self._idle[False]
+            self._idle = {True: [], False: []}
+            self._available.notify_all()
+
+        for pooled in idle:
+            self._quit(pooled)
+
+# Instância global do pool de drivers
+driver_pool = DriverPool()
@@ -0,0 +1,91 @@
+# backend/app/services/event_bus.py
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+    """
+    Fila de eventos de um cliente, presa ao event loop que a criou.
+    Quando a fila enche, o evento mais antigo é descartado para que um
+    cliente lento nunca segure o scraper.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, execution_id: Optional[int], maxsize: int):
+        self.loop = loop
+        self.execution_id = execution_id
+        self.queue: "asyncio.Queue[Dict]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def matches(self, execution_id: int) -> bool:
+        return self.execution_id is None or self.execution_id == execution_id
+
+    def put(self, event: Dict) -> None:
+        """Enfileira o evento. Só pode ser chamado no loop da assinatura."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+class EventBus:
+    """
+    Pub/sub em processo dos eventos das execuções.
+
+    Os workers publicam de suas próprias threads e event loops; cada
+    evento é entregue no loop do assinante com call_soon_threadsafe.
+    """
+
+    def __init__(self, buffer_size: int = settings.EVENT_STREAM_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._subscriptions: List[Subscription] = []
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def subscribe(self, execution_id: Optional[int] = None) -> Subscription:
+        """Cria uma assinatura no event loop corrente (None = todas as execuções)."""
+        subscription = Subscription(asyncio.get_running_loop(), execution_id, self.buffer_size)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        if subscription.dropped:
+            logger.warning(f"Event subscriber dropped {subscription.dropped} events")
+
+    def publish(self, execution_id: int, event_type: str, **data) -> Dict:
+        """Publica um evento para os assinantes da execução. Pode ser chamado de qualquer thread."""
+        event = {
+            "id": next(self._sequence),
+            "type": event_type,
+            "execution_id": execution_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "data": data
+        }
+
+        with self._lock:
+            subscriptions = [sub for sub in self._subscriptions if sub.matches(execution_id)]
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # Loop do assinante já foi encerrado
+                self.unsubscribe(subscription)
+        return event
+
+def to_sse(event: Dict) -> str:
+    """Formata o evento no formato text/event-stream."""
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+# Instância global do barramento de eventos
+event_bus = EventBus()
@@ -0,0 +1,240 @@
+# backend/app/services/execution_engine.py
+
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from services.scraping_manager import ScrapingManager
+from services.response_cache import response_cache
+from services.execution_plan import PENDING, execution_plan
+from models import Execution
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class ExecutionJob:
+    """Representa uma execução em andamento dentro do engine."""
+
+    def __init__(
+        self,
+        execution_id: int,
+        headless: bool = False,
+        workers: Optional[int] = None,
+        delay_profile: Optional[str] = None,
+        mode: str = "full"
+    ):
+        self.execution_id = execution_id
+        self.headless = headless
+        self.mode = mode
+        self.workers = workers
+        self.delay_profile = delay_profile
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.started_at = datetime.utcnow()
+
+    def is_alive(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def to_dict(self) -> Dict:
+        return {
+            "execution_id": self.execution_id,
+            "headless": self.headless,
+            "mode": self.mode,
+            "workers": self.workers,
+            "delay_profile": self.delay_profile,
+            "started_at": self.started_at.isoformat(),
+            "stopping": self.stop_event.is_set(),
+            "alive": self.is_alive()
+        }
+
+class ExecutionEngine:
+    """
+    Mantém o registro das execuções em andamento e as roda fora do
+    event loop da API, cada uma em sua própria thread.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[int, ExecutionJob] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        db: Session,
+        headless: bool = False,
+        workers: Optional[int] = None,
+        delay_profile: Optional[str] = None,
+        mode: str = "full"
+    ) -> int:
+        """
+        Cria o registro da execução e dispara o scraping em background.
+        Retorna imediatamente o ID da execução.
+        """
+        execution = Execution(
+            execution_mode=mode,
+            headless=headless,
+            workers=workers,
+            delay_profile=delay_profile
+        )
+        db.add(execution)
+        db.commit()
+        response_cache.invalidate()
+
+        self._dispatch(ExecutionJob(execution.id, headless, workers, delay_profile, mode))
+        return execution.id
+
+    def resume(
+        self,
+        execution_id: int,
+        headless: bool = False,
+        mode: str = "full",
+        workers: Optional[int] = None,
+        delay_profile: Optional[str] = None
+    ) -> None:
+        """
+        Retoma uma execução interrompida a partir do seu plano de keywords,
+        com o mesmo número de workers e perfil de atrasos do início.
+        """
+        if delay_profile not in settings.DELAY_PROFILES:
+            # Perfil removido da configuração desde o início da execução
+            delay_profile = None
+        self._dispatch(ExecutionJob(execution_id, headless, workers, delay_profile, mode))
+
+    def recover_orphans(self, policy: str = settings.ORPHAN_EXECUTION_POLICY) -> Dict[str, List[int]]:
+        """
+        Trata execuções que ficaram marcadas como running sem job no engine
+        (API ou Chrome caíram no meio). Com policy "resume", as que têm
+        keywords pendentes no plano são retomadas; as demais são encerradas,
+        com as keywords restantes marcadas como failed.
+        """
+        recovered = {"resumed": [], "failed": [], "completed": []}
+        db = SessionLocal()
+        try:
+            orphans = db.query(Execution).filter(Execution.is_running == True).all()
+            for execution in orphans:
+                if self.is_running(execution.id):
+                    continue
+
+                progress = None
+                if execution_plan.exists(db, execution.id):
+                    progress = execution_plan.recover(db, execution.id)
+
+                if policy == "resume" and progress and progress[PENDING] > 0:
+                    self.resume(
+                        execution.id,
+                        bool(execution.headless),
+                        execution.execution_mode or "full",
+                        execution.workers,
+                        execution.delay_profile
+                    )
+                    recovered["resumed"].append(execution.id)
+                    continue
+
+                execution.is_running = False
+                execution.end_time = datetime.utcnow()
+                if progress and progress[PENDING] == 0:
+                    execution.status = "completed"
+                    recovered["completed"].append(execution.id)
+                else:
+                    message = "Execution interrupted by an API restart"
+                    execution_plan.fail_remaining(db, execution.id, message)
+                    execution.status = "error"
+                    execution.error_message = message
+                    recovered["failed"].append(execution.id)
+                db.commit()
+
+            if orphans:
+                response_cache.invalidate()
+                logger.info(f"Recovered orphaned executions: {recovered}")
+            return recovered
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error recovering orphaned executions: {str(e)}")
+            return recovered
+        finally:
+            db.close()
+
+    def stop(self, execution_id: int) -> bool:
+        """
+        Solicita o cancelamento de uma execução em andamento.
+        Retorna False se a execução não estiver registrada no engine.
+        """
+        with self._lock:
+            job = self._jobs.get(execution_id)
+
+        if not job:
+            return False
+
+        job.stop_event.set()
+        logger.info(f"Stop requested for execution {execution_id}")
+        return True
+
+    def is_running(self, execution_id: int) -> bool:
+        with self._lock:
+            job = self._jobs.get(execution_id)
+        return job is not None and job.is_alive()
+
+    def list_jobs(self) -> List[Dict]:
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """Cancela todas as execuções e aguarda o término das threads."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+
+        for job in jobs:
+            job.stop_event.set()
+
+        for job in jobs:
+            if job.thread:
+                job.thread.join(timeout)
+
+    def _dispatch(self, job: ExecutionJob) -> None:
+        job.thread = threading.Thread(
+            target=self._run_job,
+            args=(job,),
+            name=f"execution-{job.execution_id}",
+            daemon=True
+        )
+
+        with self._lock:
+            self._jobs[job.execution_id] = job
+        job.thread.start()
+
+        logger.info(f"Execution {job.execution_id} dispatched to background worker")
+
+    def _run_job(self, job: ExecutionJob) -> None:
+        """Ponto de entrada da thread: roda a execução com sessão e loop próprios."""
+        db = SessionLocal()
+        try:
+            manager = ScrapingManager(
+                db,
+                stop_event=job.stop_event,
+                workers=job.workers,
+                delay_profile=job.delay_profile
+            )
+            asyncio.run(self._run(manager, job))
+        except Exception as e:
+            logger.error(f"Execution {job.execution_id} failed: {str(e)}")
+        finally:
+            db.close()
+            with self._lock:
+                self._jobs.pop(job.execution_id, None)
+
+    async def _run(self, manager: ScrapingManager, job: ExecutionJob) -> None:
+        try:
+            await manager.start_execution(job.headless, execution_id=job.execution_id, mode=job.mode)
+            await manager.run_scraping()
+        except Exception as e:
+            await manager.stop_execution(status="error", error_message=str(e))
+            raise
+
+        await manager.stop_execution(
+            status="stopped" if job.stop_event.is_set() else "completed"
+        )
+
+# Instância global do engine de execuções
+execution_engine = ExecutionEngine()
@@ -0,0 +1,162 @@
+# backend/app/services/execution_plan.py
+
+import logging
+import random
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from models import ExecutionKeyword
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+class ExecutionPlan:
+    """
+    Plano de trabalho persistido das execuções (tabela execution_keywords).
+
+    Cada keyword da execução tem uma linha com estado e tentativas, para
+    que uma execução interrompida (Chrome ou API caíram) possa continuar
+    de onde parou. As transições são UPDATEs atômicos com commit próprio,
+    feitos pelas sessões dos workers; a conclusão é gravada pelo
+    SearchWriter na mesma transação da pesquisa (mark_completed).
+    """
+
+    def __init__(self, max_attempts: int = settings.KEYWORD_MAX_ATTEMPTS):
+        self.max_attempts = max(1, max_attempts)
+
+    def exists(self, db: Session, execution_id: int) -> bool:
+        return db.query(ExecutionKeyword.id).filter(
+            ExecutionKeyword.execution_id == execution_id
+        ).first() is not None
+
+    def create(self, db: Session, execution_id: int, keyword_ids: List[int]) -> List[int]:
+        """Grava o plano com as keywords embaralhadas. Retorna a ordem sorteada."""
+        keyword_ids = list(dict.fromkeys(keyword_ids))
+        random.shuffle(keyword_ids)
+        db.bulk_insert_mappings(ExecutionKeyword, [
+            {
+                "execution_id": execution_id,
+                "keyword_id": keyword_id,
+                "position": position,
+                "status": PENDING,
+                "attempts": 0,
+                "created_at": datetime.utcnow()
+            }
+            for position, keyword_id in enumerate(keyword_ids)
+        ])
+        db.commit()
+        return keyword_ids
+
+    def recover(self, db: Session, execution_id: int) -> Dict[str, int]:
+        """
+        Prepara um plano interrompido para ser retomado: keywords que
+        estavam em andamento voltam para pending, ou viram failed se já
+        esgotaram as tentativas. Retorna o progresso resultante.
+        """
+        now = datetime.utcnow()
+        interrupted = db.query(ExecutionKeyword).filter(
+            ExecutionKeyword.execution_id == execution_id,
+            ExecutionKeyword.status == RUNNING
+        )
+        interrupted.filter(ExecutionKeyword.attempts >= self.max_attempts).update({
+            ExecutionKeyword.status: FAILED,
+            ExecutionKeyword.last_error: "Interrupted too many times",
+            ExecutionKeyword.finished_at: now
+        }, synchronize_session=False)
+        interrupted.update({
+            ExecutionKeyword.status: PENDING
+        }, synchronize_session=False)
+        db.commit()
+        return self.progress(db, execution_id)
+
+    def remaining(self, db: Session, execution_id: int) -> List[int]:
+        """Keywords ainda não concluídas, na ordem do plano."""
+        rows = db.query(ExecutionKeyword.keyword_id).filter(
+            ExecutionKeyword.execution_id == execution_id,
+            ExecutionKeyword.status.in_((PENDING, RUNNING))
+        ).order_by(ExecutionKeyword.position).all()
+        return [keyword_id for keyword_id, in rows]
+
+    def start(self, db: Session, execution_id: int, keyword_id: int) -> int:
+        """Marca a keyword como em andamento. Retorna o número desta tentativa."""
+        self._update(db, execution_id, keyword_id, {
+            ExecutionKeyword.status: RUNNING,
+            ExecutionKeyword.attempts: ExecutionKeyword.attempts + 1,
+            ExecutionKeyword.started_at: datetime.utcnow()
+        })
+        attempts = db.query(ExecutionKeyword.attempts).filter(
+            ExecutionKeyword.execution_id == execution_id,
+            ExecutionKeyword.keyword_id == keyword_id
+        ).scalar()
+        return attempts or 1
+
+    def retry(self, db: Session, execution_id: int, keyword_id: int, error: str) -> None:
+        """Devolve a keyword para pending após uma falha transitória."""
+        self._update(db, execution_id, keyword_id, {
+            ExecutionKeyword.status: PENDING,
+            ExecutionKeyword.last_error: error[:500]
+        })
+
+    def fail(self, db: Session, execution_id: int, keyword_id: int, error: str) -> None:
+        self._update(db, execution_id, keyword_id, {
+            ExecutionKeyword.status: FAILED,
+            ExecutionKeyword.last_error: error[:500],
+            ExecutionKeyword.finished_at: datetime.utcnow()
+        })
+
+    def fail_remaining(self, db: Session, execution_id: int, error: str) -> int:
+        """Marca como failed tudo o que não foi concluído. Retorna quantas keywords (sem commit)."""
+        return db.query(ExecutionKeyword).filter(
+            ExecutionKeyword.execution_id == execution_id,
+            ExecutionKeyword.status.in_((PENDING, RUNNING))
+        ).update({
+            ExecutionKeyword.status: FAILED,
+            ExecutionKeyword.last_error: error[:500],
+            ExecutionKeyword.finished_at: datetime.utcnow()
+        }, synchronize_session=False)
+
+    def mark_completed(self, db: Session, execution_id: int, keyword_id: int, at: Optional[datetime] = None) -> None:
+        """Marca a keyword como concluída na transação corrente (sem commit)."""
+        db.query(ExecutionKeyword).filter(
+            ExecutionKeyword.execution_id == execution_id,
+            ExecutionKeyword.keyword_id == keyword_id
+        ).update({
+            ExecutionKeyword.status: COMPLETED,
+            ExecutionKeyword.finished_at: at or datetime.utcnow()
+        }, synchronize_session=False)
+
+    def progress(self, db: Session, execution_id: int) -> Dict[str, int]:
+        """Total de keywords do plano por estado."""
+        counts = {PENDING: 0, RUNNING: 0, COMPLETED: 0, FAILED: 0}
+        rows = db.query(ExecutionKeyword.status, func.count(ExecutionKeyword.id)).filter(
+            ExecutionKeyword.execution_id == execution_id
+        ).group_by(ExecutionKeyword.status).all()
+        for status, total in rows:
+            counts[status] = total
+        counts["total"] = sum(counts.values())
+        return counts
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Espera antes da próxima tentativa: exponencial, com jitter e teto."""
+        base = settings.KEYWORD_RETRY_BACKOFF["BASE"] * 2 ** max(0, attempt - 1)
+        return min(settings.KEYWORD_RETRY_BACKOFF["MAX"], base) * random.uniform(0.5, 1.0)
+
+    def _update(self, db: Session, execution_id: int, keyword_id: int, values: Dict) -> None:
+        try:
+            db.query(ExecutionKeyword).filter(
+                ExecutionKeyword.execution_id == execution_id,
+                ExecutionKeyword.keyword_id == keyword_id
+            ).update(values, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error updating plan of execution {execution_id}, keyword {keyword_id}: {str(e)}")
+
+# Instância global do plano de execução
+execution_plan = ExecutionPlan()
@@ -0,0 +1,397 @@
+# backend/app/services/metrics.py
+
+import abc
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Limites (em segundos) dos buckets das etapas do scraping
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Fração do orçamento de uma espera de prontidão efetivamente usada
+BUDGET_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+
+# Limites (em bytes) do que é trazido do navegador para extrair contatos
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+COUNTERS = ("searches", "ads", "clicks", "contacts", "retries", "skipped_visits", "http_checks")
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class Metric(abc.ABC):
+    """Base das métricas: valores por combinação de labels, protegidos por lock."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels(self, key: Tuple[str, ...], extra: Sequence[Tuple[str, str]] = ()) -> str:
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    @abc.abstractmethod
+    def samples(self) -> List[str]:
+        """Linhas de amostra no formato de texto do Prometheus."""
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples()
+        ]
+
+class Counter(Metric):
+    """Contador monotônico."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{self._labels(key)} {_format_value(value)}" for key, value in values]
+
+class Gauge(Metric):
+    """
+    Valor instantâneo. Pode ser atualizado (set/inc/dec) ou lido de uma
+    função no momento da coleta, para estados que já vivem em outro lugar.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        if self.label_names:
+            raise ValueError("Function gauges cannot have labels")
+        self._function = function
+
+    def samples(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self._function())}"]
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{self._labels(key)} {_format_value(value)}" for key, value in values]
+
+class Histogram(Metric):
+    """Histograma de buckets cumulativos, com soma e contagem."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state["counts"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(
+                (key, {"counts": list(state["counts"]), "sum": state["sum"], "count": state["count"]})
+                for key, state in self._values.items()
+            )
+
+        lines = []
+        for key, state in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state["counts"]):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{self._labels(key, [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{self._labels(key, [('le', '+Inf')])} {state['count']}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{self._labels(key)} {state['count']}")
+        return lines
+
+class MetricsRegistry:
+    """Conjunto de métricas renderizadas juntas no formato de texto do Prometheus."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+class ScrapeMetrics:
+    """
+    Métricas do scraping: tempo por etapa (driver_startup, driver_acquire,
+    serp_load, ad_extraction, ad_navigation, http_check, contact_scan,
+    db_commit),
+    contadores de resultado e erros, esperas de prontidão das páginas
+    (tempo real contra o orçamento) e gauges de drivers e fila.
+
+    Além do agregado do processo (exposto em /metrics), cada observação
+    feita com execution_id entra no resumo da execução, que é gravado
+    junto ao registro Execution quando ela termina.
+    """
+
+    def __init__(self):
+        self.registry = MetricsRegistry()
+        self.stage_seconds = self.registry.register(Histogram(
+            "ads_tracker_stage_seconds",
+            "Time spent in each scraping stage, excluding deliberate delays",
+            ["stage"]
+        ))
+        self.counters = {
+            name: self.registry.register(Counter(
+                f"ads_tracker_{name}_total",
+                f"Total {name} processed by the scraper"
+            ))
+            for name in COUNTERS
+        }
+        self.extraction_bytes = self.registry.register(Histogram(
+            "ads_tracker_extraction_transfer_bytes",
+            "Bytes transferred from the browser per contact extraction",
+            ["method"],
+            buckets=BYTES_BUCKETS
+        ))
+        self.transferred_bytes = self.registry.register(Counter(
+            "ads_tracker_transferred_bytes_total",
+            "Total bytes transferred from the browser to the scraper for contact extraction",
+            ["method"]
+        ))
+        self.wait_seconds = self.registry.register(Histogram(
+            "ads_tracker_wait_seconds",
+            "Actual time spent waiting for pages to become ready",
+            ["wait", "outcome"]
+        ))
+        self.wait_budget_ratio = self.registry.register(Histogram(
+            "ads_tracker_wait_budget_ratio",
+            "Fraction of the readiness wait budget actually used",
+            ["wait"],
+            buckets=BUDGET_BUCKETS
+        ))
+        self.errors = self.registry.register(Counter(
+            "ads_tracker_errors_total",
+            "Scraping errors by type",
+            ["type"]
+        ))
+        self.active_drivers = self.registry.register(Gauge(
+            "ads_tracker_active_drivers",
+            "Chrome drivers currently in use"
+        ))
+        self.idle_drivers = self.registry.register(Gauge(
+            "ads_tracker_idle_drivers",
+            "Pre-warmed Chrome drivers waiting in the pool"
+        ))
+        self.queue_depth = self.registry.register(Gauge(
+            "ads_tracker_queue_depth",
+            "Keywords waiting in the worker pool queues"
+        ))
+        self._summaries: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _summary(self, execution_id: int) -> Dict:
+        """Resumo da execução; deve ser chamado com o lock adquirido."""
+        summary = self._summaries.get(execution_id)
+        if summary is None:
+            summary = self._summaries[execution_id] = {
+                "stages": {},
+                "counters": {name: 0 for name in COUNTERS},
+                "transferred_bytes": {},
+                "waits": {},
+                "errors": {}
+            }
+        return summary
+
+    def observe(self, stage: str, seconds: float, execution_id: Optional[int] = None) -> None:
+        """Registra a duração de uma etapa."""
+        self.stage_seconds.observe(seconds, stage=stage)
+        if execution_id is None:
+            return
+
+        with self._lock:
+            stages = self._summary(execution_id)["stages"]
+            stats = stages.setdefault(stage, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            stats["count"] += 1
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    @contextmanager
+    def timer(self, stage: str, execution_id: Optional[int] = None, delays=None) -> Iterator[None]:
+        """
+        Mede o bloco como uma etapa. Com um DelayPolicy em delays, o tempo
+        de atraso deliberado acumulado dentro do bloco é descontado.
+        """
+        started = time.monotonic()
+        delayed = delays.total_seconds if delays is not None else 0.0
+        try:
+            yield
+        finally:
+            seconds = time.monotonic() - started
+            if delays is not None:
+                seconds -= max(0.0, delays.total_seconds - delayed)
+            self.observe(stage, max(0.0, seconds), execution_id)
+
+    def count(self, name: str, amount: int = 1, execution_id: Optional[int] = None) -> None:
+        """Incrementa um dos contadores de resultado (ver COUNTERS)."""
+        if amount <= 0:
+            return
+        self.counters[name].inc(amount)
+        if execution_id is not None:
+            with self._lock:
+                self._summary(execution_id)["counters"][name] += amount
+
+    def wait(
+        self,
+        name: str,
+        seconds: float,
+        budget: float,
+        outcome: str,
+        execution_id: Optional[int] = None
+    ) -> None:
+        """Registra uma espera de prontidão: tempo real, orçamento e desfecho (ready, no_ads, timeout)."""
+        self.wait_seconds.observe(seconds, wait=name, outcome=outcome)
+        if budget > 0:
+            self.wait_budget_ratio.observe(min(1.0, seconds / budget), wait=name)
+        if execution_id is None:
+            return
+
+        with self._lock:
+            waits = self._summary(execution_id)["waits"]
+            stats = waits.setdefault(name, {
+                "count": 0, "total_seconds": 0.0, "budget_seconds": 0.0, "max_seconds": 0.0, "outcomes": {}
+            })
+            stats["count"] += 1
+            stats["total_seconds"] += seconds
+            stats["budget_seconds"] += budget
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+
+    def transferred(self, method: str, size: int, execution_id: Optional[int] = None) -> None:
+        """Registra os bytes trazidos do navegador numa extração (in_page ou page_source)."""
+        self.extraction_bytes.observe(size, method=method)
+        if size <= 0:
+            return
+        self.transferred_bytes.inc(size, method=method)
+        if execution_id is not None:
+            with self._lock:
+                transferred = self._summary(execution_id)["transferred_bytes"]
+                transferred[method] = transferred.get(method, 0) + size
+
+    def error(self, error_type: str, execution_id: Optional[int] = None) -> None:
+        """Conta um erro do tipo informado (driver_start, webdriver, search, ad, navigation, db_commit)."""
+        self.errors.inc(type=error_type)
+        if execution_id is not None:
+            with self._lock:
+                errors = self._summary(execution_id)["errors"]
+                errors[error_type] = errors.get(error_type, 0) + 1
+
+    def summary(self, execution_id: int) -> Dict:
+        """Cópia do resumo atual da execução, com a média de cada etapa."""
+        with self._lock:
+            summary = self._summaries.get(execution_id)
+            if summary is None:
+                return {}
+            stages = {
+                stage: {
+                    "count": stats["count"],
+                    "total_seconds": round(stats["total_seconds"], 3),
+                    "avg_seconds": round(stats["total_seconds"] / stats["count"], 3),
+                    "max_seconds": round(stats["max_seconds"], 3)
+                }
+                for stage, stats in summary["stages"].items()
+            }
+            waits = {
+                name: {
+                    "count": stats["count"],
+                    "total_seconds": round(stats["total_seconds"], 3),
+                    "avg_seconds": round(stats["total_seconds"] / stats["count"], 3),
+                    "max_seconds": round(stats["max_seconds"], 3),
+                    "budget_used": round(stats["total_seconds"] / stats["budget_seconds"], 3)
+                    if stats["budget_seconds"] else 0.0,
+                    "outcomes": dict(stats["outcomes"])
+                }
+                for name, stats in summary["waits"].items()
+            }
+            return {
+                "stages": stages,
+                "counters": dict(summary["counters"]),
+                "transferred_bytes": dict(summary["transferred_bytes"]),
+                "waits": waits,
+                "errors": dict(summary["errors"])
+            }
+
+    def pop_summary(self, execution_id: int) -> Dict:
+        """Retorna o resumo final da execução e o remove da memória."""
+        summary = self.summary(execution_id)
+        with self._lock:
+            self._summaries.pop(execution_id, None)
+        return summary
+
+    def render(self) -> str:
+        return self.registry.render()
+
+# Instância global das métricas
+metrics = ScrapeMetrics()
@@ -0,0 +1,197 @@
+# backend/app/services/page_readiness.py
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+from selenium import webdriver
+from config import settings
+from services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+READY = "ready"
+NO_ADS = "no_ads"
+TIMEOUT = "timeout"
+STOPPED = "stopped"
+
+# Instala (uma vez por documento) um MutationObserver no container e devolve
+# o estado da página numa única chamada: readyState, tempo desde a última
+# mutação e quantos anúncios/resultados orgânicos já existem.
+# Argumentos: seletor do container, seletor dos anúncios, seletor dos resultados.
+STATE_SCRIPT = r"""
+const [containerSelector, adSelector, resultsSelector] = arguments;
+if (window.__adsTrackerStale) {
+  return {stale: true};
+}
+let state = window.__adsTrackerReadiness;
+const container = (containerSelector && document.querySelector(containerSelector)) || document.body;
+if (container && (!state || state.container !== container)) {
+  if (state) state.observer.disconnect();
+  state = window.__adsTrackerReadiness = {container: container, last: performance.now()};
+  state.observer = new MutationObserver(() => { state.last = performance.now(); });
+  state.observer.observe(container, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return {
+  stale: false,
+  ready_state: document.readyState,
+  quiet_ms: state ? performance.now() - state.last : 0,
+  ads: adSelector ? document.querySelectorAll(adSelector).length : 0,
+  results: resultsSelector ? document.querySelector(resultsSelector) !== null : false
+};
+"""
+
+# Marca o documento atual, para a espera seguinte não confundi-lo com a página nova
+STALE_SCRIPT = "window.__adsTrackerStale = true;"
+
+class NetworkIdleTracker:
+    """
+    Acompanha as requisições abertas a partir dos eventos Network.* do log
+    de performance. A rede está ociosa quando há no máximo max_inflight
+    requisições abertas há pelo menos quiet_ms. Sem log disponível, a rede
+    é considerada ociosa e a espera depende só dos sinais do DOM.
+    """
+
+    def __init__(
+        self,
+        quiet_ms: float = settings.READINESS_NETWORK_QUIET_MS,
+        max_inflight: int = settings.READINESS_NETWORK_MAX_INFLIGHT
+    ):
+        self.quiet_seconds = quiet_ms / 1000
+        self.max_inflight = max_inflight
+        self.available = False
+        self.inflight: Set[str] = set()
+        self.idle_since: Optional[float] = time.monotonic()
+
+    def feed(self, entries: Optional[List[Dict]], now: Optional[float] = None) -> None:
+        if entries is None:
+            return
+        self.available = True
+        now = now or time.monotonic()
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            request_id = message.get("params", {}).get("requestId")
+            if method == "Network.requestWillBeSent":
+                self.inflight.add(request_id)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                # Requisições abertas antes da espera começar não estão no conjunto
+                self.inflight.discard(request_id)
+
+        if len(self.inflight) > self.max_inflight:
+            self.idle_since = None
+        elif self.idle_since is None:
+            self.idle_since = now
+
+    def is_idle(self, now: Optional[float] = None) -> bool:
+        if not self.available:
+            return True
+        now = now or time.monotonic()
+        return self.idle_since is not None and now - self.idle_since >= self.quiet_seconds
+
+class PageReadiness:
+    """
+    Esperas orientadas a sinais reais da página, no lugar de atrasos fixos.
+
+    Uma página está pronta quando o documento saiu de "loading", o
+    container observado pelo MutationObserver ficou READINESS_SETTLE_MS
+    sem mudar e a rede está ociosa (log de performance/CDP). Uma SERP
+    com resultados orgânicos e nenhum anúncio termina a espera na hora.
+    Cada espera tem um orçamento em READINESS_BUDGETS; o tempo real, o
+    orçamento e o desfecho vão para as métricas, para a latência das
+    pesquisas acompanhar a velocidade da página e não o pior caso.
+    """
+
+    def __init__(
+        self,
+        execution_id: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+        log_reader: Optional[Callable[[webdriver.Chrome], Optional[List[Dict]]]] = None
+    ):
+        self.execution_id = execution_id
+        self.stop_event = stop_event or threading.Event()
+        self.log_reader = log_reader if settings.READINESS_NETWORK_IDLE else None
+
+    def mark_stale(self, driver: webdriver.Chrome) -> None:
+        """Marca o documento atual antes de uma navegação disparada pela página (submit, clique)."""
+        try:
+            driver.execute_script(STALE_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Error marking page as stale: {str(e)}")
+
+    async def wait_for_serp(self, driver: webdriver.Chrome) -> str:
+        """Espera a SERP carregar. Retorna READY, NO_ADS, TIMEOUT ou STOPPED."""
+        return await self.wait(
+            driver,
+            "serp",
+            container=settings.SERP_CONTAINER_SELECTOR,
+            ad_selector=settings.SERP_AD_SELECTOR,
+            results_selector=settings.SERP_RESULTS_SELECTOR
+        )
+
+    async def wait_for_page(self, driver: webdriver.Chrome, name: str = "advertiser") -> str:
+        """Espera uma página qualquer estabilizar, observando o body inteiro."""
+        return await self.wait(driver, name)
+
+    async def wait(
+        self,
+        driver: webdriver.Chrome,
+        name: str,
+        container: Optional[str] = None,
+        ad_selector: Optional[str] = None,
+        results_selector: Optional[str] = None
+    ) -> str:
+        budget = settings.READINESS_BUDGETS[name]
+        settle_ms = settings.READINESS_SETTLE_MS
+        network = NetworkIdleTracker()
+        started = time.monotonic()
+        outcome = TIMEOUT
+
+        while True:
+            if self.stop_event.is_set():
+                outcome = STOPPED
+                break
+
+            state = self._state(driver, container, ad_selector, results_selector)
+            if self.log_reader is not None:
+                network.feed(self.log_reader(driver))
+
+            if state is not None and not state.get("stale") and state["ready_state"] != "loading":
+                if results_selector and state["results"] and state["ads"] == 0 and state["ready_state"] == "complete":
+                    # SERP completa, com resultados orgânicos e sem anúncios
+                    outcome = NO_ADS
+                    break
+
+                has_content = not results_selector or state["ads"] > 0 or state["results"]
+                if has_content and state["quiet_ms"] >= settle_ms and network.is_idle():
+                    outcome = READY
+                    break
+
+            if time.monotonic() - started >= budget:
+                break
+            await asyncio.sleep(settings.READINESS_POLL_INTERVAL)
+
+        seconds = time.monotonic() - started
+        metrics.wait(name, seconds, budget, outcome, self.execution_id)
+        if outcome == TIMEOUT:
+            logger.warning(f"Page readiness '{name}' exhausted its {budget}s budget")
+        return outcome
+
+    def _state(
+        self,
+        driver: webdriver.Chrome,
+        container: Optional[str],
+        ad_selector: Optional[str],
+        results_selector: Optional[str]
+    ) -> Optional[Dict]:
+        # Durante a troca de documento o script pode falhar; é só ler de novo
+        try:
+            return driver.execute_script(STATE_SCRIPT, container, ad_selector, results_selector)
+        except Exception:
+            return None
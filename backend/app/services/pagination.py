@@ -0,0 +1,112 @@
+# backend/app/services/pagination.py
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    payload = {
+        "s": sort,
+        "v": [value.isoformat() if isinstance(value, (datetime, date)) else value for value in values]
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str, sort: str, columns: List) -> List[Any]:
+    """Lê o cursor e converte os valores para os tipos das colunas de ordenação."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if payload["s"] != sort or len(payload["v"]) != len(columns):
+            raise ValueError("cursor does not match the requested sort")
+
+        values = []
+        for column, value in zip(columns, payload["v"]):
+            python_type = column.type.python_type
+            if value is not None and python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif value is not None and python_type is date:
+                value = date.fromisoformat(value)
+            values.append(value)
+        return values
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {str(e)}")
+
+def keyset_filter(columns: List, descending: List[bool], values: List[Any]):
+    """
+    Condição "linha vem depois do cursor" para uma ordenação composta:
+    (a > va) OR (a = va AND b > vb) OR ..., respeitando a direção de cada coluna.
+    """
+    clauses = []
+    for index, (column, desc, value) in enumerate(zip(columns, descending, values)):
+        previous = [columns[i] == values[i] for i in range(index)]
+        after = column < value if desc else column > value
+        clauses.append(and_(*previous, after))
+    return or_(*clauses)
+
+async def paginate(
+    db: AsyncSession,
+    statement: Select,
+    sort: str,
+    sortable: Dict[str, Any],
+    tiebreaker,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    include_total: bool = False,
+    serialize: Callable = lambda row: row
+) -> Dict:
+    """
+    Paginação por keyset sobre um select() executado numa sessão assíncrona.
+
+    sort é o nome de uma chave de sortable, com "-" na frente para ordem
+    decrescente; o tiebreaker (normalmente o ID) completa a ordenação para
+    que ela seja estável. As colunas de ordenação não podem ser nulas.
+
+    Retorna {"items", "next_cursor", "total_estimate"}; total_estimate só
+    é calculado com include_total, pois custa um COUNT do filtro.
+    """
+    name = sort.lstrip("-")
+    if name not in sortable:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort: {sort}. Use one of: {', '.join(sorted(sortable))}"
+        )
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    desc = sort.startswith("-")
+    columns = [sortable[name], tiebreaker]
+    descending = [desc, desc]
+
+    total = None
+    if include_total:
+        total = await db.scalar(
+            select(func.count()).select_from(statement.order_by(None).subquery())
+        )
+
+    page = statement.add_columns(*columns)
+    if cursor:
+        page = page.where(keyset_filter(columns, descending, decode_cursor(cursor, sort, columns)))
+    page = page.order_by(*[column.desc() if d else column.asc() for column, d in zip(columns, descending)])
+
+    rows = (await db.execute(page.limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(sort, list(rows[-1][-len(columns):]))
+
+    items = []
+    for row in rows:
+        entities = row[:-len(columns)]
+        items.append(serialize(entities[0] if len(entities) == 1 else entities))
+
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "total_estimate": total
+    }
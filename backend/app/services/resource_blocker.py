@@ -0,0 +1,155 @@
+# backend/app/services/resource_blocker.py
+
+import fnmatch
+import json
+import logging
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from selenium import webdriver
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class ResourceBlocker:
+    """
+    Bloqueia imagens, fontes, mídia e rastreadores via CDP
+    (Network.setBlockedURLs), com um perfil por fase do scraping.
+
+    A contabilização usa o log de performance do Chrome: requisições
+    bloqueadas pelo inspector são contadas por tipo e convertidas em
+    bytes economizados estimados. Como ler o log o esvazia, quem mais
+    precisar dele (o PageReadiness) lê por read_log(), que guarda as
+    entradas para o próximo collect().
+    """
+
+    def __init__(
+        self,
+        enabled: bool = settings.RESOURCE_BLOCKING_ENABLED,
+        profiles: Optional[Dict] = None
+    ):
+        self.enabled = enabled
+        self.profiles = profiles or settings.RESOURCE_BLOCKING_PROFILES
+        self.stats: Dict[str, Dict] = {}
+        self._buffer: List[Dict] = []
+
+    def patterns_for(self, phase: str) -> List[str]:
+        """Monta a lista de padrões bloqueados para uma fase."""
+        profile = self.profiles.get(phase)
+        if not profile:
+            return []
+
+        patterns = []
+        for resource_type in profile.get("resource_types", []):
+            patterns.extend(settings.BLOCKED_RESOURCE_PATTERNS.get(resource_type, []))
+        if profile.get("block_trackers"):
+            patterns.extend(settings.TRACKER_DENY_LIST)
+        return patterns
+
+    def is_allowed_host(self, url: Optional[str]) -> bool:
+        """Hosts da allow list nunca têm recursos bloqueados."""
+        if not url:
+            return False
+        host = urlparse(url).netloc.lower()
+        return any(
+            fnmatch.fnmatch(host, pattern)
+            for pattern in settings.RESOURCE_BLOCKING_ALLOW_HOSTS
+        )
+
+    def apply(self, driver: webdriver.Chrome, phase: str, url: Optional[str] = None) -> None:
+        """
+        Aplica o perfil da fase na aba atual do driver.
+        Deve ser chamado antes de navegar para a página.
+        """
+        if not self.enabled:
+            return
+
+        # Descartar entradas antigas do log para não misturar fases
+        self.collect(driver, phase=None)
+
+        patterns = [] if self.is_allowed_host(url) else self.patterns_for(phase)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logger.warning(f"Error applying resource blocking for {phase}: {str(e)}")
+
+    def read_log(self, driver: webdriver.Chrome) -> Optional[List[Dict]]:
+        """
+        Lê as entradas novas do log de performance, guardando-as para collect().
+        Retorna None se o driver não tiver o log habilitado.
+        """
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return None
+        if self.enabled:
+            self._buffer.extend(entries)
+        return entries
+
+    def collect(self, driver: webdriver.Chrome, phase: Optional[str]) -> Dict:
+        """
+        Lê o log de performance do driver e acumula as estatísticas na fase.
+        Com phase=None as entradas são apenas descartadas.
+        """
+        summary = {
+            "blocked_requests": 0,
+            "bytes_transferred": 0,
+            "estimated_bytes_saved": 0,
+            "blocked_by_type": {}
+        }
+        if not self.enabled:
+            return summary
+
+        entries, self._buffer = self._buffer, []
+        try:
+            entries.extend(driver.get_log("performance"))
+        except Exception:
+            pass
+
+        if phase is None:
+            return summary
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Network.loadingFinished":
+                summary["bytes_transferred"] += int(params.get("encodedDataLength", 0))
+
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                resource_type = params.get("type", "Other").lower()
+                summary["blocked_requests"] += 1
+                summary["blocked_by_type"][resource_type] = (
+                    summary["blocked_by_type"].get(resource_type, 0) + 1
+                )
+                summary["estimated_bytes_saved"] += settings.ESTIMATED_RESOURCE_BYTES.get(
+                    resource_type,
+                    settings.ESTIMATED_RESOURCE_BYTES["other"]
+                )
+
+        self._accumulate(phase, summary)
+        return summary
+
+    def _accumulate(self, phase: str, summary: Dict) -> None:
+        totals = self.stats.setdefault(phase, {
+            "blocked_requests": 0,
+            "bytes_transferred": 0,
+            "estimated_bytes_saved": 0,
+            "blocked_by_type": {}
+        })
+        for key in ("blocked_requests", "bytes_transferred", "estimated_bytes_saved"):
+            totals[key] += summary[key]
+        for resource_type, count in summary["blocked_by_type"].items():
+            totals["blocked_by_type"][resource_type] = (
+                totals["blocked_by_type"].get(resource_type, 0) + count
+            )
+
+    def reset_stats(self) -> Dict:
+        """Retorna as estatísticas acumuladas e zera os contadores."""
+        stats, self.stats = self.stats, {}
+        return stats
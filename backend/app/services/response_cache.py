@@ -0,0 +1,127 @@
+# backend/app/services/response_cache.py
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class CachedResponse:
+    def __init__(self, body: bytes, media_type: str, etag: str, generation: int):
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag
+        self.generation = generation
+        self.created_at = time.monotonic()
+
+class ResponseCache:
+    """
+    Cache LRU com TTL das respostas GET dos routers de análise.
+
+    A chave é o caminho mais os query params normalizados. Cada gravação
+    de pesquisa (ou mudança de status de execução) incrementa a geração
+    e as entradas de gerações anteriores deixam de valer. Toda resposta
+    leva um ETag do corpo, e If-None-Match igual recebe 304.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl: float = settings.RESPONSE_CACHE_TTL,
+        enabled: bool = settings.RESPONSE_CACHE_ENABLED
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self.generation = 0
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Marca todas as respostas em cache como desatualizadas."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def key(self, request: Request) -> Tuple:
+        params = sorted(
+            (name, value.strip())
+            for name, value in request.query_params.multi_items()
+            if value.strip()
+        )
+        return (request.url.path, tuple(params))
+
+    def lookup(self, request: Request) -> Optional[Response]:
+        """Retorna a resposta em cache (ou 304) se ainda for válida."""
+        key = self.key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.generation != self.generation or time.monotonic() - entry.created_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        return self._respond(request, entry.body, entry.media_type, entry.etag)
+
+    def store(self, request: Request, response: Response, generation: int) -> Response:
+        """
+        Guarda a resposta calculada na geração informada, se ela ainda
+        for a atual, e devolve a resposta com ETag (ou 304).
+        """
+        body = response.body
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        entry = CachedResponse(body, response.media_type, etag, generation)
+
+        with self._lock:
+            if generation == self.generation:
+                key = self.key(request)
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return self._respond(request, body, response.media_type, etag)
+
+    def _respond(self, request: Request, body: bytes, media_type: str, etag: str) -> Response:
+        # no-cache: o navegador guarda a resposta mas sempre revalida com If-None-Match
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type=media_type, headers=headers)
+
+# Instância global do cache de respostas
+response_cache = ResponseCache()
+
+class CachedRoute(APIRoute):
+    """
+    Rota que consulta o response_cache antes de executar o endpoint
+    (e suas dependências, como a sessão do banco). Só GETs são cacheados.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            if request.method != "GET" or not response_cache.enabled:
+                return await handler(request)
+
+            cached = response_cache.lookup(request)
+            if cached is not None:
+                return cached
+
+            # Geração lida antes da consulta: uma gravação no meio descarta o resultado
+            generation = response_cache.generation
+            response = await handler(request)
+            if response.status_code != 200:
+                return response
+            return response_cache.store(request, response, generation)
+
+        return cached_handler
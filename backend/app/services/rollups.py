@@ -0,0 +1,201 @@
+# backend/app/services/rollups.py
+
+"""
+Tabelas de rollup diárias usadas pelos dashboards.
+
+São atualizadas de forma incremental pelo SearchWriter, na mesma
+transação das pesquisas, e podem ser reconstruídas a partir dos dados
+brutos (searches e competitor_appearances) pela linha de comando:
+
+    python -m services.rollups              # reconstrói tudo
+    python -m services.rollups --since 2024-01-01
+"""
+
+import argparse
+import logging
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy import and_, case, delete, func, insert, select, true
+from database import dialect_insert
+from models import (
+    Search,
+    CompetitorAppearance,
+    DailyKeywordStat,
+    DailyLideryPosition,
+    DailyCompetitorStat,
+    DailyCompetitorKeywordStat
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_MODELS = [
+    DailyKeywordStat,
+    DailyLideryPosition,
+    DailyCompetitorStat,
+    DailyCompetitorKeywordStat
+]
+
+# Linhas por INSERT, abaixo do limite de variáveis do SQLite
+UPSERT_CHUNK_SIZE = 500
+
+def aggregate(records, competitor_ids: Dict[str, int]) -> Dict[type, Dict[Tuple, Dict[str, int]]]:
+    """Soma os SearchRecord do lote por chave de cada tabela de rollup."""
+    totals: Dict[type, Dict[Tuple, Dict[str, int]]] = {model: {} for model in ROLLUP_MODELS}
+
+    def add(model, key: Tuple, **values) -> None:
+        row = totals[model].setdefault(key, {name: 0 for name in values})
+        for name, value in values.items():
+            row[name] += value
+
+    for record in records:
+        day = record.timestamp.date()
+        keyword_key = (day, record.keyword_id)
+        clicks = sum(1 for appearance in record.appearances if appearance["clicked"] == 1)
+
+        add(
+            DailyKeywordStat, keyword_key,
+            searches=1,
+            total_ads=record.total_ads,
+            clicks=clicks,
+            lidery_found=1 if record.lidery_position else 0,
+            lidery_position_sum=record.lidery_position or 0
+        )
+        if record.lidery_position:
+            add(DailyLideryPosition, (day, record.keyword_id, record.lidery_position), count=1)
+
+        for appearance in record.appearances:
+            competitor_id = competitor_ids[appearance["domain"]]
+            add(
+                DailyCompetitorStat, (day, competitor_id),
+                appearances=1,
+                position_sum=appearance["position"],
+                clicks=1 if appearance["clicked"] == 1 else 0
+            )
+            add(
+                DailyCompetitorKeywordStat, (day, competitor_id, record.keyword_id),
+                appearances=1,
+                position_sum=appearance["position"]
+            )
+
+    return totals
+
+def increment(db, model, rows: Dict[Tuple, Dict[str, int]]) -> None:
+    """Soma os valores nas linhas existentes (ON CONFLICT) ou cria as que faltam."""
+    table = model.__table__
+    key_columns = [column.name for column in table.primary_key.columns]
+    items = list(rows.items())
+
+    for start in range(0, len(items), UPSERT_CHUNK_SIZE):
+        values = [
+            {**dict(zip(key_columns, key)), **counts}
+            for key, counts in items[start:start + UPSERT_CHUNK_SIZE]
+        ]
+        statement = dialect_insert(db, table).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={
+                name: table.c[name] + statement.excluded[name]
+                for name in values[0]
+                if name not in key_columns
+            }
+        )
+        db.execute(statement)
+
+def apply_rollups(db, records, competitor_ids: Dict[str, int]) -> None:
+    """Atualiza os rollups com um lote de pesquisas, na transação corrente."""
+    for model, rows in aggregate(records, competitor_ids).items():
+        if rows:
+            increment(db, model, rows)
+
+def rebuild_rollups(connection, since: Optional[date] = None) -> Dict[str, int]:
+    """
+    Recalcula os rollups a partir de searches e competitor_appearances.
+    Com since, apenas os dias a partir dessa data são refeitos.
+    Retorna a quantidade de linhas gravadas por tabela.
+    """
+    day = func.date(Search.timestamp)
+    start = datetime.combine(since, datetime.min.time()) if since else None
+    search_filter = Search.timestamp >= start if since else true()
+    # Aparições são gravadas depois da pesquisa: o mesmo limite inferior vale
+    # para elas e deixa o PostgreSQL descartar as partições anteriores
+    appearance_filter = CompetitorAppearance.timestamp >= start if since else true()
+    clicked = case((CompetitorAppearance.clicked == 1, 1), else_=0)
+
+    for model in ROLLUP_MODELS:
+        statement = delete(model.__table__)
+        if since:
+            statement = statement.where(model.__table__.c.day >= since)
+        connection.execute(statement)
+
+    keyword_clicks = select(
+        day.label("day"),
+        Search.keyword_id.label("keyword_id"),
+        func.sum(clicked).label("clicks")
+    ).join(
+        CompetitorAppearance, CompetitorAppearance.search_id == Search.id
+    ).where(search_filter, appearance_filter).group_by(day, Search.keyword_id).subquery()
+
+    selects = {
+        DailyKeywordStat: select(
+            day,
+            Search.keyword_id,
+            func.count(Search.id),
+            func.coalesce(func.sum(Search.total_ads), 0),
+            func.coalesce(func.max(keyword_clicks.c.clicks), 0),
+            func.count(Search.lidery_position),
+            func.coalesce(func.sum(Search.lidery_position), 0)
+        ).outerjoin(
+            keyword_clicks,
+            and_(keyword_clicks.c.day == day, keyword_clicks.c.keyword_id == Search.keyword_id)
+        ).where(search_filter).group_by(day, Search.keyword_id),
+
+        DailyLideryPosition: select(
+            day,
+            Search.keyword_id,
+            Search.lidery_position,
+            func.count(Search.id)
+        ).where(
+            search_filter,
+            Search.lidery_position.isnot(None)
+        ).group_by(day, Search.keyword_id, Search.lidery_position),
+
+        DailyCompetitorStat: select(
+            day,
+            CompetitorAppearance.competitor_id,
+            func.count(CompetitorAppearance.id),
+            func.coalesce(func.sum(CompetitorAppearance.position), 0),
+            func.sum(clicked)
+        ).join(
+            Search, Search.id == CompetitorAppearance.search_id
+        ).where(search_filter, appearance_filter).group_by(day, CompetitorAppearance.competitor_id),
+
+        DailyCompetitorKeywordStat: select(
+            day,
+            CompetitorAppearance.competitor_id,
+            Search.keyword_id,
+            func.count(CompetitorAppearance.id),
+            func.coalesce(func.sum(CompetitorAppearance.position), 0)
+        ).join(
+            Search, Search.id == CompetitorAppearance.search_id
+        ).where(search_filter, appearance_filter).group_by(day, CompetitorAppearance.competitor_id, Search.keyword_id)
+    }
+
+    written = {}
+    for model, query in selects.items():
+        columns = [column.name for column in model.__table__.columns]
+        result = connection.execute(insert(model.__table__).from_select(columns, query))
+        written[model.__tablename__] = result.rowcount
+        logger.info(f"Rebuilt {model.__tablename__}: {result.rowcount} rows")
+    return written
+
+if __name__ == "__main__":
+    from database import engine, init_db
+
+    parser = argparse.ArgumentParser(description="Reconstrói as tabelas de rollup diárias")
+    parser.add_argument("--since", type=date.fromisoformat, help="Refaz apenas a partir deste dia (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    init_db()
+    with engine.begin() as connection:
+        for table, rows in rebuild_rollups(connection, args.since).items():
+            print(f"{table}: {rows} rows")
@@ -1,12 +1,11 @@
 # backend/app/services/scraper.py
 
-import time
+import asyncio
+import json
 import random
 import logging
-from typing import Optional, List, Dict, Tuple
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import threading
+from typing import Optional, List, Dict
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,22 +16,34 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException,
     WebDriverException
 )
-from urllib.parse import urlparse
 from sqlalchemy.orm import Session
 from config import settings
-from models import (
-    Execution, 
-    Keyword, 
-    Search, 
-    Competitor, 
-    CompetitorAppearance, 
-    Contact
-)
+from services.driver_pool import driver_pool
+from services.resource_blocker import ResourceBlocker
+from services.page_readiness import PageReadiness
+from services.serp_parser import SerpParser, extract_domain
+from services.delay_policy import DelayPolicy
+from services.search_writer import SearchRecord, SearchWriter
+from services.event_bus import event_bus
+from services.metrics import metrics
+from services.contact_extractor import IN_PAGE_SCRIPT, contact_extractor
+from services.contact_store import contact_store
+from services.visit_policy import VISIT, HTTP_CHECK, visit_policy, fetch_landing_page
+from models import Keyword
 
 logger = logging.getLogger(__name__)
 
 class GoogleScraper:
-    def __init__(self, db: Session, execution_id: int, headless: bool = False):
+    def __init__(
+        self,
+        db: Session,
+        execution_id: int,
+        headless: bool = False,
+        stop_event: Optional[threading.Event] = None,
+        delay_policy: Optional[DelayPolicy] = None,
+        writer: Optional[SearchWriter] = None,
+        visit_advertisers: bool = True
+    ):
         """
         Inicializa o scraper do Google.
         
@@ -40,186 +51,115 @@ class GoogleScraper:
             db (Session): Sessão do banco de dados
             execution_id (int): ID da execução atual
             headless (bool): Se deve executar em modo headless
+            stop_event (threading.Event): Sinaliza o cancelamento da execução
+            delay_policy (DelayPolicy): Perfil de atrasos deliberados
+            writer (SearchWriter): Unit of work que grava as pesquisas
+            visit_advertisers (bool): Se False (modo serp_only), só registra as posições
         """
         self.db = db
         self.execution_id = execution_id
         self.headless = headless
+        self.stop_event = stop_event or threading.Event()
+        self.delays = delay_policy or DelayPolicy(stop_event=self.stop_event)
         self.driver = None
+        self.writer = writer or SearchWriter(db)
+        self.visit_advertisers = visit_advertisers
+        self.resource_blocker = ResourceBlocker()
+        # A rede ociosa é lida do mesmo log de performance da contabilização de recursos
+        self.readiness = PageReadiness(execution_id, self.stop_event, log_reader=self.resource_blocker.read_log)
+        self.serp_parser = SerpParser()
         self.current_keyword = None
-        self.current_search = None
+        self.search_recorded = False  # Se a última pesquisa foi entregue ao writer
 
     def configure_driver(self) -> None:
-        """Configura o driver do Chrome com as opções necessárias."""
+        """Obtém um driver do Chrome já configurado a partir do pool."""
         try:
-            chrome_options = Options()
-            
-            # Configuração de emulação mobile
-            mobile_emulation = {
-                "deviceName": "iPhone X"
-            }
-            chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
-            
-            # Modo incognito e headless (se solicitado)
-            chrome_options.add_argument("--incognito")
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            
-            # Outras configurações úteis
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument(f"user-agent={settings.USER_AGENT}")
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(settings.PAGE_LOAD_TIMEOUT)
-            
+            with metrics.timer("driver_acquire", self.execution_id):
+                self.driver = driver_pool.acquire(self.headless)
             logger.info("Chrome driver configured successfully")
         except Exception as e:
             logger.error(f"Error configuring Chrome driver: {str(e)}")
             raise
 
-    def human_like_delay(self, min_time: float = 1.0, max_time: float = 3.0) -> None:
-        """Simula um atraso humanizado entre ações."""
-        time.sleep(random.uniform(min_time, max_time))
-
     def extract_domain(self, url: str) -> str:
         """Extrai o domínio base de uma URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            return domain.replace("www.", "")
-        except Exception:
-            return url
+        return extract_domain(url)
 
-    def find_whatsapp_number(self, page_source: str) -> Optional[str]:
+    def find_contacts(self, page_source: str) -> List[Dict]:
         """
-        Procura por números de WhatsApp na página.
-        Retorna o primeiro número encontrado ou None.
+        Procura WhatsApp, telefones e emails na página.
+        Retorna os contatos normalizados e pontuados, do mais confiável ao menos.
         """
-        # Implementação básica - pode ser expandida com regex mais complexos
-        for pattern in settings.WHATSAPP_PATTERNS:
-            if pattern in page_source.lower():
-                # Aqui você pode implementar a lógica para extrair o número
-                # Por enquanto, retornamos apenas uma indicação de que encontramos
-                return "found_whatsapp"
-        return None
+        return contact_extractor.extract(page_source)
 
-    def process_ad(self, ad_element, position: int) -> Optional[Dict]:
-        """Processa um único anúncio e retorna seus dados."""
-        try:
-            # Extrair URL e texto do anúncio
-            url = ad_element.get_attribute('href')
-            ad_text = ""
-            
+    def collect_contacts(self) -> List[Dict]:
+        """
+        Extrai os contatos da aba atual. No modo in_page o script roda no
+        navegador e só os candidatos atravessam o WebDriver; se ele falhar,
+        ou com CONTACT_EXTRACTION=page_source, o HTML inteiro é lido.
+        """
+        if settings.CONTACT_EXTRACTION == "in_page":
             try:
-                text_element = ad_element.find_element(
-                    By.XPATH, 
-                    f"div[1]/div/div/span[2]"
+                candidates = self.driver.execute_script(
+                    IN_PAGE_SCRIPT, settings.CONTACT_CONTEXT_CHARS, settings.CONTACT_MAX_CANDIDATES
                 )
-                ad_text = text_element.get_attribute('data-dtld')
-            except NoSuchElementException:
-                try:
-                    text_element = ad_element.find_element(
-                        By.XPATH, 
-                        f"div[1]/div/div"
-                    )
-                    ad_text = text_element.get_attribute('aria-label')
-                except NoSuchElementException:
-                    pass
+                if isinstance(candidates, list):
+                    size = len(json.dumps(candidates, ensure_ascii=False).encode("utf-8"))
+                    metrics.transferred("in_page", size, self.execution_id)
+                    return contact_extractor.extract_candidates(candidates)
+            except WebDriverException as e:
+                logger.warning(f"In-page contact extraction failed, reading page_source: {str(e)}")
 
-            domain = self.extract_domain(url)
-            
-            return {
-                "url": url,
-                "domain": domain,
-                "position": position,
-                "text": ad_text
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing ad at position {position}: {str(e)}")
-            return None
+        page_source = self.driver.page_source
+        metrics.transferred("page_source", len(page_source.encode("utf-8")), self.execution_id)
+        return self.find_contacts(page_source)
 
-    async def handle_competitor(self, ad_data: Dict) -> Tuple[Competitor, bool]:
-        """
-        Processa um competidor, criando ou atualizando seu registro.
-        Retorna o competidor e um booleano indicando se é a Lidery.
-        """
-        try:
-            domain = ad_data["domain"]
-            is_lidery = settings.LIDERY_DOMAIN in domain
-            
-            competitor = self.db.query(Competitor).filter(
-                Competitor.domain == domain
-            ).first()
-            
-            if not competitor:
-                competitor = Competitor(
-                    domain=domain,
-                    business_name=ad_data.get("text", "")
-                )
-                self.db.add(competitor)
-            else:
-                competitor.last_seen = datetime.utcnow()
-                competitor.total_appearances += 1
-                
-            self.db.commit()
-            
-            return competitor, is_lidery
-            
-        except Exception as e:
-            logger.error(f"Error handling competitor: {str(e)}")
-            self.db.rollback()
-            raise
+    def is_lidery(self, domain: str) -> bool:
+        """Indica se o domínio do anúncio é da Lidery."""
+        return settings.LIDERY_DOMAIN in domain
 
-    async def navigate_and_collect(self, url: str, competitor_id: int) -> None:
+    async def navigate_and_collect(self, url: str) -> Optional[List[Dict]]:
         """
         Navega até a página do anúncio e coleta informações adicionais.
+        Retorna os contatos encontrados na página, ou None se a visita falhou.
         """
+        contacts = None
         try:
             # Guardar a janela original
             original_window = self.driver.current_window_handle
             
             # Simular comportamento humano antes de clicar
-            self.human_like_delay(2, 4)
+            await self.delays.sleep("before_click")
             
-            # Abrir em nova aba
-            self.driver.execute_script(f"window.open('{url}', '_blank');")
+            # Abrir nova aba em branco
+            self.driver.execute_script("window.open('about:blank', '_blank');")
             
-            # Mudar para a nova aba
+            # Mudar para a nova aba e aplicar o bloqueio antes de carregar o site
             new_window = [window for window in self.driver.window_handles if window != original_window][0]
             self.driver.switch_to.window(new_window)
+            self.resource_blocker.apply(self.driver, "advertiser", url)
+            driver_pool.record_visit(self.driver, url)
+            self.driver.get(url)
             
-            # Esperar carregamento inicial
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Esperar a página estabilizar (DOM e rede), dentro do orçamento
+            await self.readiness.wait_for_page(self.driver, "advertiser")
             
             # Simular navegação humana
             scroll_height = self.driver.execute_script("return document.body.scrollHeight;")
             for i in range(3):  # Scroll 3 vezes
                 scroll_to = random.randint(0, scroll_height)
                 self.driver.execute_script(f"window.scrollTo(0, {scroll_to});")
-                self.human_like_delay(1, 2)
+                await self.delays.sleep("scroll")
             
-            # Procurar WhatsApp
-            page_source = self.driver.page_source.lower()
-            whatsapp = self.find_whatsapp_number(page_source)
-            
-            if whatsapp:
-                contact = Contact(
-                    competitor_id=competitor_id,
-                    type="whatsapp",
-                    value=whatsapp
-                )
-                self.db.add(contact)
-                self.db.commit()
+            # Procurar WhatsApp, telefones e emails
+            with metrics.timer("contact_scan", self.execution_id):
+                contacts = self.collect_contacts()
             
             # Simular comportamento humano antes de fechar
-            self.human_like_delay(
-                settings.NAVIGATION_TIME["MIN"],
-                settings.NAVIGATION_TIME["MAX"]
-            )
+            await self.delays.sleep("navigation")
+            self.resource_blocker.collect(self.driver, "advertiser")
+            # Origem final, depois dos redirecionamentos do anúncio
+            driver_pool.record_visit(self.driver, self.driver.current_url)
             
             # Fechar aba e voltar à original
             self.driver.close()
@@ -227,100 +167,195 @@ class GoogleScraper:
             
         except Exception as e:
             logger.error(f"Error navigating to {url}: {str(e)}")
+            metrics.error("navigation", self.execution_id)
             # Tentar voltar à janela original em caso de erro
             try:
                 self.driver.switch_to.window(original_window)
             except:
                 pass
 
-    async def run_search(self, keyword: Keyword) -> None:
+        return contacts
+
+    async def check_landing_page(self, url: str) -> List[Dict]:
+        """Leitura leve da landing page por HTTP, sem navegador, só para contatos."""
+        page_source = await asyncio.to_thread(fetch_landing_page, url)
+        if page_source is None:
+            return []
+        with metrics.timer("contact_scan", self.execution_id):
+            return self.find_contacts(page_source)
+
+    async def visit_advertiser(self, keyword: Keyword, ad_data: Dict, appearance: Dict, record: SearchRecord) -> List[Dict]:
+        """
+        Aplica a política de visitas ao anúncio: visita completa no navegador,
+        leitura leve por HTTP ou nenhuma visita se o domínio estiver fresco.
+        Retorna os contatos encontrados.
+        """
+        domain = ad_data["domain"]
+        decision = visit_policy.decide(domain)
+
+        if decision == VISIT:
+            try:
+                with metrics.timer("ad_navigation", self.execution_id, self.delays):
+                    contacts = await self.navigate_and_collect(ad_data["url"])
+            except BaseException:
+                visit_policy.visit_failed(domain)
+                raise
+
+            appearance["clicked"] = 1
+            record.clicks += 1
+            if contacts is None:
+                visit_policy.visit_failed(domain)
+                contacts = []
+            else:
+                visit_policy.visited(domain)
+                appearance["visited"] = 1
+            event_bus.publish(
+                self.execution_id, "competitor_clicked",
+                keyword_id=keyword.id, position=ad_data["position"], domain=domain
+            )
+            return contacts
+
+        metrics.count("skipped_visits", execution_id=self.execution_id)
+        contacts = []
+        if decision == HTTP_CHECK:
+            # A landing page do anunciante, e não a URL de clique do anúncio
+            landing_url = ad_data.get("landing_url") or f"https://{domain}/"
+            with metrics.timer("http_check", self.execution_id):
+                contacts = await self.check_landing_page(landing_url)
+            metrics.count("http_checks", execution_id=self.execution_id)
+
+        event_bus.publish(
+            self.execution_id, "competitor_skipped",
+            keyword_id=keyword.id, position=ad_data["position"], domain=domain,
+            http_checked=decision == HTTP_CHECK
+        )
+        return contacts
+
+    async def run_search(self, keyword: Keyword) -> Dict:
         """
         Executa uma pesquisa para uma palavra-chave específica.
+        Retorna um resumo com os cliques realizados e a posição da Lidery.
         """
+        self.current_keyword = keyword
+        record = SearchRecord(keyword.id, self.execution_id)
+        serp_loaded = False
+        self.search_recorded = False
+        event_bus.publish(self.execution_id, "search_started", keyword_id=keyword.id, keyword=keyword.text)
         try:
-            self.current_keyword = keyword
-            
-            # Criar registro de pesquisa
-            search = Search(
-                keyword_id=keyword.id,
-                execution_id=self.execution_id
-            )
-            self.db.add(search)
-            self.db.commit()
-            self.current_search = search
-            
-            # Acessar Google e fazer a pesquisa
-            self.driver.get("https://www.google.com")
-            self.human_like_delay()
-            
-            # Encontrar campo de busca e inserir keyword
-            search_box = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "q"))
-            )
-            search_box.clear()
-            for char in keyword.text:
-                search_box.send_keys(char)
-                self.human_like_delay(0.1, 0.3)
-            search_box.send_keys(Keys.RETURN)
+            with metrics.timer("serp_load", self.execution_id, self.delays):
+                # Acessar Google e fazer a pesquisa
+                self.resource_blocker.apply(self.driver, "serp")
+                driver_pool.record_visit(self.driver, settings.GOOGLE_URL)
+                self.driver.get(settings.GOOGLE_URL)
+                
+                # Encontrar campo de busca e inserir keyword
+                search_box = WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.NAME, "q"))
+                )
+                search_box.clear()
+                for char in keyword.text:
+                    search_box.send_keys(char)
+                    await self.delays.sleep("typing")
+                self.readiness.mark_stale(self.driver)
+                search_box.send_keys(Keys.RETURN)
+                
+                # Esperar a SERP carregar (ou sair na hora se não tiver anúncios)
+                await self.readiness.wait_for_serp(self.driver)
+                self.resource_blocker.collect(self.driver, "serp")
             
-            # Esperar carregar os anúncios
-            self.human_like_delay(2, 4)
+            # Extrair todos os anúncios de uma única leitura do page_source
+            with metrics.timer("ad_extraction", self.execution_id):
+                ads = self.serp_parser.parse(self.driver.page_source)
+            record.total_ads = len(ads)
+            serp_loaded = True
             
-            # Processar anúncios
-            for position in range(1, settings.MAX_ADS_PER_SEARCH + 1):
+            for ad_data in ads:
+                if self.stop_event.is_set():
+                    break
+
+                position = ad_data["position"]
                 try:
-                    ad_xpath = settings.XPATH_CONFIG["ad_link_pattern"].format(
-                        index=position + 2
-                    )
-                    ad_element = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, ad_xpath))
+                    appearance = record.add_appearance(ad_data)
+                    lidery = self.is_lidery(ad_data["domain"])
+                    event_bus.publish(
+                        self.execution_id, "ad_found",
+                        keyword_id=keyword.id, position=position, domain=ad_data["domain"], is_lidery=lidery
                     )
                     
-                    ad_data = self.process_ad(ad_element, position)
-                    if not ad_data:
+                    if lidery:
+                        record.lidery_position = position
                         continue
-                    
-                    competitor, is_lidery = await self.handle_competitor(ad_data)
-                    
-                    appearance = CompetitorAppearance(
-                        competitor_id=competitor.id,
-                        search_id=search.id,
-                        position=position
-                    )
-                    self.db.add(appearance)
-                    
-                    if is_lidery:
-                        search.lidery_position = position
-                        self.db.commit()
+
+                    # Modo serp_only: a aparição já está registrada, sem abrir o site
+                    if not self.visit_advertisers:
                         continue
                     
-                    # Navegar até o site se não for Lidery
-                    await self.navigate_and_collect(
-                        ad_data["url"], 
-                        competitor.id
-                    )
-                    appearance.clicked = 1
+                    # Navegar até o site se não for Lidery e não tiver sido visitado recentemente
+                    contacts = await self.visit_advertiser(keyword, ad_data, appearance, record)
+                    for contact in contacts:
+                        record.add_contact(ad_data["domain"], contact["type"], contact["value"])
+                        # Só anuncia contatos novos nesta execução
+                        if contact_store.seen(self.execution_id, ad_data["domain"], contact["type"], contact["value"]):
+                            continue
+                        metrics.count("contacts", execution_id=self.execution_id)
+                        event_bus.publish(
+                            self.execution_id, "contact_found",
+                            domain=ad_data["domain"], type=contact["type"], value=contact["value"],
+                            score=contact["score"], source=contact["source"]
+                        )
                     
                 except Exception as e:
                     logger.error(f"Error processing ad {position}: {str(e)}")
+                    metrics.error("ad", self.execution_id)
                     continue
-                
-                finally:
-                    self.db.commit()
-            
-            # Atualizar estatísticas da keyword
-            keyword.last_used = datetime.utcnow()
-            keyword.use_count += 1
-            self.db.commit()
+
+            resource_stats = self.resource_blocker.reset_stats()
+            bytes_saved = sum(
+                phase["estimated_bytes_saved"] for phase in resource_stats.values()
+            )
+            logger.info(
+                f"Search '{keyword.text}' blocked resources: "
+                f"~{bytes_saved / 1024:.0f}KB saved {resource_stats}"
+            )
+
+            record.delay_seconds = self.delays.reset()
+            metrics.count("searches", execution_id=self.execution_id)
+            metrics.count("ads", record.total_ads, self.execution_id)
+            metrics.count("clicks", record.clicks, self.execution_id)
+            event_bus.publish(
+                self.execution_id, "search_finished",
+                keyword_id=keyword.id,
+                total_ads=record.total_ads,
+                clicks=record.clicks,
+                lidery_position=record.lidery_position
+            )
+            return {
+                "clicks": record.clicks,
+                "delay_seconds": record.delay_seconds,
+                "lidery_position": record.lidery_position,
+                "resource_stats": resource_stats
+            }
             
         except Exception as e:
             logger.error(f"Error in search execution: {str(e)}")
+            event_bus.publish(self.execution_id, "error", keyword_id=keyword.id, message=str(e))
             raise
 
-    def close(self) -> None:
-        """Fecha o driver e limpa recursos."""
+        finally:
+            # Gravar a pesquisa numa única transação, mesmo se ela falhou no meio
+            record.delay_seconds += self.delays.reset()
+            if serp_loaded:
+                self.search_recorded = True
+                self.writer.add(record)
+
+    def close(self, broken: bool = False) -> None:
+        """
+        Devolve o driver ao pool.
+        Se broken for True, o driver é descartado em vez de reaproveitado.
+        """
         if self.driver:
             try:
-                self.driver.quit()
+                driver_pool.release(self.driver, broken=broken)
             except:
-                pass
\ No newline at end of file
+                pass
+            self.driver = None
\ No newline at end of file
@@ -1,40 +1,77 @@
 # backend/app/services/scraping_manager.py
 
+import asyncio
 import logging
+import threading
 from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from services.scraper import GoogleScraper
+from services.worker_pool import ScrapingWorkerPool
+from services.search_writer import SearchWriter
+from services.competitor_cache import competitor_cache
+from services.response_cache import response_cache
+from services.event_bus import event_bus
+from services.metrics import metrics
+from services.contact_store import contact_store
+from services.visit_policy import visit_policy
+from services.execution_plan import PENDING, RUNNING, execution_plan
 from models import Execution, Keyword
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 class ScrapingManager:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        stop_event: Optional[threading.Event] = None,
+        workers: Optional[int] = None,
+        delay_profile: Optional[str] = None
+    ):
         self.db = db
+        self.stop_event = stop_event or threading.Event()
+        self.workers = workers or settings.WORKER_POOL_SIZE
+        self.delay_profile = delay_profile or settings.DELAY_PROFILE
+        self.headless = False
+        self.mode = "full"
         self.current_execution: Optional[Execution] = None
-        self.scraper: Optional[GoogleScraper] = None
+        self.pool: Optional[ScrapingWorkerPool] = None
 
-    async def start_execution(self, headless: bool = False) -> Execution:
-        """Inicia uma nova execução do scraper."""
+    async def start_execution(
+        self,
+        headless: bool = False,
+        execution_id: Optional[int] = None,
+        mode: str = "full"
+    ) -> Execution:
+        """
+        Inicia uma nova execução do scraper.
+        Se execution_id for informado, reutiliza o registro já criado.
+        mode é full (visita os anunciantes) ou serp_only (só as posições).
+        """
+        execution = None
         try:
-            # Criar novo registro de execução
-            execution = Execution(
-                execution_mode="headless" if headless else "visible"
-            )
-            self.db.add(execution)
-            self.db.commit()
+            if execution_id is not None:
+                execution = self.db.query(Execution).filter(
+                    Execution.id == execution_id
+                ).first()
+                if not execution:
+                    raise ValueError(f"Execution {execution_id} not found")
+            else:
+                # Criar novo registro de execução
+                execution = Execution(execution_mode=mode, headless=headless)
+                self.db.add(execution)
+                self.db.commit()
             
+            # Gravar os parâmetros efetivos para que uma retomada use os mesmos
+            if execution.workers is None or execution.delay_profile is None:
+                execution.workers = execution.workers or self.workers
+                execution.delay_profile = execution.delay_profile or self.delay_profile
+                self.db.commit()
+
             self.current_execution = execution
-            
-            # Inicializar scraper
-            self.scraper = GoogleScraper(
-                self.db, 
-                execution.id, 
-                headless
-            )
-            self.scraper.configure_driver()
+            self.headless = headless
+            self.mode = execution.execution_mode or mode
+            event_bus.publish(execution.id, "execution_started", headless=headless, mode=self.mode)
             
             logger.info(f"Started new execution with ID {execution.id}")
             return execution
@@ -47,17 +84,28 @@ class ScrapingManager:
                 self.db.commit()
             raise
 
-    async def stop_execution(self) -> None:
+    async def stop_execution(
+        self,
+        status: str = "completed",
+        error_message: Optional[str] = None
+    ) -> None:
         """Para a execução atual do scraper."""
+        self.stop_event.set()
         try:
             if self.current_execution:
                 self.current_execution.end_time = datetime.utcnow()
                 self.current_execution.is_running = False
-                self.current_execution.status = "completed"
+                self.current_execution.status = status
+                if error_message:
+                    self.current_execution.error_message = error_message
+                self.current_execution.metrics_summary = metrics.pop_summary(self.current_execution.id)
                 self.db.commit()
-            
-            if self.scraper:
-                self.scraper.close()
+                contact_store.forget(self.current_execution.id)
+                response_cache.invalidate()
+                event_bus.publish(
+                    self.current_execution.id, "execution_finished",
+                    status=status, error_message=error_message
+                )
                 
             logger.info("Execution stopped successfully")
             
@@ -68,35 +116,57 @@ class ScrapingManager:
     async def run_scraping(self) -> None:
         """Executa o processo de scraping para todas as keywords ativas."""
         try:
-            # Obter keywords ativas
-            keywords = self.db.query(Keyword).filter(
-                Keyword.is_active == True
-            ).all()
+            # Regravar pesquisas que ficaram no spool em execuções anteriores
+            SearchWriter(self.db).replay_spool()
+            competitor_cache.warm(self.db)
+            visit_policy.warm(self.db)
             
-            if not keywords:
-                logger.warning("No active keywords found")
+            execution_id = self.current_execution.id
+            if execution_plan.exists(self.db, execution_id):
+                # Execução retomada: só as keywords que faltam, na ordem do plano
+                progress = execution_plan.recover(self.db, execution_id)
+                keyword_ids = execution_plan.remaining(self.db, execution_id)
+                logger.info(f"Resuming execution {execution_id}: {progress}")
+            else:
+                # Obter keywords ativas
+                keywords = self.db.query(Keyword).filter(
+                    Keyword.is_active == True
+                ).all()
+
+                if not keywords:
+                    logger.warning("No active keywords found")
+                    return
+
+                # Gravar o plano com as keywords embaralhadas para parecer mais natural
+                keyword_ids = execution_plan.create(self.db, execution_id, [keyword.id for keyword in keywords])
+
+            if not keyword_ids:
                 return
             
-            # Embaralhar keywords para parecer mais natural
-            import random
-            random.shuffle(keywords)
+            # Distribuir as keywords entre os workers do pool
+            self.pool = ScrapingWorkerPool(
+                execution_id,
+                self.headless,
+                size=self.workers,
+                stop_event=self.stop_event,
+                delay_profile=self.delay_profile,
+                visit_advertisers=self.mode != "serp_only"
+            )
+            await asyncio.to_thread(self.pool.run, keyword_ids)
             
-            # Executar pesquisa para cada keyword
-            for keyword in keywords:
-                if not self.current_execution.is_running:
-                    break
-                    
-                try:
-                    await self.scraper.run_search(keyword)
-                    
-                    # Atualizar estatísticas da execução
-                    self.current_execution.total_searches += 1
-                    self.db.commit()
-                    
-                except Exception as e:
-                    logger.error(f"Error processing keyword {keyword.text}: {str(e)}")
-                    continue
+            # Os contadores foram atualizados pelos workers em outras sessões
+            self.db.refresh(self.current_execution)
+            
+            # Workers que pararam antes da fila esvaziar (sem driver, restarts
+            # esgotados) deixam keywords do plano sem processar
+            progress = execution_plan.progress(self.db, execution_id)
+            unfinished = progress[PENDING] + progress[RUNNING]
+            if unfinished and not self.stop_event.is_set():
+                message = f"{unfinished} keywords left unprocessed: {self.pool.last_error or 'workers stopped'}"
+                execution_plan.fail_remaining(self.db, execution_id, message)
+                self.db.commit()
+                raise RuntimeError(message)
                 
         except Exception as e:
             logger.error(f"Error in scraping execution: {str(e)}")
-            raise
\ No newline at end of file
+            raise
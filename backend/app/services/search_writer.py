@@ -0,0 +1,309 @@
+# backend/app/services/search_writer.py
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from config import settings
+from services.competitor_cache import competitor_cache
+from services.rollups import apply_rollups
+from services.contact_store import contact_store
+from services.response_cache import response_cache
+from services.event_bus import event_bus
+from services.metrics import metrics
+from services.execution_plan import execution_plan
+from models import (
+    Execution,
+    Keyword,
+    Search,
+    CompetitorAppearance
+)
+
+logger = logging.getLogger(__name__)
+
+# Protege o arquivo de spool compartilhado entre os workers
+_spool_lock = threading.Lock()
+
+class SearchRecord:
+    """
+    Resultado de uma pesquisa mantido em memória até ser gravado.
+    Competidores são referenciados pelo domínio, pois o ID só é
+    conhecido no momento da gravação.
+    """
+
+    def __init__(
+        self,
+        keyword_id: int,
+        execution_id: int,
+        timestamp: Optional[datetime] = None
+    ):
+        self.keyword_id = keyword_id
+        self.execution_id = execution_id
+        self.timestamp = timestamp or datetime.utcnow()
+        self.total_ads = 0
+        self.lidery_position: Optional[int] = None
+        self.clicks = 0
+        self.delay_seconds = 0.0
+        self.appearances: List[Dict] = []
+        self.contacts: List[Dict] = []
+
+    def add_appearance(self, ad_data: Dict) -> Dict:
+        appearance = {
+            "domain": ad_data["domain"],
+            "business_name": ad_data.get("text", ""),
+            "position": ad_data["position"],
+            "clicked": 0,
+            "visited": 0,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        self.appearances.append(appearance)
+        return appearance
+
+    def add_contact(self, domain: str, contact_type: str, value: str) -> None:
+        self.contacts.append({
+            "domain": domain,
+            "type": contact_type,
+            "value": value,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    def to_dict(self) -> Dict:
+        return {
+            "keyword_id": self.keyword_id,
+            "execution_id": self.execution_id,
+            "timestamp": self.timestamp.isoformat(),
+            "total_ads": self.total_ads,
+            "lidery_position": self.lidery_position,
+            "clicks": self.clicks,
+            "delay_seconds": self.delay_seconds,
+            "appearances": self.appearances,
+            "contacts": self.contacts
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SearchRecord":
+        record = cls(
+            data["keyword_id"],
+            data["execution_id"],
+            datetime.fromisoformat(data["timestamp"])
+        )
+        record.total_ads = data.get("total_ads", 0)
+        record.lidery_position = data.get("lidery_position")
+        record.clicks = data.get("clicks", 0)
+        record.delay_seconds = data.get("delay_seconds", 0.0)
+        record.appearances = data.get("appearances", [])
+        record.contacts = data.get("contacts", [])
+        return record
+
+class SearchWriter:
+    """
+    Unit of work das pesquisas: acumula os registros e grava pesquisa,
+    aparições, competidores, contatos (upsert), rollups e contadores
+    numa única transação.
+
+    Se a gravação falhar, os registros vão para um arquivo de spool
+    (JSON lines) e são regravados por replay_spool() na próxima execução.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = settings.WRITE_BATCH_SIZE,
+        spool_path: Path = settings.WRITE_SPOOL_FILE
+    ):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.spool_path = Path(spool_path)
+        self.pending: List[SearchRecord] = []
+        self.pending_delay: Dict[int, float] = {}
+
+    def add(self, record: SearchRecord) -> None:
+        """Enfileira um registro e grava o lote quando ele estiver cheio."""
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def add_delay(self, execution_id: int, seconds: float) -> None:
+        """Acumula atrasos feitos fora das pesquisas para o próximo flush."""
+        if seconds > 0:
+            self.pending_delay[execution_id] = self.pending_delay.get(execution_id, 0.0) + seconds
+
+    def flush(self) -> int:
+        """Grava os registros pendentes. Retorna quantas pesquisas foram gravadas."""
+        if not self.pending and not self.pending_delay:
+            return 0
+
+        records, self.pending = self.pending, []
+        delays, self.pending_delay = self.pending_delay, {}
+
+        # Um writer pertence a um worker de uma execução
+        execution_id = records[0].execution_id if records else next(iter(delays))
+        try:
+            with metrics.timer("db_commit", execution_id):
+                competitor_ids = self._persist(records, delays)
+                self.db.commit()
+            competitor_cache.remember(competitor_ids)
+            response_cache.invalidate()
+            return len(records)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error flushing {len(records)} searches, spooling to disk: {str(e)}")
+            metrics.error("db_commit", execution_id)
+            for execution_id in {record.execution_id for record in records}:
+                event_bus.publish(execution_id, "error", message=f"Searches spooled to disk: {str(e)}")
+            self._spool(records)
+            return 0
+
+    def _persist(
+        self,
+        records: List[SearchRecord],
+        delays: Optional[Dict[int, float]] = None
+    ) -> Dict[str, int]:
+        """Adiciona o lote à transação corrente. Retorna os IDs dos competidores."""
+        # Um único upsert para todos os competidores vistos no lote
+        competitor_ids = competitor_cache.upsert(self.db, self._sightings(records))
+        execution_totals: Dict[int, Dict] = {}
+        contacts: List[Dict] = []
+
+        for record in records:
+            search = Search(
+                keyword_id=record.keyword_id,
+                execution_id=record.execution_id,
+                timestamp=record.timestamp,
+                total_ads=record.total_ads,
+                lidery_position=record.lidery_position
+            )
+            self.db.add(search)
+
+            for appearance in record.appearances:
+                self.db.add(CompetitorAppearance(
+                    competitor_id=competitor_ids[appearance["domain"]],
+                    search=search,
+                    position=appearance["position"],
+                    clicked=appearance["clicked"],
+                    timestamp=datetime.fromisoformat(appearance["timestamp"])
+                ))
+
+            for contact in record.contacts:
+                contacts.append({
+                    "competitor_id": competitor_ids[contact["domain"]],
+                    "type": contact["type"],
+                    "value": contact["value"],
+                    "seen_at": datetime.fromisoformat(contact["timestamp"])
+                })
+
+            # A keyword só conta como concluída no plano junto com a pesquisa gravada
+            execution_plan.mark_completed(self.db, record.execution_id, record.keyword_id)
+
+            self.db.query(Keyword).filter(
+                Keyword.id == record.keyword_id
+            ).update({
+                Keyword.last_used: record.timestamp,
+                Keyword.use_count: Keyword.use_count + 1
+            }, synchronize_session=False)
+
+            totals = execution_totals.setdefault(record.execution_id, {
+                "searches": 0, "clicks": 0, "lidery_found": 0, "delay_seconds": 0.0
+            })
+            totals["searches"] += 1
+            totals["clicks"] += record.clicks
+            totals["lidery_found"] += 1 if record.lidery_position else 0
+            totals["delay_seconds"] += record.delay_seconds
+
+        for execution_id, seconds in (delays or {}).items():
+            totals = execution_totals.setdefault(execution_id, {
+                "searches": 0, "clicks": 0, "lidery_found": 0, "delay_seconds": 0.0
+            })
+            totals["delay_seconds"] += seconds
+
+        # Contatos únicos: repetições só somam times_found e avançam last_seen
+        contact_store.upsert(self.db, contacts)
+
+        # Rollups diários dos dashboards, na mesma transação
+        apply_rollups(self.db, records, competitor_ids)
+
+        # Contadores da execução incrementados no banco, seguros entre workers
+        for execution_id, totals in execution_totals.items():
+            self.db.query(Execution).filter(
+                Execution.id == execution_id
+            ).update({
+                Execution.total_searches: Execution.total_searches + totals["searches"],
+                Execution.total_clicks: Execution.total_clicks + totals["clicks"],
+                Execution.total_lidery_found: Execution.total_lidery_found + totals["lidery_found"],
+                Execution.delay_seconds: Execution.delay_seconds + totals["delay_seconds"]
+            }, synchronize_session=False)
+
+        return competitor_ids
+
+    def _sightings(self, records: List[SearchRecord]) -> Dict[str, Dict]:
+        """Agrupa por domínio as aparições do lote (contatos entram sem contar aparição)."""
+        sightings: Dict[str, Dict] = {}
+        for record in records:
+            for appearance in record.appearances:
+                seen_at = datetime.fromisoformat(appearance["timestamp"])
+                data = sightings.setdefault(appearance["domain"], {
+                    "business_name": appearance["business_name"],
+                    "appearances": 0,
+                    "seen_at": seen_at,
+                    "visited_at": None
+                })
+                data["appearances"] += 1
+                if appearance.get("visited"):
+                    data["visited_at"] = max(data["visited_at"] or seen_at, seen_at)
+                data["seen_at"] = max(data["seen_at"], seen_at)
+                data["business_name"] = data["business_name"] or appearance["business_name"]
+
+            for contact in record.contacts:
+                sightings.setdefault(contact["domain"], {
+                    "business_name": None,
+                    "appearances": 0,
+                    "seen_at": datetime.fromisoformat(contact["timestamp"])
+                })
+        return sightings
+
+    def _spool(self, records: List[SearchRecord]) -> None:
+        """Guarda em disco os registros que não puderam ser gravados."""
+        if not records:
+            return
+        try:
+            with _spool_lock:
+                with open(self.spool_path, "a", encoding="utf-8") as spool:
+                    for record in records:
+                        spool.write(json.dumps(record.to_dict()) + "\n")
+                    spool.flush()
+                    os.fsync(spool.fileno())
+        except Exception as e:
+            logger.error(f"Error spooling {len(records)} searches, data lost: {str(e)}")
+
+    def replay_spool(self) -> int:
+        """Regrava as pesquisas deixadas no spool por falhas anteriores."""
+        with _spool_lock:
+            if not self.spool_path.exists():
+                return 0
+            replay_path = self.spool_path.with_suffix(".replaying")
+            self.spool_path.replace(replay_path)
+
+        records = []
+        with open(replay_path, encoding="utf-8") as spool:
+            for line in spool:
+                if line.strip():
+                    records.append(SearchRecord.from_dict(json.loads(line)))
+
+        try:
+            competitor_ids = self._persist(records)
+            self.db.commit()
+            competitor_cache.remember(competitor_ids)
+            response_cache.invalidate()
+            replay_path.unlink()
+            logger.info(f"Replayed {len(records)} spooled searches")
+            return len(records)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error replaying spooled searches: {str(e)}")
+            self._spool(records)
+            replay_path.unlink()
+            return 0
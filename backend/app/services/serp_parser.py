@@ -0,0 +1,145 @@
+# backend/app/services/serp_parser.py
+
+import abc
+import logging
+from typing import Dict, List, Optional, Type
+from urllib.parse import urlparse
+from lxml import html as lxml_html
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+def extract_domain(url: str) -> str:
+    """Extrai o domínio base de uma URL."""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc
+        return domain.replace("www.", "")
+    except Exception:
+        return url
+
+class AdSelectorStrategy(abc.ABC):
+    """
+    Estratégia de localização dos links de anúncio numa SERP já parseada.
+    Subclasses retornam os elementos <a> dos anúncios na ordem da página.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    def find_ads(self, tree) -> List:
+        """Elementos <a> dos anúncios encontrados na árvore, na ordem da página."""
+
+class TextAdContainerStrategy(AdSelectorStrategy):
+    """Anúncios marcados pelo Google com o atributo data-text-ad."""
+
+    name = "text_ad_container"
+
+    def find_ads(self, tree) -> List:
+        anchors = []
+        for container in tree.xpath('//*[@data-text-ad]'):
+            links = container.xpath('.//a[@href]')
+            if links:
+                anchors.append(links[0])
+        return anchors
+
+class AdLinkAttributeStrategy(AdSelectorStrategy):
+    """Links que carregam a URL de destino do anúncio (data-pcu / data-rw)."""
+
+    name = "ad_link_attributes"
+
+    def find_ads(self, tree) -> List:
+        return tree.xpath('//a[@href and (@data-pcu or @data-rw)]')
+
+class XPathTemplateStrategy(AdSelectorStrategy):
+    """Padrão posicional de settings.XPATH_PATTERNS usado originalmente pelo scraper."""
+
+    name = "xpath_template"
+
+    def __init__(self, first_index: int = 3, max_ads: int = settings.MAX_ADS_PER_SEARCH):
+        self.first_index = first_index
+        self.max_ads = max_ads
+
+    def find_ads(self, tree) -> List:
+        anchors = []
+        for index in range(self.first_index, self.first_index + self.max_ads):
+            found = tree.xpath(settings.XPATH_PATTERNS["ad_link_pattern"].format(index=index))
+            if found:
+                anchors.append(found[0])
+        return anchors
+
+# Estratégias disponíveis, referenciadas por nome em settings.SERP_SELECTOR_STRATEGIES
+SELECTOR_STRATEGIES: Dict[str, Type[AdSelectorStrategy]] = {
+    TextAdContainerStrategy.name: TextAdContainerStrategy,
+    AdLinkAttributeStrategy.name: AdLinkAttributeStrategy,
+    XPathTemplateStrategy.name: XPathTemplateStrategy
+}
+
+class SerpParser:
+    """
+    Extrai todos os anúncios de um único snapshot de page_source.
+
+    As estratégias são tentadas em ordem; a primeira que encontrar
+    anúncios define o resultado.
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[List[AdSelectorStrategy]] = None,
+        max_ads: int = settings.MAX_ADS_PER_SEARCH
+    ):
+        self.strategies = strategies or [
+            SELECTOR_STRATEGIES[name]() for name in settings.SERP_SELECTOR_STRATEGIES
+        ]
+        self.max_ads = max_ads
+
+    def parse(self, page_source: str) -> List[Dict]:
+        """Retorna os dados de cada anúncio encontrado, com posição a partir de 1."""
+        if not page_source:
+            return []
+
+        try:
+            tree = lxml_html.fromstring(page_source)
+        except Exception as e:
+            logger.error(f"Error parsing SERP html: {str(e)}")
+            return []
+
+        for strategy in self.strategies:
+            anchors = strategy.find_ads(tree)
+            if anchors:
+                ads = []
+                for anchor in anchors[:self.max_ads]:
+                    ad = self._ad_from_anchor(anchor, len(ads) + 1)
+                    if ad:
+                        ads.append(ad)
+                logger.debug(f"Found {len(ads)} ads with strategy {strategy.name}")
+                return ads
+
+        return []
+
+    def _ad_from_anchor(self, anchor, position: int) -> Optional[Dict]:
+        href = anchor.get("href")
+        if not href:
+            return None
+
+        # data-pcu guarda a URL de destino real quando o href é de rastreamento
+        landing_url = (anchor.get("data-pcu") or "").split(",")[0].strip() or href
+
+        display_domain = ""
+        dtld = anchor.xpath('.//*[@data-dtld]/@data-dtld')
+        if dtld:
+            display_domain = dtld[0]
+
+        ad_text = display_domain
+        if not ad_text:
+            labels = anchor.xpath('.//*[@aria-label]/@aria-label')
+            ad_text = labels[0] if labels else anchor.text_content().strip()
+
+        return {
+            "url": href,
+            "landing_url": landing_url,
+            "domain": extract_domain(landing_url),
+            "display_domain": display_domain,
+            "position": position,
+            "text": ad_text
+        }
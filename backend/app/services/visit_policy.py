@@ -0,0 +1,134 @@
+# backend/app/services/visit_policy.py
+
+import fnmatch
+import logging
+import threading
+import urllib.request
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from sqlalchemy.orm import Session
+from models import Competitor
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+VISIT = "visit"
+SKIP = "skip"
+HTTP_CHECK = "http_check"
+
+def fetch_landing_page(url: str) -> Optional[str]:
+    """
+    Baixa o HTML da página sem navegador (sem JS, imagens ou CSS).
+    Lê no máximo VISIT_HTTP_MAX_BYTES. Retorna None se a página não puder ser lida.
+    """
+    if urlparse(url).scheme not in ("http", "https"):
+        return None
+    request = urllib.request.Request(url, headers={
+        "User-Agent": settings.USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml"
+    })
+    try:
+        with urllib.request.urlopen(request, timeout=settings.VISIT_HTTP_TIMEOUT) as response:
+            if "html" not in response.headers.get("Content-Type", "text/html"):
+                return None
+            body = response.read(settings.VISIT_HTTP_MAX_BYTES)
+            charset = response.headers.get_content_charset() or "utf-8"
+            return body.decode(charset, errors="replace")
+    except Exception as e:
+        logger.warning(f"Error fetching landing page {url}: {str(e)}")
+        return None
+
+class VisitPolicy:
+    """
+    Decide se o site de um anunciante precisa ser visitado de novo.
+
+    Um domínio visitado com sucesso há menos de VISIT_FRESHNESS_HOURS
+    (ou do valor em VISIT_FRESHNESS_OVERRIDES para ele) está fresco: a
+    aparição é registrada sem abrir o site. Com VISIT_HTTP_CHECK, um
+    domínio fresco ainda recebe uma leitura leve da landing page por
+    HTTP, no máximo uma vez a cada VISIT_HTTP_CHECK_INTERVAL minutos.
+
+    As datas ficam em memória, compartilhadas pelos workers, e são
+    persistidas em Competitor.last_visited pelo SearchWriter.
+    """
+
+    def __init__(
+        self,
+        freshness_hours: float = settings.VISIT_FRESHNESS_HOURS,
+        overrides: Optional[Dict[str, float]] = None,
+        http_check: bool = settings.VISIT_HTTP_CHECK,
+        http_check_interval: float = settings.VISIT_HTTP_CHECK_INTERVAL
+    ):
+        self.freshness_hours = freshness_hours
+        self.overrides = overrides if overrides is not None else settings.VISIT_FRESHNESS_OVERRIDES
+        self.http_check = http_check
+        self.http_check_interval = timedelta(minutes=http_check_interval)
+        self._last_visited: Dict[str, datetime] = {}
+        self._last_checked: Dict[str, datetime] = {}
+        self._in_flight: Dict[str, Optional[datetime]] = {}
+        self._lock = threading.Lock()
+
+    def warm(self, db: Session) -> int:
+        """Carrega as últimas visitas registradas no banco. Retorna quantos domínios."""
+        rows = db.query(Competitor.domain, Competitor.last_visited).filter(
+            Competitor.last_visited.isnot(None)
+        ).all()
+        with self._lock:
+            for domain, last_visited in rows:
+                current = self._last_visited.get(domain)
+                if current is None or last_visited > current:
+                    self._last_visited[domain] = last_visited
+            return len(self._last_visited)
+
+    def freshness_for(self, domain: str) -> timedelta:
+        """Janela de frescor do domínio; overrides aceitam curingas (*.exemplo.com.br)."""
+        for pattern, hours in self.overrides.items():
+            if fnmatch.fnmatch(domain, pattern):
+                return timedelta(hours=hours)
+        return timedelta(hours=self.freshness_hours)
+
+    def decide(self, domain: str, now: Optional[datetime] = None) -> str:
+        """
+        Retorna VISIT, SKIP ou HTTP_CHECK para o domínio.
+
+        Um VISIT já reserva o domínio, para que outro worker não o visite
+        ao mesmo tempo; visit_failed() desfaz a reserva.
+        """
+        now = now or datetime.utcnow()
+        freshness = self.freshness_for(domain)
+
+        with self._lock:
+            last_visited = self._last_visited.get(domain)
+            if freshness <= timedelta(0) or last_visited is None or now - last_visited >= freshness:
+                self._in_flight[domain] = last_visited
+                self._last_visited[domain] = now
+                return VISIT
+
+            if self.http_check:
+                last_checked = self._last_checked.get(domain)
+                if last_checked is None or now - last_checked >= self.http_check_interval:
+                    self._last_checked[domain] = now
+                    return HTTP_CHECK
+
+            return SKIP
+
+    def visited(self, domain: str, at: Optional[datetime] = None) -> None:
+        """Confirma a visita ao domínio."""
+        with self._lock:
+            self._in_flight.pop(domain, None)
+            self._last_visited[domain] = at or datetime.utcnow()
+
+    def visit_failed(self, domain: str) -> None:
+        """Devolve o domínio ao estado anterior à reserva feita por decide()."""
+        with self._lock:
+            if domain not in self._in_flight:
+                return
+            previous = self._in_flight.pop(domain)
+            if previous is None:
+                self._last_visited.pop(domain, None)
+            else:
+                self._last_visited[domain] = previous
+
+# Instância global da política de visitas
+visit_policy = VisitPolicy()
@@ -0,0 +1,285 @@
+# backend/app/services/worker_pool.py
+
+import asyncio
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional
+from selenium.common.exceptions import WebDriverException
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from services.scraper import GoogleScraper
+from services.delay_policy import DelayPolicy
+from services.event_bus import event_bus
+from services.metrics import metrics
+from services.execution_plan import execution_plan
+from models import Execution, Keyword
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class ScrapingWorkerPool:
+    """
+    Pool de workers independentes, cada um com seu próprio Chrome e sessão
+    de banco, consumindo keywords de uma fila compartilhada.
+    """
+
+    def __init__(
+        self,
+        execution_id: int,
+        headless: bool = False,
+        size: int = settings.WORKER_POOL_SIZE,
+        stop_event: Optional[threading.Event] = None,
+        delay_profile: str = settings.DELAY_PROFILE,
+        visit_advertisers: bool = True
+    ):
+        self.execution_id = execution_id
+        self.headless = headless
+        self.size = max(1, size)
+        self.stop_event = stop_event or threading.Event()
+        self.delay_profile = delay_profile
+        self.visit_advertisers = visit_advertisers
+        self.queue: "queue.Queue[int]" = queue.Queue()
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self.stats = {
+            "searches": 0,
+            "clicks": 0,
+            "lidery_found": 0,
+            "errors": 0,
+            "drivers_acquired": 0,
+            "drivers_replaced": 0,
+            "delay_seconds": 0.0,
+            "bytes_transferred": 0,
+            "estimated_bytes_saved": 0
+        }
+        # Totais que a execução já tinha no banco ao iniciar o pool (retomada)
+        self.counters_base = {"searches": 0, "clicks": 0, "lidery_found": 0}
+
+    def run(self, keyword_ids: List[int]) -> Dict:
+        """Distribui as keywords entre os workers e aguarda todos terminarem."""
+        self._load_counters_base()
+        for keyword_id in keyword_ids:
+            self.queue.put(keyword_id)
+        metrics.queue_depth.inc(len(keyword_ids))
+
+        workers = min(self.size, len(keyword_ids))
+        for index in range(workers):
+            thread = threading.Thread(
+                target=self._run_worker,
+                args=(index,),
+                name=f"execution-{self.execution_id}-worker-{index}",
+                daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+        for thread in self._threads:
+            thread.join()
+
+        # Keywords que ficaram na fila (execução cancelada ou workers parados)
+        metrics.queue_depth.dec(self.queue.qsize())
+
+        logger.info(f"Worker pool for execution {self.execution_id} finished: {self.stats}")
+        return self.stats
+
+    def _load_counters_base(self) -> None:
+        """
+        Lê os totais já gravados da execução. Numa execução retomada o
+        snapshot do stream mostra esses totais, e os eventos counters
+        continuam a partir deles em vez de recomeçar do zero.
+        """
+        db = SessionLocal()
+        try:
+            execution = db.get(Execution, self.execution_id)
+            if execution:
+                self.counters_base = {
+                    "searches": execution.total_searches or 0,
+                    "clicks": execution.total_clicks or 0,
+                    "lidery_found": execution.total_lidery_found or 0
+                }
+        finally:
+            db.close()
+
+    def _increment(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def _run_worker(self, index: int) -> None:
+        db = SessionLocal()
+        try:
+            asyncio.run(self._worker_loop(index, db))
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Worker {index} of execution {self.execution_id} crashed: {str(e)}")
+        finally:
+            db.close()
+
+    async def _worker_loop(self, index: int, db: Session) -> None:
+        delays = DelayPolicy(self.delay_profile, stop_event=self.stop_event)
+        scraper = GoogleScraper(
+            db,
+            self.execution_id,
+            self.headless,
+            stop_event=self.stop_event,
+            delay_policy=delays,
+            visit_advertisers=self.visit_advertisers
+        )
+        failures = 0
+
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    keyword_id = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                metrics.queue_depth.dec()
+
+                keyword = db.query(Keyword).filter(Keyword.id == keyword_id).first()
+                if not keyword:
+                    execution_plan.fail(db, self.execution_id, keyword_id, "Keyword not found")
+                    continue
+
+                # Cada pesquisa usa um driver limpo obtido do pool
+                if not await self._acquire_driver(index, scraper):
+                    # Sem driver este worker não consegue continuar;
+                    # devolve a keyword para os demais workers
+                    self.queue.put(keyword_id)
+                    metrics.queue_depth.inc()
+                    break
+
+                attempt = execution_plan.start(db, self.execution_id, keyword_id)
+                broken = False
+                retry_after = None
+                try:
+                    result = await scraper.run_search(keyword)
+                    self._record_search(result)
+                    failures = 0
+
+                except WebDriverException as e:
+                    broken = True
+                    failures += 1
+                    self._increment("errors")
+                    self._increment("drivers_replaced")
+                    metrics.error("webdriver", self.execution_id)
+                    logger.error(f"Worker {index} driver failed on keyword {keyword.text}: {str(e)}")
+                    retry_after = self._handle_failure(keyword_id, attempt, e, db, scraper.search_recorded, transient=True)
+
+                except Exception as e:
+                    self._increment("errors")
+                    metrics.error("search", self.execution_id)
+                    logger.error(f"Worker {index} error processing keyword {keyword.text}: {str(e)}")
+                    db.rollback()
+                    self._handle_failure(keyword_id, attempt, e, db, scraper.search_recorded, transient=False)
+
+                finally:
+                    # Drivers com falha são descartados e substituídos pelo pool
+                    scraper.close(broken=broken)
+
+                if retry_after is not None:
+                    # Espera antes de devolver a keyword à fila, sem segurar driver
+                    await asyncio.to_thread(self.stop_event.wait, retry_after)
+                    if not self.stop_event.is_set():
+                        self.queue.put(keyword_id)
+                        metrics.queue_depth.inc()
+
+                if failures > settings.MAX_DRIVER_RESTARTS:
+                    logger.error(f"Worker {index} exceeded driver restarts, stopping")
+                    break
+
+                # Pausa entre pesquisas do mesmo worker
+                if not self.queue.empty():
+                    await delays.sleep("between_searches")
+                    seconds = delays.reset()
+                    scraper.writer.add_delay(self.execution_id, seconds)
+                    self._increment("delay_seconds", seconds)
+
+        finally:
+            # Gravar o que ainda estiver pendente no lote
+            scraper.writer.flush()
+
+    async def _acquire_driver(self, index: int, scraper: GoogleScraper) -> bool:
+        """
+        Obtém um driver para o scraper, tentando de novo com espera
+        exponencial até MAX_DRIVER_RESTARTS vezes. Retorna se conseguiu.
+        """
+        for attempt in range(settings.MAX_DRIVER_RESTARTS + 1):
+            if attempt:
+                backoff = min(
+                    settings.DRIVER_START_BACKOFF["MAX"],
+                    settings.DRIVER_START_BACKOFF["BASE"] * 2 ** (attempt - 1)
+                )
+                await asyncio.to_thread(self.stop_event.wait, backoff)
+                if self.stop_event.is_set():
+                    return False
+                metrics.count("retries", execution_id=self.execution_id)
+
+            try:
+                scraper.configure_driver()
+                self._increment("drivers_acquired")
+                return True
+            except Exception as e:
+                metrics.error("driver_start", self.execution_id)
+                self.last_error = str(e)
+                self._increment("errors")
+                logger.error(f"Worker {index} could not start a driver (attempt {attempt + 1}): {str(e)}")
+
+        event_bus.publish(self.execution_id, "error", message=f"Could not start a driver: {self.last_error}")
+        return False
+
+    def _handle_failure(
+        self,
+        keyword_id: int,
+        attempt: int,
+        error: Exception,
+        db: Session,
+        recorded: bool,
+        transient: bool
+    ) -> Optional[float]:
+        """
+        Atualiza o plano após uma pesquisa com erro.
+        Retorna a espera antes de tentar de novo, ou None se não houver nova tentativa.
+        """
+        if recorded:
+            # O SERP já foi lido e a pesquisa parcial vai ser gravada pelo writer
+            return None
+
+        if transient and attempt < execution_plan.max_attempts and not self.stop_event.is_set():
+            execution_plan.retry(db, self.execution_id, keyword_id, str(error))
+            metrics.count("retries", execution_id=self.execution_id)
+            seconds = execution_plan.backoff_seconds(attempt)
+            event_bus.publish(
+                self.execution_id, "keyword_retry",
+                keyword_id=keyword_id, attempt=attempt, retry_in=round(seconds, 1), message=str(error)
+            )
+            return seconds
+
+        if transient and self.stop_event.is_set():
+            # Cancelada: a keyword continua pendente no plano
+            execution_plan.retry(db, self.execution_id, keyword_id, str(error))
+            return None
+
+        execution_plan.fail(db, self.execution_id, keyword_id, str(error))
+        event_bus.publish(
+            self.execution_id, "keyword_failed",
+            keyword_id=keyword_id, attempts=attempt, message=str(error)
+        )
+        return None
+
+    def _record_search(self, result: Dict) -> None:
+        """Acumula os números da pesquisa nas estatísticas do pool."""
+        self._increment("searches")
+        self._increment("clicks", result.get("clicks", 0))
+        self._increment("lidery_found", 1 if result.get("lidery_position") else 0)
+        self._increment("delay_seconds", result.get("delay_seconds", 0.0))
+
+        for phase_stats in result.get("resource_stats", {}).values():
+            self._increment("bytes_transferred", phase_stats["bytes_transferred"])
+            self._increment("estimated_bytes_saved", phase_stats["estimated_bytes_saved"])
+
+        # Totais da execução, na mesma escala do snapshot (erros são só desta rodada)
+        with self._lock:
+            counters = {key: self.counters_base[key] + self.stats[key] for key in self.counters_base}
+            counters["errors"] = self.stats["errors"]
+        event_bus.publish(self.execution_id, "counters", **counters)
@@ -0,0 +1,247 @@
+# backend/benchmarks/api_benchmark.py
+
+"""
+Benchmark de concorrência da API sob carga do dashboard.
+
+Sobe a API com uvicorn numa thread, sobre um banco SQLite sintético
+(os mesmos dados do query_benchmark), e dispara --clients clientes em
+paralelo, cada um carregando o dashboard em loop: as rotas de
+performance, competition, contacts, keywords e execution que o frontend
+chama ao abrir a página. Em paralelo, uma sonda chama a rota raiz, que
+não toca no banco: a latência dela mostra quanto o event loop ficou
+bloqueado pelas consultas.
+
+O cache de respostas fica desligado para que toda requisição chegue ao
+banco. Com --write-interval, uma thread grava no banco como um scraper
+em andamento. O resultado traz p50/p95/p99 por rota, da carga total e
+da sonda.
+
+Uso (a partir de backend/):
+
+    python benchmarks/api_benchmark.py --clients 32 --duration 20 --output api.json
+    python benchmarks/api_benchmark.py --db /tmp/queries.db --write-interval 0.05
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+APP_DIR = BENCHMARKS_DIR.parent / "app"
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+from scraper_benchmark import git_revision, summarize
+from query_benchmark import ROLLUP_TABLES, populate
+
+# Requisições de uma carga do dashboard (caminhos relativos ao prefixo da API)
+DASHBOARD = {
+    "daily_stats": "/performance/daily-stats",
+    "lidery_positions": "/performance/lidery-positions?days=30",
+    "execution_calendar": "/performance/execution-calendar",
+    "top_competitors": "/competition/top-competitors?limit=10&days=30",
+    "competitor_details": "/competition/competitor/1/details?days=30",
+    "contacts": "/contacts/?limit=50&include_total=true",
+    "keywords": "/keywords/?limit=50&include_total=true",
+    "executions": "/execution/list?limit=10",
+    "execution_status": "/execution/status/1"
+}
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def prepare_database(args) -> Path:
+    """Gera o banco sintético (se preciso) antes de importar o app."""
+    db_path = Path(args.db) if args.db else Path(tempfile.mkdtemp(prefix="api-bench-")) / "api.db"
+    fresh = not db_path.exists()
+
+    # Configuração precisa estar no ambiente antes de importar o app
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    os.environ["DRIVER_POOL_PREWARM"] = "0"
+    sys.path.insert(0, str(APP_DIR))
+
+    from database import engine, init_db
+    from services.rollups import rebuild_rollups
+    from sqlalchemy import text
+
+    init_db()
+    if fresh:
+        with engine.begin() as connection:
+            for table in ROLLUP_TABLES + ("searches", "competitor_appearances", "keywords", "competitors", "executions"):
+                connection.execute(text(f"DELETE FROM {table}"))
+        populate(engine, args)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO contacts (competitor_id, type, value, first_seen, last_seen, times_found) "
+                "SELECT id, 'phone', '(41) 3333-' || printf('%04d', id), first_seen, last_seen, 1 FROM competitors"
+            ))
+            rebuild_rollups(connection)
+    return db_path
+
+class ApiServer:
+    """uvicorn numa thread, para o benchmark falar HTTP com a API real."""
+
+    def __init__(self, port: int):
+        import uvicorn
+        from main import app
+
+        self.port = port
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 30
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError("API server did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=30)
+
+class Client:
+    """Cliente HTTP com conexão keep-alive, um por thread."""
+
+    def __init__(self, port: int, prefix: str):
+        self.connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        self.prefix = prefix
+
+    def get(self, path: str) -> float:
+        started = time.perf_counter()
+        self.connection.request("GET", self.prefix + path)
+        response = self.connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"GET {path} returned {response.status}")
+        return time.perf_counter() - started
+
+    def close(self) -> None:
+        self.connection.close()
+
+def load_dashboards(port: int, prefix: str, deadline: float, samples: Dict[str, List[float]]) -> int:
+    client = Client(port, prefix)
+    dashboards = 0
+    try:
+        while time.monotonic() < deadline:
+            for name, path in DASHBOARD.items():
+                samples[name].append(client.get(path))
+            dashboards += 1
+    finally:
+        client.close()
+    return dashboards
+
+def probe(port: int, deadline: float, interval: float, samples: List[float]) -> None:
+    """Latência de uma rota sem banco: mede o bloqueio do event loop."""
+    client = Client(port, "")
+    try:
+        while time.monotonic() < deadline:
+            samples.append(client.get("/"))
+            time.sleep(interval)
+    finally:
+        client.close()
+
+def write_load(deadline: float, interval: float, counter: List[int]) -> None:
+    """Commits curtos e frequentes, como os do SearchWriter durante uma execução."""
+    from database import engine
+    from sqlalchemy import text
+
+    while time.monotonic() < deadline:
+        with engine.begin() as connection:
+            connection.execute(text("UPDATE keywords SET use_count = use_count + 1 WHERE id = 1"))
+        counter[0] += 1
+        time.sleep(interval)
+
+def run(args) -> Dict:
+    db_path = prepare_database(args)
+
+    from config import settings
+
+    port = free_port()
+    samples: Dict[str, List[float]] = {name: [] for name in DASHBOARD}
+    probe_samples: List[float] = []
+    writes = [0]
+
+    with ApiServer(port):
+        # Aquecimento: conexões do pool e planos de consulta
+        warm_up = Client(port, settings.API_PREFIX)
+        for path in DASHBOARD.values():
+            warm_up.get(path)
+        warm_up.close()
+
+        started = time.monotonic()
+        deadline = started + args.duration
+        background = [threading.Thread(target=probe, args=(port, deadline, args.probe_interval, probe_samples))]
+        if args.write_interval:
+            background.append(threading.Thread(target=write_load, args=(deadline, args.write_interval, writes)))
+        for thread in background:
+            thread.start()
+
+        with ThreadPoolExecutor(max_workers=args.clients) as executor:
+            futures = [
+                executor.submit(load_dashboards, port, settings.API_PREFIX, deadline, samples)
+                for _ in range(args.clients)
+            ]
+            dashboards = sum(future.result() for future in futures)
+        elapsed = time.monotonic() - started
+
+        for thread in background:
+            thread.join()
+
+    all_samples = [value for values in samples.values() for value in values]
+    return {
+        "database": str(db_path),
+        "async_database_url": settings.ASYNC_DATABASE_URL,
+        "elapsed_seconds": elapsed,
+        "dashboards": dashboards,
+        "requests_per_second": len(all_samples) / elapsed,
+        "writes": writes[0],
+        "overall": summarize(all_samples),
+        "endpoints": {name: summarize(values) for name, values in samples.items()},
+        "event_loop_probe": summarize(probe_samples)
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark de concorrência da API")
+    parser.add_argument("--clients", type=int, default=16, help="Clientes carregando o dashboard em paralelo")
+    parser.add_argument("--duration", type=float, default=15, help="Duração da carga, em segundos")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="Intervalo da sonda do event loop")
+    parser.add_argument("--write-interval", type=float, default=0, help="Intervalo entre commits simulando o scraper (0 desliga)")
+    parser.add_argument("--appearances", type=int, default=200_000, help="Aparições de competidores geradas")
+    parser.add_argument("--competitors", type=int, default=2000, help="Competidores distintos")
+    parser.add_argument("--keywords", type=int, default=200, help="Keywords distintas")
+    parser.add_argument("--days", type=int, default=90, help="Período coberto pelos dados")
+    parser.add_argument("--batch", type=int, default=10000, help="Pesquisas por lote de inserção")
+    parser.add_argument("--seed", type=int, default=42, help="Semente dos dados sintéticos")
+    parser.add_argument("--db", help="Banco SQLite a reaproveitar (gerado se não existir)")
+    parser.add_argument("--output", default="api_benchmark.json", help="Arquivo JSON de resultado")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    result = run(args)
+    result.update({
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": git_revision(),
+        "config": vars(args)
+    })
+
+    Path(args.output).write_text(json.dumps(result, indent=2))
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# backend/benchmarks/contact_benchmark.py
+
+"""
+Microbenchmark da extração de contatos sobre landing pages grandes.
+
+Monta páginas sintéticas de --sizes MB a partir das fixtures de
+anunciantes, com texto, blocos de <script> com JSON e contatos espalhados,
+e compara três abordagens sobre o mesmo HTML:
+
+- legacy: o antigo find_whatsapp_number (lower() + um `in` por padrão,
+  sem extrair número nenhum), como referência de custo mínimo;
+- per_pattern: uma expressão regular por tipo de contato, um passe cada;
+- combined: o ContactExtractor, um único passe da expressão combinada;
+- in_page: extract_candidates() sobre os candidatos que o IN_PAGE_SCRIPT
+  devolveria. Sem Chrome, os candidatos são aproximados com lxml (sem
+  layout, então elementos ocultos não são filtrados); o resultado também
+  compara os bytes que atravessariam o WebDriver em cada modo.
+
+Uso (a partir de backend/):
+
+    python benchmarks/contact_benchmark.py --sizes 0.5 2 8 --output contacts.json
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import lxml.html
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+APP_DIR = BENCHMARKS_DIR.parent / "app"
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+sys.path.insert(0, str(APP_DIR))
+from fixture_server import FIXTURES_DIR
+from scraper_benchmark import git_revision, summarize
+
+from config import settings
+from services.contact_extractor import contact_extractor
+
+CONTACT_HREF = re.compile(r"^(tel:|mailto:)|wa\.me/|whatsapp", re.I)
+LOOKS_LIKE_CONTACT = re.compile(r"\d{4}[\s.-]?\d{4}|@")
+
+FILLER_WORDS = (
+    "implante clareamento ortodontia aparelho consulta avaliação sorriso "
+    "agendamento tratamento canal prótese lente resina limpeza"
+).split()
+
+PER_PATTERN = [
+    re.compile(r"(?:wa\.me/|whatsapp\.com/send/?\?(?:[^\"'\s<>]*?[&;])?phone=)(?:%2[bB]|\+)?(\d{8,15})", re.I),
+    re.compile(r"tel:((?:%2[bB]|\+)?(?:[\d().\-\s]|%20){8,25})", re.I),
+    re.compile(r"(?<![\w.%+-])[\w.%+-]{1,64}@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,24}"),
+    re.compile(r"(?<![\w+])(?:\+?55[\s.-]?)?(?:\(0?[1-9]{2}\)|[1-9]{2})[\s.-]?9?\d{4}[\s.-]\d{4}(?!\d)")
+]
+
+def build_page(size_bytes: int, rng: random.Random) -> str:
+    """Repete blocos de conteúdo e scripts até o tamanho pedido, com os contatos das fixtures no meio."""
+    advertisers = [path.read_text(encoding="utf-8") for path in sorted((FIXTURES_DIR / "advertisers").glob("*.html"))]
+    parts: List[str] = ["<!DOCTYPE html><html><head><title>Landing</title></head><body>"]
+    size = len(parts[0])
+    block = 0
+
+    while size < size_bytes:
+        block += 1
+        text = " ".join(rng.choice(FILLER_WORDS) for _ in range(120))
+        ids = ",".join(str(rng.randint(10**9, 10**12)) for _ in range(40))
+        chunk = (
+            f'<section class="block-{block}"><h2>Tratamento {block}</h2><p>{text}</p>'
+            f'<img src="/img/banner-{block}@2x.png" alt="banner"></section>'
+            f'<script>window.__DATA__ = {{"ids": [{ids}], "build": "{rng.random()}"}};</script>'
+        )
+        if block % 50 == 0:
+            chunk += advertisers[block // 50 % len(advertisers)]
+        parts.append(chunk)
+        size += len(chunk)
+
+    parts.append("</body></html>")
+    return "".join(parts)
+
+def legacy(page: str) -> List[Dict]:
+    lowered = page.lower()
+    for pattern in settings.WHATSAPP_PATTERNS:
+        if pattern in lowered:
+            return [{"type": "whatsapp", "value": "found_whatsapp"}]
+    return []
+
+def per_pattern(page: str) -> List[str]:
+    found = []
+    for pattern in PER_PATTERN:
+        found.extend(match.group(0) for match in pattern.finditer(page))
+    return found
+
+def in_page_candidates(page: str) -> List[Dict]:
+    """Aproximação com lxml dos candidatos que o IN_PAGE_SCRIPT devolve no navegador."""
+    tree = lxml.html.fromstring(page)
+    for element in tree.xpath("//script|//style"):
+        element.drop_tree()
+
+    candidates = []
+    for anchor in tree.iter("a"):
+        href = anchor.get("href") or ""
+        if not CONTACT_HREF.search(href):
+            continue
+        parent = anchor.getparent()
+        context = " ".join(filter(None, [
+            anchor.get("class"),
+            anchor.get("aria-label"),
+            anchor.get("title"),
+            (parent if parent is not None else anchor).text_content()
+        ]))
+        candidates.append({"source": "link", "text": href, "context": " ".join(context.split())[:settings.CONTACT_CONTEXT_CHARS]})
+        if len(candidates) >= settings.CONTACT_MAX_CANDIDATES:
+            return candidates
+
+    lines = [line for line in (" ".join(text.split()) for text in tree.body.itertext()) if line]
+    for index, line in enumerate(lines):
+        if not LOOKS_LIKE_CONTACT.search(line):
+            continue
+        context = " ".join(lines[max(0, index - 2):index])
+        candidates.append({"source": "text", "text": line[:500], "context": context[-settings.CONTACT_CONTEXT_CHARS:]})
+        if len(candidates) >= settings.CONTACT_MAX_CANDIDATES:
+            break
+    return candidates
+
+def measure(function: Callable, data, iterations: int, size: int) -> Dict:
+    samples = []
+    result = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = function(data)
+        samples.append(time.perf_counter() - started)
+
+    summary = summarize(samples)
+    summary["mb_per_second"] = (size / (1024 * 1024)) / (sum(samples) / len(samples))
+    summary["matches"] = len(result)
+    return summary
+
+def run(args) -> Dict:
+    rng = random.Random(args.seed)
+    results = {}
+    for size_mb in args.sizes:
+        page = build_page(int(size_mb * 1024 * 1024), rng)
+        candidates = in_page_candidates(page)
+        results[f"{size_mb}MB"] = {
+            "bytes": len(page),
+            "legacy": measure(legacy, page, args.iterations, len(page)),
+            "per_pattern": measure(per_pattern, page, args.iterations, len(page)),
+            "combined": measure(contact_extractor.extract, page, args.iterations, len(page)),
+            "in_page": measure(contact_extractor.extract_candidates, candidates, args.iterations, len(page)),
+            "transfer_bytes": {
+                "page_source": len(page.encode("utf-8")),
+                "in_page": len(json.dumps(candidates, ensure_ascii=False).encode("utf-8")),
+                "candidates": len(candidates)
+            },
+            "contacts": contact_extractor.extract(page),
+            "in_page_contacts": contact_extractor.extract_candidates(candidates)
+        }
+    return results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Microbenchmark da extração de contatos")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.5, 2, 8], help="Tamanhos das páginas em MB")
+    parser.add_argument("--iterations", type=int, default=10, help="Execuções por abordagem e tamanho")
+    parser.add_argument("--seed", type=int, default=42, help="Semente das páginas sintéticas")
+    parser.add_argument("--output", default="contact_benchmark.json", help="Arquivo JSON de resultado")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    result = {
+        "results": run(args),
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": git_revision(),
+        "config": vars(args)
+    }
+
+    Path(args.output).write_text(json.dumps(result, indent=2))
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# backend/benchmarks/fixture_server.py
+
+"""
+Servidor HTTP local que substitui o Google e os sites dos anunciantes
+nos benchmarks, servindo as páginas gravadas em benchmarks/fixtures.
+
+    /                      -> fixtures/home.html (campo de busca "q")
+    /search?q=...          -> uma das SERPs de fixtures/serp (fixa por keyword)
+    /advertiser/<nome>     -> fixtures/advertisers/<nome>.html
+    /static/<arquivo>      -> conteúdo sintético do tamanho indicado em STATIC_SIZES
+
+O marcador {base_url} dentro das fixtures é trocado pela URL do servidor.
+"""
+
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Recursos estáticos sintéticos: extensão -> (content-type, bytes)
+STATIC_SIZES = {
+    ".png": ("image/png", 60_000),
+    ".jpg": ("image/jpeg", 180_000),
+    ".webp": ("image/webp", 90_000),
+    ".mp4": ("video/mp4", 1_500_000),
+    ".css": ("text/css", 25_000),
+    ".js": ("application/javascript", 40_000)
+}
+
+class FixtureServer:
+    def __init__(
+        self,
+        fixtures_dir: Path = FIXTURES_DIR,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0
+    ):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency = latency
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._serp_files = sorted((self.fixtures_dir / "serp").glob("*.html"))
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serp_for(self, query: str) -> Path:
+        """Escolhe uma SERP de forma determinística para cada keyword."""
+        return self._serp_files[zlib.crc32(query.encode("utf-8")) % len(self._serp_files)]
+
+    def render(self, path: Path) -> bytes:
+        return path.read_text(encoding="utf-8").replace("{base_url}", self.base_url).encode("utf-8")
+
+    def _record(self, size: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                parsed = urlparse(self.path)
+                content_type = "text/html; charset=utf-8"
+
+                if parsed.path == "/":
+                    body = server.render(server.fixtures_dir / "home.html")
+                elif parsed.path == "/search":
+                    query = parse_qs(parsed.query).get("q", [""])[0]
+                    body = server.render(server.serp_for(query))
+                elif parsed.path.startswith("/advertiser/"):
+                    name = Path(parsed.path).name
+                    page = server.fixtures_dir / "advertisers" / f"{name}.html"
+                    if not page.exists():
+                        self.send_error(404)
+                        return
+                    body = server.render(page)
+                elif parsed.path.startswith("/static/"):
+                    suffix = Path(parsed.path).suffix
+                    content_type, size = STATIC_SIZES.get(suffix, ("application/octet-stream", 1_000))
+                    body = b"\0" * size
+                else:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                server._record(len(body))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
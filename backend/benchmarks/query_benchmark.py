@@ -0,0 +1,261 @@
+# backend/benchmarks/query_benchmark.py
+
+"""
+Benchmark das consultas de análise sobre um banco SQLite sintético.
+
+Gera (ou reaproveita) um banco com --appearances aparições de
+competidores espalhadas por --days dias e mede a latência de
+/competition/top-competitors e /performance/daily-stats chamando as
+rotas diretamente, primeiro sem os índices compostos e depois com eles.
+Os rollups diários são reconstruídos logo após gerar os dados.
+
+Uso (a partir de backend/):
+
+    python benchmarks/query_benchmark.py --appearances 1000000 --output queries.json
+    python benchmarks/query_benchmark.py --db /tmp/queries.db --no-pragmas
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+APP_DIR = BENCHMARKS_DIR.parent / "app"
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+from scraper_benchmark import git_revision, summarize
+
+ADS_PER_SEARCH = 8
+SEARCHES_PER_EXECUTION = 25
+ROLLUP_TABLES = (
+    "daily_keyword_stats",
+    "daily_lidery_positions",
+    "daily_competitor_stats",
+    "daily_competitor_keyword_stats"
+)
+
+def populate(engine, args) -> None:
+    """Insere o volume sintético direto pelo DBAPI, em lotes."""
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    searches = max(1, args.appearances // ADS_PER_SEARCH)
+    executions = max(1, searches // SEARCHES_PER_EXECUTION)
+
+    def moment() -> datetime:
+        return now - timedelta(seconds=rng.randint(0, args.days * 86400))
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT INTO keywords (id, text, is_active, created_at, use_count) VALUES (?, ?, 1, ?, 0)",
+            [(index, f"keyword {index}", now) for index in range(1, args.keywords + 1)]
+        )
+        cursor.executemany(
+            "INSERT INTO competitors (id, domain, business_name, first_seen, last_seen, total_appearances) "
+            "VALUES (?, ?, ?, ?, ?, 0)",
+            [
+                (index, f"competitor{index}.com.br", f"Competitor {index}", now, now)
+                for index in range(1, args.competitors + 1)
+            ]
+        )
+        cursor.executemany(
+            "INSERT INTO executions (id, start_time, end_time, total_searches, total_clicks, "
+            "total_lidery_found, delay_seconds, is_running, execution_mode, headless, status) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0, 0, 'full', 1, 'completed')",
+            [
+                (index, started, started + timedelta(minutes=30), SEARCHES_PER_EXECUTION,
+                 rng.randint(0, 50), rng.randint(0, SEARCHES_PER_EXECUTION))
+                for index, started in ((index, moment()) for index in range(1, executions + 1))
+            ]
+        )
+
+        # Competidores com peso decrescente, como nas SERPs reais
+        weights = [1.0 / rank for rank in range(1, args.competitors + 1)]
+        appearance_id = 1
+        for first in range(1, searches + 1, args.batch):
+            search_rows = []
+            appearance_rows = []
+            for search_id in range(first, min(searches, first + args.batch - 1) + 1):
+                timestamp = moment()
+                search_rows.append((
+                    search_id,
+                    rng.randint(1, args.keywords),
+                    rng.randint(1, executions),
+                    timestamp,
+                    ADS_PER_SEARCH,
+                    rng.choice([None, None, 1, 2, 3, 4])
+                ))
+                competitors = rng.choices(range(1, args.competitors + 1), weights, k=ADS_PER_SEARCH)
+                for position, competitor_id in enumerate(competitors, start=1):
+                    appearance_rows.append((
+                        appearance_id, competitor_id, search_id, position, timestamp, rng.randint(0, 1)
+                    ))
+                    appearance_id += 1
+
+            cursor.executemany(
+                "INSERT INTO searches (id, keyword_id, execution_id, timestamp, total_ads, lidery_position) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                search_rows
+            )
+            cursor.executemany(
+                "INSERT INTO competitor_appearances (id, competitor_id, search_id, position, timestamp, clicked) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                appearance_rows
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+def analytics_indexes():
+    from database import Base
+
+    names = {
+        "ix_searches_timestamp_lidery_position",
+        "ix_searches_keyword_id_timestamp",
+        "ix_searches_execution_id",
+        "ix_competitor_appearances_search_competitor",
+        "ix_competitor_appearances_competitor_search",
+        "ix_contacts_first_seen",
+        "ix_contacts_competitor_id",
+        "ix_executions_start_time"
+    }
+    return [
+        index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if index.name in names
+    ]
+
+def measure(iterations: int) -> Dict:
+    from database import AsyncSessionLocal, async_engine
+    from routers.competition import get_top_competitors
+    from routers.performance import get_daily_stats
+
+    queries = {
+        "top_competitors": lambda db: get_top_competitors(limit=10, days=30, db=db),
+        "daily_stats": lambda db: get_daily_stats(start_date=None, end_date=None, db=db)
+    }
+
+    async def run_queries() -> Dict:
+        results = {}
+        try:
+            async with AsyncSessionLocal() as db:
+                for name, query in queries.items():
+                    samples = []
+                    rows = 0
+                    for _ in range(iterations):
+                        started = time.perf_counter()
+                        rows = len(await query(db))
+                        samples.append(time.perf_counter() - started)
+                    results[name] = {**summarize(samples), "rows": rows}
+        finally:
+            # As conexões do pool pertencem a este event loop
+            await async_engine.dispose()
+        return results
+
+    return asyncio.run(run_queries())
+
+def run(args) -> Dict:
+    db_path = Path(args.db) if args.db else Path(tempfile.mkdtemp(prefix="query-bench-")) / "queries.db"
+    fresh = not db_path.exists()
+
+    # Configuração precisa estar no ambiente antes de importar o app
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    sys.path.insert(0, str(APP_DIR))
+
+    from config import settings
+    if args.no_pragmas:
+        settings.SQLITE_PRAGMAS = {}
+
+    from database import engine, init_db
+    from services.rollups import rebuild_rollups
+    from sqlalchemy import text
+
+    init_db()
+    if fresh:
+        with engine.begin() as connection:
+            for table in ROLLUP_TABLES + ("searches", "competitor_appearances", "keywords", "competitors", "executions"):
+                connection.execute(text(f"DELETE FROM {table}"))
+        populated_at = time.perf_counter()
+        populate(engine, args)
+        populate_seconds = time.perf_counter() - populated_at
+
+        # Os dados sintéticos não passam pelo SearchWriter
+        rebuilt_at = time.perf_counter()
+        with engine.begin() as connection:
+            rebuild_rollups(connection)
+        rollup_seconds = time.perf_counter() - rebuilt_at
+    else:
+        populate_seconds = rollup_seconds = 0.0
+
+    with engine.connect() as connection:
+        appearances = connection.execute(text("SELECT count(*) FROM competitor_appearances")).scalar()
+        journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+
+    indexes = analytics_indexes()
+
+    # Sem os índices compostos
+    with engine.begin() as connection:
+        for index in indexes:
+            index.drop(connection, checkfirst=True)
+        connection.exec_driver_sql("ANALYZE")
+    without_indexes = measure(args.iterations)
+
+    # Com os índices compostos (mesmo caminho da migração)
+    indexed_at = time.perf_counter()
+    with engine.begin() as connection:
+        for index in indexes:
+            index.create(connection, checkfirst=True)
+        connection.exec_driver_sql("ANALYZE")
+    index_seconds = time.perf_counter() - indexed_at
+    with_indexes = measure(args.iterations)
+
+    return {
+        "database": str(db_path),
+        "appearances": appearances,
+        "journal_mode": journal_mode,
+        "pragmas": settings.SQLITE_PRAGMAS,
+        "populate_seconds": populate_seconds,
+        "rollup_rebuild_seconds": rollup_seconds,
+        "index_build_seconds": index_seconds,
+        "without_indexes": without_indexes,
+        "with_indexes": with_indexes
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark das consultas de análise")
+    parser.add_argument("--appearances", type=int, default=1_000_000, help="Aparições de competidores geradas")
+    parser.add_argument("--competitors", type=int, default=2000, help="Competidores distintos")
+    parser.add_argument("--keywords", type=int, default=200, help="Keywords distintas")
+    parser.add_argument("--days", type=int, default=90, help="Período coberto pelos dados")
+    parser.add_argument("--iterations", type=int, default=5, help="Execuções de cada consulta")
+    parser.add_argument("--batch", type=int, default=10000, help="Pesquisas por lote de inserção")
+    parser.add_argument("--seed", type=int, default=42, help="Semente dos dados sintéticos")
+    parser.add_argument("--db", help="Banco SQLite a reaproveitar (gerado se não existir)")
+    parser.add_argument("--no-pragmas", action="store_true", help="Desativa os PRAGMAs de settings.SQLITE_PRAGMAS")
+    parser.add_argument("--output", default="query_benchmark.json", help="Arquivo JSON de resultado")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    result = run(args)
+    result.update({
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": git_revision(),
+        "config": vars(args)
+    })
+
+    Path(args.output).write_text(json.dumps(result, indent=2))
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+# backend/benchmarks/scraper_benchmark.py
+
+"""
+Benchmark ponta a ponta do GoogleScraper contra as fixtures gravadas.
+
+Sobe o FixtureServer no lugar do Google, usa um banco SQLite temporário e
+o perfil de atrasos "zero" por padrão. Mede pesquisas por minuto, latência por etapa (load, parse, db_write, navigation),
+quantidade de escritas no banco e pico de RSS, gravando tudo em JSON para
+comparar branches.
+
+Uso (a partir de backend/):
+
+    python benchmarks/scraper_benchmark.py --searches 20 --headless --output bench.json
+    python benchmarks/scraper_benchmark.py --searches 20 --headless --mode serp_only
+    python benchmarks/scraper_benchmark.py --parse-only --searches 5000
+
+--parse-only roda apenas o SerpParser sobre as SERPs gravadas, sem Chrome.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+APP_DIR = BENCHMARKS_DIR.parent / "app"
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+from fixture_server import FIXTURES_DIR, FixtureServer
+
+class StageTimer:
+    """Acumula durações por etapa."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.samples.setdefault(stage, []).append(seconds)
+
+    def wrap(self, stage: str, func):
+        """Envolve uma função (síncrona ou async) cronometrando cada chamada."""
+        if asyncio.iscoroutinefunction(func):
+            async def timed_async(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.add(stage, time.perf_counter() - started)
+            return timed_async
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - started)
+        return timed
+
+    def total(self, stage: str) -> float:
+        return sum(self.samples.get(stage, []))
+
+    def summary(self) -> Dict[str, Dict]:
+        return {stage: summarize(values) for stage, values in self.samples.items()}
+
+def summarize(values: List[float]) -> Dict:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "total_seconds": sum(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+        "max_ms": ordered[-1] * 1000
+    }
+
+class RssSampler:
+    """Amostra o RSS do processo e dos filhos (Chrome) em background."""
+
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        try:
+            import psutil
+            self._process = psutil.Process()
+        except ImportError:
+            self._process = None
+
+    def _sample(self) -> int:
+        if self._process is None:
+            # ru_maxrss está em KB no Linux
+            usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            return (usage + children) * 1024
+        total = self._process.memory_info().rss
+        for child in self._process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except Exception:
+                pass
+        return total
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, self._sample())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._sample())
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+def instrument_database(engine, timer: StageTimer, counters: Dict) -> None:
+    """Conta e cronometra os comandos de escrita executados no engine."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("bench_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["bench_started"].pop()
+        verb = statement.lstrip().split(" ", 1)[0].upper()
+        if verb in ("INSERT", "UPDATE", "DELETE"):
+            counters["writes"] += 1
+            counters[verb.lower()] = counters.get(verb.lower(), 0) + 1
+            timer.add("db_write", time.perf_counter() - started)
+
+    @event.listens_for(engine, "commit")
+    def on_commit(conn):
+        counters["commits"] += 1
+
+def run_parse_only(args) -> Dict:
+    sys.path.insert(0, str(APP_DIR))
+    from services.serp_parser import SerpParser
+
+    parser = SerpParser()
+    pages = [
+        path.read_text(encoding="utf-8").replace("{base_url}", "http://127.0.0.1")
+        for path in sorted((FIXTURES_DIR / "serp").glob("*.html"))
+    ]
+    timer = StageTimer()
+    ads = 0
+
+    started = time.perf_counter()
+    with RssSampler() as rss:
+        for index in range(args.searches):
+            page_started = time.perf_counter()
+            ads += len(parser.parse(pages[index % len(pages)]))
+            timer.add("parse", time.perf_counter() - page_started)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "mode": "parse_only",
+        "searches": args.searches,
+        "ads_found": ads,
+        "elapsed_seconds": elapsed,
+        "searches_per_minute": args.searches / elapsed * 60 if elapsed else 0,
+        "stages": timer.summary(),
+        "peak_rss_mb": rss.peak_bytes / (1024 * 1024)
+    }
+
+def run_end_to_end(args) -> Dict:
+    workdir = tempfile.mkdtemp(prefix="scraper-bench-")
+    server = FixtureServer(latency=args.latency).start()
+
+    # Configuração precisa estar no ambiente antes de importar o app
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/benchmark.db"
+    os.environ["GOOGLE_URL"] = server.base_url
+    os.environ["DELAY_PROFILE"] = args.delay_profile
+    os.environ["DRIVER_POOL_PREWARM"] = "0"
+    os.environ["VISIT_FRESHNESS_HOURS"] = str(args.visit_freshness)
+    os.environ["CONTACT_EXTRACTION"] = args.contact_extraction
+    sys.path.insert(0, str(APP_DIR))
+
+    from database import SessionLocal, engine, init_db
+    from models import Execution, Keyword
+    from services.driver_pool import driver_pool
+    from services.metrics import metrics
+    from services.scraper import GoogleScraper
+
+    init_db()
+    timer = StageTimer()
+    db_counters = {"writes": 0, "commits": 0}
+
+    db = SessionLocal()
+    keywords = []
+    for index in range(args.keywords):
+        keyword = Keyword(text=f"dentista curitiba {index}")
+        db.add(keyword)
+        keywords.append(keyword)
+    execution = Execution(execution_mode=args.mode, headless=args.headless)
+    db.add(execution)
+    db.commit()
+
+    instrument_database(engine, timer, db_counters)
+
+    execution_id = execution.id
+    scraper = GoogleScraper(db, execution_id, args.headless, visit_advertisers=args.mode != "serp_only")
+    scraper.serp_parser.parse = timer.wrap("parse", scraper.serp_parser.parse)
+    scraper.navigate_and_collect = timer.wrap("navigation", scraper.navigate_and_collect)
+
+    driver_started = time.perf_counter()
+    scraper.configure_driver()
+    timer.add("driver_startup", time.perf_counter() - driver_started)
+
+    async def run() -> None:
+        for index in range(args.searches):
+            keyword = keywords[index % len(keywords)]
+            parse_before = timer.total("parse")
+            navigation_before = timer.total("navigation")
+            db_before = timer.total("db_write")
+
+            search_started = time.perf_counter()
+            await scraper.run_search(keyword)
+            search_seconds = time.perf_counter() - search_started
+            timer.add("search", search_seconds)
+
+            # "load" é o restante: navegação até a SERP, digitação e espera
+            timer.add("load", max(0.0, search_seconds
+                - (timer.total("parse") - parse_before)
+                - (timer.total("navigation") - navigation_before)
+                - (timer.total("db_write") - db_before)))
+
+    started = time.perf_counter()
+    try:
+        with RssSampler() as rss:
+            asyncio.run(run())
+    finally:
+        elapsed = time.perf_counter() - started
+        scraper.close()
+        driver_pool.shutdown()
+        db.close()
+        server.stop()
+
+    summary = metrics.summary(execution_id)
+    counters = summary.get("counters", {})
+    return {
+        "mode": "end_to_end",
+        "searches": args.searches,
+        "elapsed_seconds": elapsed,
+        "searches_per_minute": args.searches / elapsed * 60 if elapsed else 0,
+        "stages": timer.summary(),
+        "db": db_counters,
+        "waits": summary.get("waits", {}),
+        "extraction": {
+            "method": args.contact_extraction,
+            "bytes": counters.get("extraction_bytes", 0),
+            "visits": counters.get("clicks", 0)
+        },
+        "fixture_server": {
+            "requests": server.requests,
+            "bytes_sent": server.bytes_sent
+        },
+        "peak_rss_mb": rss.peak_bytes / (1024 * 1024)
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark do scraper contra fixtures locais")
+    parser.add_argument("--searches", type=int, default=10, help="Número de pesquisas")
+    parser.add_argument("--keywords", type=int, default=5, help="Keywords distintas usadas em rodízio")
+    parser.add_argument("--headless", action="store_true", help="Executa o Chrome em modo headless")
+    parser.add_argument(
+        "--mode", choices=("full", "serp_only"), default="full",
+        help="full visita os anunciantes; serp_only só lê a SERP"
+    )
+    parser.add_argument(
+        "--contact-extraction", choices=("in_page", "page_source"), default="in_page",
+        help="Extração de contatos no navegador ou a partir do page_source"
+    )
+    parser.add_argument("--delay-profile", default="zero", help="Perfil de atrasos (humanlike, reduced, zero)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência artificial do servidor (s)")
+    parser.add_argument(
+        "--visit-freshness", type=float, default=24.0,
+        help="Janela de frescor dos anunciantes em horas (0 = visitar todos os anúncios)"
+    )
+    parser.add_argument("--parse-only", action="store_true", help="Mede apenas o parser de SERP, sem Chrome")
+    parser.add_argument("--output", default="scraper_benchmark.json", help="Arquivo JSON de resultado")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    result = run_parse_only(args) if args.parse_only else run_end_to_end(args)
+    result.update({
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": git_revision(),
+        "config": vars(args)
+    })
+
+    Path(args.output).write_text(json.dumps(result, indent=2))
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
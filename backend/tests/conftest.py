@@ -0,0 +1,64 @@
+# backend/tests/conftest.py
+
+"""
+Configuração comum dos testes.
+
+O app lê a configuração do ambiente na importação, então o banco padrão
+aponta para um arquivo temporário antes de qualquer import. A fixture
+database cria um banco vazio para cada backend: SQLite sempre, e
+PostgreSQL quando TEST_POSTGRES_URL aponta para um servidor local, por
+exemplo:
+
+    TEST_POSTGRES_URL=postgresql://postgres@localhost:5432/postgres python -m pytest
+"""
+
+import os
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+import pytest
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='ads-tracker-tests-')}/app.db")
+os.environ.setdefault("DRIVER_POOL_PREWARM", "0")
+sys.path.insert(0, str(APP_DIR))
+
+BACKENDS = ["sqlite", "postgresql"]
+
+@pytest.fixture(params=BACKENDS)
+def database(request, tmp_path, monkeypatch):
+    """
+    Banco vazio do backend do parâmetro, ligado ao engine e ao
+    SessionLocal do app. Retorna o engine.
+    """
+    import database as database_module
+    from sqlalchemy import create_engine, make_url
+
+    admin = None
+    if request.param == "sqlite":
+        url = f"sqlite:///{tmp_path}/test.db"
+    else:
+        base_url = os.getenv("TEST_POSTGRES_URL")
+        if not base_url:
+            pytest.skip("TEST_POSTGRES_URL is not set")
+        name = f"ads_tracker_test_{uuid.uuid4().hex[:12]}"
+        admin = create_engine(base_url, isolation_level="AUTOCOMMIT")
+        with admin.connect() as connection:
+            connection.exec_driver_sql(f"CREATE DATABASE {name}")
+        url = make_url(base_url).set(database=name).render_as_string(hide_password=False)
+
+    engine = database_module.create_db_engine(url)
+    original = database_module.engine
+    monkeypatch.setattr(database_module, "engine", engine)
+    database_module.SessionLocal.configure(bind=engine)
+    try:
+        yield engine
+    finally:
+        database_module.SessionLocal.configure(bind=original)
+        engine.dispose()
+        if admin is not None:
+            with admin.connect() as connection:
+                connection.exec_driver_sql(f"DROP DATABASE {name} WITH (FORCE)")
+            admin.dispose()
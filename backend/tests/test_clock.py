@@ -0,0 +1,64 @@
+# backend/tests/test_clock.py
+
+from datetime import date, datetime, timedelta, timezone
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+def test_to_utc():
+    from clock import to_utc
+
+    brasilia = timezone(timedelta(hours=-3))
+    assert to_utc(datetime(2026, 10, 18, 22, 30, tzinfo=brasilia)) == datetime(2026, 10, 19, 1, 30)
+    assert to_utc(datetime(2026, 10, 18, 22, 30)) == datetime(2026, 10, 18, 22, 30)
+    assert to_utc(None) is None
+
+@pytest.fixture
+def performance_client(database, monkeypatch):
+    """Router de performance ligado ao banco da fixture, sem o cache de respostas."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from config import async_database_url
+    from database import get_async_db, init_db
+    from routers import performance
+    from services.response_cache import response_cache
+
+    init_db()
+    monkeypatch.setattr(response_cache, "enabled", False)
+    async_engine = create_async_engine(async_database_url(database.url.render_as_string(hide_password=False)))
+
+    async def override():
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(performance.router)
+    app.dependency_overrides[get_async_db] = override
+    with TestClient(app) as client:
+        yield client
+
+def test_daily_stats_use_utc_days(performance_client, database):
+    from sqlalchemy import insert
+    from models import DailyKeywordStat, Execution
+
+    # 23h30 em Brasília já é o dia seguinte em UTC: rollup e execução caem no mesmo dia UTC
+    started = datetime(2026, 10, 19, 2, 30)
+    with database.begin() as connection:
+        connection.execute(insert(DailyKeywordStat.__table__).values(
+            day=date(2026, 10, 19), keyword_id=1, searches=4, total_ads=8, clicks=2,
+            lidery_found=1, lidery_position_sum=2
+        ))
+        connection.execute(insert(Execution.__table__).values(start_time=started, is_running=False))
+
+    response = performance_client.get("/performance/daily-stats", params={
+        "start_date": "2026-10-18T00:00:00-03:00",
+        "end_date": "2026-10-19T00:00:00-03:00"
+    })
+
+    assert response.status_code == 200
+    assert response.json() == [{
+        "date": "2026-10-19",
+        "total_executions": 1,
+        "total_searches": 4,
+        "total_clicks": 2,
+        "total_lidery": 1
+    }]
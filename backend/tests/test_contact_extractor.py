@@ -0,0 +1,88 @@
+# backend/tests/test_contact_extractor.py
+
+import pytest
+
+@pytest.mark.parametrize("raw, expected", [
+    ("(11) 98765-4321", "+5511987654321"),
+    ("011 98765-4321", "+5511987654321"),
+    ("+55 (11) 3456-7890", "+551134567890"),
+    ("%2B5511987654321", "+5511987654321"),
+    ("+1 (415) 555-2671", "+14155552671"),
+    ("+44 20 7946 0958", "+442079460958"),
+    ("(11) 8765-4321", None),    # Celular sem o 9
+    ("(10) 3456-7890", None),    # DDD com 0
+    ("1234-5678", None),         # Sem DDD
+    ("+12 345", None),           # Curto demais
+])
+def test_normalize_phone(raw, expected):
+    from services.contact_extractor import normalize_phone
+
+    assert normalize_phone(raw) == expected
+
+def values(contacts):
+    return {(contact["type"], contact["value"]) for contact in contacts}
+
+def test_extracts_each_source_with_its_score():
+    from services.contact_extractor import contact_extractor
+
+    html = """
+        <a href="https://wa.me/5511987654321">Fale conosco</a>
+        <a href="tel:+551134567890">Ligue</a>
+        <a href="mailto:Contato@Exemplo.com.br">Email</a>
+        <p>Atendimento: (21) 2345-6789</p>
+        <img src="logo@2x.png">
+    """
+    contacts = contact_extractor.extract(html)
+
+    assert values(contacts) == {
+        ("whatsapp", "+5511987654321"),
+        ("phone", "+551134567890"),
+        ("email", "contato@exemplo.com.br"),
+        ("phone", "+552123456789"),
+    }
+    assert [contact["source"] for contact in contacts][0] == "whatsapp_link"
+
+def test_whatsapp_hint_and_script_penalty():
+    from services.contact_extractor import contact_extractor
+
+    hinted = contact_extractor.extract('<p class="whatsapp">Chame no (11) 98765-4321</p>')
+    assert values(hinted) == {("whatsapp", "+5511987654321")}
+
+    scripted = contact_extractor.extract('<script>var t = "tel:(11) 3456-7890";</script>')
+    assert scripted[0]["score"] == pytest.approx(0.6)
+
+@pytest.mark.parametrize("text", [
+    "CNPJ 12.345.678/0001-90",
+    "CNPJ 12345678000190",
+    "CEP 01310-100",
+    "CEP 01310100",
+    "Publicado em 12/10/2026 às 10:30",
+    "Atualizado em 2026-10-12",
+    "Preço R$ 1.234,56 +10% de desconto",
+    "Pedido nº 4567-8901-2345",
+])
+def test_rejects_numbers_that_are_not_phones(text):
+    from services.contact_extractor import contact_extractor
+
+    assert contact_extractor.extract(f"<p>{text}</p>") == []
+
+def test_international_numbers_need_the_country_code():
+    from services.contact_extractor import contact_extractor
+
+    contacts = contact_extractor.extract(
+        "<p>US office: +1 (415) 555-2671</p><p>Lisboa: +351 912 345 678</p><p>Local: 415 555 2671</p>"
+    )
+
+    assert values(contacts) == {("phone", "+14155552671"), ("phone", "+351912345678")}
+
+def test_in_page_candidates_match_html_extraction():
+    from services.contact_extractor import contact_extractor
+
+    candidates = [
+        {"source": "link", "text": "https://api.whatsapp.com/send?phone=5511987654321", "context": "WhatsApp"},
+        {"source": "text", "text": "Ligue (11) 98765-4321 ou +1 415 555 2671", "context": "Atendimento"},
+    ]
+    contacts = contact_extractor.extract_candidates(candidates)
+
+    # O número do link de WhatsApp não se repete como telefone
+    assert values(contacts) == {("whatsapp", "+5511987654321"), ("phone", "+14155552671")}
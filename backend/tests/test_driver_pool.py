@@ -0,0 +1,120 @@
+# backend/tests/test_driver_pool.py
+
+import threading
+import pytest
+
+class FakeDriver:
+    """Driver sem Chrome que registra os comandos CDP recebidos."""
+
+    def __init__(self, headless, urls=("https://www.google.com/search?q=x",)):
+        self.headless = headless
+        self.urls = list(urls)
+        self.current = 0
+        self.cdp = []
+        self.closed = False
+
+    @property
+    def window_handles(self):
+        return list(range(len(self.urls)))
+
+    @property
+    def current_url(self):
+        return self.urls[self.current]
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        self.urls.pop(self.current)
+
+    def execute_script(self, script):
+        return 1
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+        return {}
+
+    def get(self, url):
+        self.urls[self.current] = url
+
+    def quit(self):
+        self.closed = True
+
+@pytest.fixture
+def pool(monkeypatch):
+    from services.driver_pool import DriverPool
+
+    driver_pool = DriverPool(max_idle=2, max_uses=100, max_size=2, acquire_timeout=0.2)
+    monkeypatch.setattr(driver_pool, "create_driver", FakeDriver)
+    monkeypatch.setattr(driver_pool, "_js_heap_mb", lambda driver: None)
+    yield driver_pool
+    driver_pool.shutdown()
+
+def test_warm_up_is_headless_by_default(pool):
+    pool.warm_up(count=1)
+
+    assert pool.stats()["idle_headless"] == 1
+    assert pool.stats()["idle_visible"] == 0
+
+def test_acquire_waits_for_a_free_slot(pool):
+    first = pool.acquire(True)
+    pool.acquire(True)
+    with pytest.raises(TimeoutError):
+        pool.acquire(True)
+
+    # Uma devolução libera o driver para quem está esperando
+    threading.Timer(0.05, pool.release, args=(first,)).start()
+    assert pool.acquire(True) is first
+    assert pool.stats()["created"] == 2
+
+def test_full_pool_swaps_idle_driver_of_the_other_mode(pool):
+    pool.warm_up(headless=True, count=2)
+    visible = pool.acquire(False)
+
+    assert not visible.headless
+    assert pool.stats()["idle_headless"] == 1
+    assert pool.stats()["created"] == 3
+
+def test_reset_clears_storage_of_every_visited_origin(pool):
+    driver = pool.acquire(True)
+
+    # Mesmo fluxo do scraper: SERP na aba original, anunciante numa aba
+    # nova que é fechada antes da devolução do driver
+    pool.record_visit(driver, "https://www.google.com/")
+    driver.urls.append("about:blank")
+    driver.switch_to.window(1)
+    pool.record_visit(driver, "https://www.googleadservices.com/pagead/aclk?sa=L")
+    driver.get("https://anunciante.com.br:8443/contato")
+    pool.record_visit(driver, driver.current_url)
+    driver.close()
+    driver.switch_to.window(0)
+    pool.release(driver)
+
+    cleared = {params["origin"] for command, params in driver.cdp if command == "Storage.clearDataForOrigin"}
+    assert cleared == {
+        "https://www.google.com",
+        "https://www.googleadservices.com",
+        "https://anunciante.com.br:8443"
+    }
+    assert driver.urls == ["about:blank"]
+    assert pool.stats()["idle_headless"] == 1
+
+    # O próximo empréstimo começa sem origens pendentes
+    driver.cdp.clear()
+    assert pool.acquire(True) is driver
+    pool.release(driver)
+    cleared = {params["origin"] for command, params in driver.cdp if command == "Storage.clearDataForOrigin"}
+    assert cleared == set()
+
+def test_tabs_left_open_are_cleared_too(pool):
+    driver = pool.acquire(True)
+    driver.urls.append("https://anunciante.com.br/")
+    pool.release(driver)
+
+    cleared = {params["origin"] for command, params in driver.cdp if command == "Storage.clearDataForOrigin"}
+    assert cleared == {"https://www.google.com", "https://anunciante.com.br"}
+    assert driver.urls == ["about:blank"]
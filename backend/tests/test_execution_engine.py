@@ -0,0 +1,40 @@
+# backend/tests/test_execution_engine.py
+
+def test_recovered_execution_resumes_with_its_settings(database, monkeypatch):
+    from database import SessionLocal, init_db
+    from config import settings
+    from models import Execution, Keyword
+    from services.execution_engine import execution_engine
+    from services.execution_plan import execution_plan
+
+    init_db()
+    monkeypatch.setitem(settings.DELAY_PROFILES, "test", {})
+    dispatched = []
+    monkeypatch.setattr(execution_engine, "_dispatch", dispatched.append)
+
+    db = SessionLocal()
+    try:
+        execution_id = execution_engine.start(db, headless=True, workers=3, delay_profile="test", mode="serp_only")
+        keyword_ids = [keyword.id for keyword in db.query(Keyword).limit(2)]
+        execution_plan.create(db, execution_id, keyword_ids)
+        db.commit()
+
+        # A API caiu com a execução marcada como running
+        dispatched.clear()
+        assert execution_engine.recover_orphans(policy="resume")["resumed"] == [execution_id]
+        assert db.get(Execution, execution_id).to_dict()["workers"] == 3
+    finally:
+        db.close()
+
+    job = dispatched[0]
+    assert (job.execution_id, job.headless, job.mode) == (execution_id, True, "serp_only")
+    assert (job.workers, job.delay_profile) == (3, "test")
+
+def test_resume_ignores_unknown_delay_profile(monkeypatch):
+    from services.execution_engine import execution_engine
+
+    dispatched = []
+    monkeypatch.setattr(execution_engine, "_dispatch", dispatched.append)
+    execution_engine.resume(1, workers=2, delay_profile="removed")
+
+    assert (dispatched[0].workers, dispatched[0].delay_profile) == (2, None)
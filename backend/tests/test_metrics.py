@@ -0,0 +1,28 @@
+# backend/tests/test_metrics.py
+
+import pytest
+
+def test_metric_base_class_is_abstract():
+    from services.metrics import Metric
+
+    with pytest.raises(TypeError):
+        Metric("ads_tracker_test", "Test metric")
+
+def test_transferred_bytes_have_their_own_counter():
+    from services.metrics import COUNTERS, ScrapeMetrics
+
+    metrics = ScrapeMetrics()
+    metrics.transferred("in_page", 2048, execution_id=1)
+    metrics.transferred("page_source", 100000, execution_id=1)
+    metrics.transferred("in_page", 1024, execution_id=1)
+
+    text = metrics.render()
+    assert "# HELP ads_tracker_transferred_bytes_total Total bytes transferred" in text
+    assert '# TYPE ads_tracker_transferred_bytes_total counter' in text
+    assert 'ads_tracker_transferred_bytes_total{method="in_page"} 3072' in text
+    assert "ads_tracker_extraction_bytes_total" not in text
+    assert "extraction_bytes" not in COUNTERS
+
+    summary = metrics.pop_summary(1)
+    assert summary["transferred_bytes"] == {"in_page": 3072, "page_source": 100000}
+    assert "extraction_bytes" not in summary["counters"]
@@ -0,0 +1,122 @@
+# backend/tests/test_pagination.py
+
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+
+def seed_searches(engine) -> None:
+    """Pesquisas com valores de ordenação repetidos, para exercitar o desempate pelo ID."""
+    from database import SessionLocal, init_db
+    from models import Search
+
+    init_db()
+    start = datetime(2026, 10, 1, 12, 0)
+    db = SessionLocal()
+    try:
+        for index in range(23):
+            db.add(Search(
+                keyword_id=1 + index % 3,
+                timestamp=start + timedelta(hours=index // 2),
+                total_ads=index % 4
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+def walk(engine, sort: str, limit: int, **filters):
+    """Percorre todas as páginas seguindo next_cursor. Retorna as páginas de IDs e o total."""
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from config import async_database_url
+    from models import Search
+    from services.pagination import paginate
+
+    sortable = {"timestamp": Search.timestamp, "total_ads": Search.total_ads}
+    statement = select(Search).where(*[getattr(Search, name) == value for name, value in filters.items()])
+
+    async def run():
+        async_engine = create_async_engine(
+            async_database_url(engine.url.render_as_string(hide_password=False))
+        )
+        try:
+            async with async_sessionmaker(async_engine)() as db:
+                pages, cursor, total = [], None, None
+                while True:
+                    page = await paginate(
+                        db, statement, sort, sortable, Search.id,
+                        cursor=cursor, limit=limit, include_total=True,
+                        serialize=lambda search: search.id
+                    )
+                    pages.append(page["items"])
+                    total = page["total_estimate"]
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        return pages, total
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+def expected_order(engine, sort: str, **filters):
+    from sqlalchemy import text
+
+    column = sort.lstrip("-")
+    direction = "DESC" if sort.startswith("-") else "ASC"
+    where = " AND ".join(f"{name} = :{name}" for name in filters) or "1 = 1"
+    with engine.connect() as connection:
+        return list(connection.execute(text(
+            f"SELECT id FROM searches WHERE {where} ORDER BY {column} {direction}, id {direction}"
+        ), filters).scalars())
+
+@pytest.mark.parametrize("sort", ["timestamp", "-timestamp", "total_ads", "-total_ads"])
+def test_keyset_pages_cover_every_row_once(database, sort):
+    seed_searches(database)
+
+    pages, total = walk(database, sort, limit=5)
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert [search_id for page in pages for search_id in page] == expected_order(database, sort)
+    assert total == 23
+
+def test_keyset_pages_respect_the_filter(database):
+    seed_searches(database)
+
+    pages, total = walk(database, "-total_ads", limit=4, keyword_id=2)
+
+    ids = [search_id for page in pages for search_id in page]
+    assert ids == expected_order(database, "-total_ads", keyword_id=2)
+    assert total == len(ids) == 8
+
+def test_cursor_round_trip_keeps_types():
+    from models import Search
+    from services.pagination import decode_cursor, encode_cursor
+
+    columns = [Search.timestamp, Search.id]
+    at = datetime(2026, 10, 18, 9, 30, 15)
+    cursor = encode_cursor("-timestamp", [at, 42])
+
+    assert decode_cursor(cursor, "-timestamp", columns) == [at, 42]
+
+@pytest.mark.parametrize("cursor, sort", [
+    ("not-base64!", "timestamp"),
+    (None, "timestamp"),    # Cursor de outra ordenação
+    (None, "-total_ads"),
+])
+def test_invalid_cursor_is_rejected(cursor, sort):
+    from models import Search
+    from services.pagination import decode_cursor, encode_cursor
+
+    cursor = cursor or encode_cursor("-timestamp", [datetime(2026, 10, 18), 1])
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, sort, [Search.timestamp, Search.id])
+    assert error.value.status_code == 400
+
+def test_unknown_sort_is_rejected():
+    from sqlalchemy import select
+    from models import Search
+    from services.pagination import paginate
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(paginate(None, select(Search), "clicks", {"timestamp": Search.timestamp}, Search.id))
+    assert error.value.status_code == 400
@@ -0,0 +1,183 @@
+# backend/tests/test_partitions.py
+
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import text
+
+def create_legacy_schema(engine) -> None:
+    """
+    Cria as tabelas como um banco antigo: sem partições e com as chaves
+    de paginação ainda aceitando NULL (antes da migração 6).
+    """
+    from sqlalchemy import MetaData
+    from database import Base
+    from migrations import PAGINATION_KEY_BACKFILL
+    import models  # noqa: F401
+
+    legacy = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(legacy)
+    for table, columns in PAGINATION_KEY_BACKFILL.items():
+        for column, _ in columns:
+            legacy.tables[table].c[column].nullable = True
+    legacy.create_all(bind=engine)
+
+def seed_history(engine, months: int = 3) -> datetime:
+    """Cria as tabelas de um banco antigo e grava pesquisas de vários meses."""
+    create_legacy_schema(engine)
+    first = (datetime.utcnow().replace(day=15, hour=12, minute=0, second=0, microsecond=0)
+             - timedelta(days=31 * (months - 1)))
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO keywords (id, text, is_active, use_count) VALUES (1, 'dentista', TRUE, 0)"))
+        connection.execute(text(
+            "INSERT INTO competitors (id, domain, total_appearances) VALUES (1, 'a.com.br', 0), (2, 'b.com.br', 0)"
+        ))
+        connection.execute(text(
+            "INSERT INTO executions (id, start_time, is_running, status) VALUES (1, :at, FALSE, 'completed')"
+        ), {"at": first})
+        for month in range(months):
+            at = first + timedelta(days=31 * month)
+            for search_id in (month * 2 + 1, month * 2 + 2):
+                connection.execute(text(
+                    "INSERT INTO searches (id, keyword_id, execution_id, timestamp, total_ads) "
+                    "VALUES (:id, 1, 1, :at, 2)"
+                ), {"id": search_id, "at": at})
+                connection.execute(text(
+                    "INSERT INTO competitor_appearances (competitor_id, search_id, position, timestamp, clicked) "
+                    "VALUES (1, :id, 1, :at, 0), (2, :id, 2, :at, 1)"
+                ), {"id": search_id, "at": at + timedelta(seconds=30)})
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            for table in ("searches", "competitor_appearances"):
+                connection.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"
+                ))
+    return first
+
+def count(engine, table: str) -> int:
+    with engine.connect() as connection:
+        return connection.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+def test_init_db_migrates_existing_history(database):
+    from database import SessionLocal, init_db
+    from models import Search, CompetitorAppearance, DailyKeywordStat
+    from partitions import is_partitioned, partition_name
+
+    first = seed_history(database)
+    init_db()
+
+    assert count(database, "searches") == 6
+    assert count(database, "competitor_appearances") == 12
+
+    # Rollups reconstruídos pela migração 2 a partir dos dados existentes
+    db = SessionLocal()
+    try:
+        assert sum(stat.searches for stat in db.query(DailyKeywordStat)) == 6
+        assert sum(stat.clicks for stat in db.query(DailyKeywordStat)) == 6
+
+        # A sequência de IDs continua depois dos dados migrados
+        search = Search(keyword_id=1, execution_id=1, timestamp=datetime.utcnow(), total_ads=1)
+        db.add(search)
+        db.add(CompetitorAppearance(competitor_id=1, search=search, position=1, timestamp=datetime.utcnow()))
+        db.commit()
+        assert search.id == 7
+        assert len(search.competitor_appearances) == 1
+    finally:
+        db.close()
+
+    if database.dialect.name != "postgresql":
+        return
+
+    with database.connect() as connection:
+        for table in ("searches", "competitor_appearances"):
+            assert is_partitioned(connection, table)
+            assert connection.execute(text(f"SELECT COUNT(*) FROM {table}_default")).scalar() == 0
+            # Cada linha antiga foi para a partição do seu mês
+            rows = connection.execute(text(
+                f"SELECT tableoid::regclass::text, COUNT(*) FROM {table} GROUP BY 1"
+            )).all()
+            assert all(name.startswith(f"{table}_2") for name, _ in rows)
+
+        assert connection.execute(text(
+            "SELECT to_regclass(:name)"), {"name": partition_name("searches", first.date())}
+        ).scalar()
+
+        primary_key = connection.execute(text("""
+            SELECT array_agg(a.attname::text ORDER BY a.attname)
+            FROM pg_index i JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+            WHERE i.indrelid = 'searches'::regclass AND i.indisprimary
+        """)).scalar()
+        assert primary_key == ["id", "timestamp"]
+
+        # FKs para tabelas comuns recriadas; a FK para searches não pode existir
+        references = set(connection.execute(text("""
+            SELECT confrelid::regclass::text FROM pg_constraint
+            WHERE conrelid = 'competitor_appearances'::regclass AND contype = 'f'
+        """)).scalars())
+        assert references == {"competitors"}
+
+        # Consultas por período só leem as partições do intervalo
+        plan = "\n".join(connection.execute(text(
+            "EXPLAIN SELECT COUNT(*) FROM searches WHERE timestamp >= :start"
+        ), {"start": datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)}).scalars())
+        assert partition_name("searches", first.date()) not in plan
+
+def test_init_db_is_idempotent(database):
+    from database import init_db
+
+    seed_history(database)
+    init_db()
+    init_db()
+
+    assert count(database, "searches") == 6
+
+@pytest.mark.parametrize("months_away", [14, -14])
+def test_ensure_partitions_moves_stranded_rows(database, months_away):
+    from database import init_db
+    from partitions import add_months, ensure_partitions, partition_name
+
+    if database.dialect.name != "postgresql":
+        assert ensure_partitions(database) == {}
+        return
+
+    init_db()
+    month = add_months(datetime.utcnow().date().replace(day=1), months_away)
+    with database.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO searches (keyword_id, timestamp, total_ads) VALUES (1, :at, 0)"
+        ), {"at": datetime.combine(month, datetime.min.time()) + timedelta(days=3)})
+    assert count(database, "searches_default") == 1
+
+    assert ensure_partitions(database)["searches"] == 1
+    assert count(database, "searches_default") == 0
+    assert count(database, partition_name("searches", month)) == 1
+
+def test_init_db_backfills_null_pagination_keys(database):
+    from database import init_db
+    from migrations import PAGINATION_KEY_BACKFILL
+
+    create_legacy_schema(database)
+    with database.begin() as connection:
+        connection.execute(text("INSERT INTO keywords (id, text, is_active) VALUES (1, 'dentista', TRUE)"))
+        connection.execute(text("INSERT INTO competitors (id, domain) VALUES (1, 'a.com.br')"))
+        connection.execute(text("INSERT INTO executions (id, end_time) VALUES (1, :at)"), {"at": datetime(2026, 10, 1)})
+        connection.execute(text(
+            "INSERT INTO contacts (competitor_id, type, value, last_seen) VALUES "
+            "(1, 'phone', '+5511987654321', :at), (1, 'email', 'a@a.com.br', NULL)"
+        ), {"at": datetime(2026, 10, 2)})
+    init_db()
+
+    with database.connect() as connection:
+        for table, columns in PAGINATION_KEY_BACKFILL.items():
+            for column, _ in columns:
+                assert connection.execute(text(f"SELECT COUNT(*) FROM {table} WHERE {column} IS NULL")).scalar() == 0
+        # O SQLite devolve as datas como texto nas consultas cruas
+        assert str(connection.execute(text("SELECT start_time FROM executions")).scalar()).startswith("2026-10-01")
+        assert str(connection.execute(text(
+            "SELECT first_seen FROM contacts WHERE type = 'phone'"
+        )).scalar()).startswith("2026-10-02")
+
+    if database.dialect.name == "postgresql":
+        from sqlalchemy import inspect
+        columns = {column["name"]: column for column in inspect(database).get_columns("contacts")}
+        assert not columns["times_found"]["nullable"]
@@ -0,0 +1,100 @@
+# backend/tests/test_response_cache.py
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+@pytest.fixture
+def client(monkeypatch):
+    """App com uma rota cacheada que conta as chamadas do endpoint."""
+    from services.response_cache import CachedRoute, response_cache
+
+    monkeypatch.setattr(response_cache, "enabled", True)
+    response_cache.invalidate()
+
+    calls = {"count": 0, "value": "a"}
+    router = APIRouter(route_class=CachedRoute)
+
+    @router.get("/stats")
+    async def stats(days: int = 7, keyword: str = ""):
+        calls["count"] += 1
+        return {"days": days, "keyword": keyword, "value": calls["value"]}
+
+    @router.get("/missing")
+    async def missing():
+        calls["count"] += 1
+        raise HTTPException(status_code=404, detail="Not found")
+
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as test_client:
+        test_client.calls = calls
+        yield test_client
+    response_cache.invalidate()
+
+def test_second_request_is_served_from_cache(client):
+    first = client.get("/stats?days=7&keyword=dentista")
+    second = client.get("/stats?keyword=dentista&days=7&unused=")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    assert client.calls["count"] == 1
+
+    client.get("/stats?days=30")
+    assert client.calls["count"] == 2
+
+def test_matching_etag_gets_304(client):
+    etag = client.get("/stats").headers["etag"]
+
+    cached = client.get("/stats", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    stale = client.get("/stats", headers={"If-None-Match": '"outro"'})
+    assert stale.status_code == 200
+
+def test_invalidate_discards_entries_and_changes_the_etag(client):
+    from services.response_cache import response_cache
+
+    etag = client.get("/stats").headers["etag"]
+    client.calls["value"] = "b"
+    response_cache.invalidate()
+
+    fresh = client.get("/stats", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["value"] == "b"
+    assert fresh.headers["etag"] != etag
+    assert client.calls["count"] == 2
+
+def test_response_computed_before_a_write_is_not_stored(client):
+    from fastapi import Request
+    from fastapi.responses import JSONResponse
+    from services.response_cache import response_cache
+
+    # Geração lida antes da consulta; uma gravação no meio a incrementa
+    generation = response_cache.generation
+    response_cache.invalidate()
+
+    request = Request({"type": "http", "method": "GET", "path": "/stats", "query_string": b"", "headers": []})
+    response = response_cache.store(request, JSONResponse({"value": "a"}), generation)
+
+    assert response.status_code == 200
+    assert response.headers["etag"]
+    assert response_cache.lookup(request) is None
+
+def test_errors_are_not_cached(client):
+    assert client.get("/missing").status_code == 404
+    assert client.get("/missing").status_code == 404
+    assert client.calls["count"] == 2
+
+def test_expired_entries_are_recomputed(client, monkeypatch):
+    from services.response_cache import response_cache
+
+    client.get("/stats")
+    monkeypatch.setattr(response_cache, "ttl", -1)
+    client.get("/stats")
+
+    assert client.calls["count"] == 2
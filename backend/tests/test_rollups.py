@@ -0,0 +1,73 @@
+# backend/tests/test_rollups.py
+
+from datetime import datetime, timedelta
+from sqlalchemy import select
+
+def snapshot(engine):
+    """Conteúdo das tabelas de rollup, ordenado, para comparação."""
+    from services.rollups import ROLLUP_MODELS
+
+    with engine.connect() as connection:
+        return {
+            model.__tablename__: sorted(tuple(row) for row in connection.execute(select(model.__table__)))
+            for model in ROLLUP_MODELS
+        }
+
+def write_searches(execution_id: int, keyword_ids, start: datetime, batches: int = 3) -> None:
+    """Grava pesquisas em vários lotes, dias e competidores, como os workers fazem."""
+    from database import SessionLocal
+    from services.search_writer import SearchRecord, SearchWriter
+
+    db = SessionLocal()
+    try:
+        writer = SearchWriter(db, batch_size=4)
+        index = 0
+        for batch in range(batches):
+            for keyword_id in keyword_ids:
+                index += 1
+                record = SearchRecord(keyword_id, execution_id, start + timedelta(hours=9 * index))
+                for position, domain in enumerate(("a.com.br", "b.com.br", f"{index % 4}.com.br"), start=1):
+                    appearance = record.add_appearance({"domain": domain, "position": position, "text": domain})
+                    appearance["clicked"] = 1 if (index + position) % 3 == 0 else 0
+                record.total_ads = len(record.appearances)
+                record.clicks = sum(appearance["clicked"] for appearance in record.appearances)
+                record.lidery_position = index % 4 or None
+                writer.add(record)
+            writer.flush()
+    finally:
+        db.close()
+
+def test_incremental_rollups_match_rebuild(database):
+    from database import SessionLocal, init_db
+    from models import Execution, Keyword
+    from services.competitor_cache import competitor_cache
+    from services.rollups import rebuild_rollups
+
+    init_db()
+    competitor_cache.clear()
+    db = SessionLocal()
+    try:
+        execution = Execution()
+        db.add(execution)
+        db.commit()
+        execution_id = execution.id
+        keyword_ids = [keyword.id for keyword in db.query(Keyword).order_by(Keyword.id).limit(3)]
+    finally:
+        db.close()
+
+    start = datetime(2026, 10, 16, 20, 0)
+    write_searches(execution_id, keyword_ids, start)
+    incremental = snapshot(database)
+    assert incremental["daily_keyword_stats"]
+    assert len({row[0] for row in incremental["daily_keyword_stats"]}) > 1
+
+    with database.begin() as connection:
+        rebuild_rollups(connection)
+    assert snapshot(database) == incremental
+
+    # A reconstrução parcial só refaz os dias a partir de since
+    with database.begin() as connection:
+        rebuild_rollups(connection, since=(start + timedelta(days=1)).date())
+    assert snapshot(database) == incremental
+
+    competitor_cache.clear()
@@ -0,0 +1,108 @@
+# backend/tests/test_visit_policy.py
+
+from datetime import datetime, timedelta
+import threading
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+def policy(**kwargs):
+    from services.visit_policy import VisitPolicy
+
+    options = {"freshness_hours": 24, "overrides": {}, "http_check": False, "http_check_interval": 60}
+    options.update(kwargs)
+    return VisitPolicy(**options)
+
+def test_visit_reserves_the_domain():
+    from services.visit_policy import SKIP, VISIT
+
+    visits = policy()
+
+    assert visits.decide("a.com.br", NOW) == VISIT
+    # Outro worker não visita o mesmo domínio enquanto a visita está em andamento
+    assert visits.decide("a.com.br", NOW + timedelta(seconds=5)) == SKIP
+
+def test_failed_visit_releases_the_reservation():
+    from services.visit_policy import SKIP, VISIT
+
+    visits = policy()
+    assert visits.decide("a.com.br", NOW) == VISIT
+    visits.visit_failed("a.com.br")
+    assert visits.decide("a.com.br", NOW) == VISIT
+
+    # Com visita anterior, a falha devolve a data antiga (ainda expirada)
+    visits.visited("a.com.br", NOW - timedelta(hours=30))
+    assert visits.decide("a.com.br", NOW) == VISIT
+    visits.visit_failed("a.com.br")
+    assert visits._last_visited["a.com.br"] == NOW - timedelta(hours=30)
+
+    # Sem reserva pendente, visit_failed não apaga uma visita confirmada
+    visits.visited("b.com.br", NOW)
+    visits.visit_failed("b.com.br")
+    assert visits.decide("b.com.br", NOW + timedelta(hours=1)) == SKIP
+
+def test_only_one_of_concurrent_workers_gets_the_visit():
+    from services.visit_policy import VISIT
+
+    visits = policy()
+    decisions = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        decisions.append(visits.decide("a.com.br", NOW))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert decisions.count(VISIT) == 1
+
+def test_freshness_window_and_overrides():
+    from services.visit_policy import SKIP, VISIT
+
+    visits = policy(overrides={"*.promo.com.br": 1, "sempre.com.br": 0})
+    for domain in ("a.com.br", "loja.promo.com.br", "sempre.com.br"):
+        visits.visited(domain, NOW)
+
+    later = NOW + timedelta(hours=2)
+    assert visits.decide("a.com.br", later) == SKIP
+    assert visits.decide("loja.promo.com.br", later) == VISIT
+    assert visits.decide("sempre.com.br", NOW) == VISIT
+    assert visits.decide("a.com.br", NOW + timedelta(hours=24)) == VISIT
+
+def test_http_check_interval():
+    from services.visit_policy import HTTP_CHECK, SKIP
+
+    visits = policy(http_check=True, http_check_interval=30)
+    visits.visited("a.com.br", NOW)
+
+    assert visits.decide("a.com.br", NOW + timedelta(minutes=1)) == HTTP_CHECK
+    assert visits.decide("a.com.br", NOW + timedelta(minutes=10)) == SKIP
+    assert visits.decide("a.com.br", NOW + timedelta(minutes=31)) == HTTP_CHECK
+
+def test_warm_keeps_the_latest_visit(database):
+    from database import SessionLocal, init_db
+    from models import Competitor
+    from services.visit_policy import SKIP, VISIT
+
+    init_db()
+    db = SessionLocal()
+    try:
+        db.add_all([
+            Competitor(domain="a.com.br", last_visited=NOW - timedelta(hours=1)),
+            Competitor(domain="b.com.br", last_visited=NOW - timedelta(hours=48)),
+            Competitor(domain="c.com.br")
+        ])
+        db.commit()
+
+        visits = policy()
+        visits.visited("b.com.br", NOW)
+        assert visits.warm(db) == 2
+    finally:
+        db.close()
+
+    assert visits.decide("a.com.br", NOW) == SKIP
+    assert visits.decide("b.com.br", NOW) == SKIP
+    assert visits.decide("c.com.br", NOW) == VISIT
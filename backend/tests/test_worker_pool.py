@@ -0,0 +1,110 @@
+# backend/tests/test_worker_pool.py
+
+import time
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+class FakeScraper:
+    """Scraper sem Chrome: o driver falha nas primeiras start_failures tentativas."""
+
+    start_failures = 0
+
+    def __init__(self, db, execution_id, headless, stop_event=None, delay_policy=None, visit_advertisers=True):
+        from services.search_writer import SearchWriter
+
+        self.execution_id = execution_id
+        self.writer = SearchWriter(db)
+        self.search_recorded = False
+        self.driver = None
+
+    def configure_driver(self):
+        if FakeScraper.start_failures > 0:
+            FakeScraper.start_failures -= 1
+            raise WebDriverException("chrome not reachable")
+        self.driver = object()
+
+    async def run_search(self, keyword):
+        from services.search_writer import SearchRecord
+
+        self.writer.add(SearchRecord(keyword.id, self.execution_id))
+        self.search_recorded = True
+        return {"clicks": 0, "lidery_position": None}
+
+    def close(self, broken=False):
+        self.driver = None
+
+@pytest.fixture
+def scraping(database, monkeypatch):
+    from database import init_db
+    from config import settings
+    import services.worker_pool as worker_pool
+
+    init_db()
+    monkeypatch.setattr(worker_pool, "GoogleScraper", FakeScraper)
+    monkeypatch.setitem(settings.DRIVER_START_BACKOFF, "BASE", 0)
+    monkeypatch.setitem(settings.DELAY_PROFILES, "test", {})
+    FakeScraper.start_failures = 0
+    return database
+
+def run_execution(workers: int = 1):
+    """Roda uma execução completa pelo engine, na thread do job. Retorna (execução, progresso)."""
+    from database import SessionLocal
+    from services.execution_engine import execution_engine
+    from services.execution_plan import execution_plan
+    from models import Execution
+
+    db = SessionLocal()
+    try:
+        execution_id = execution_engine.start(db, headless=True, workers=workers, delay_profile="test")
+        # O job sai de _jobs ao terminar, talvez antes desta linha: espera pelo is_running
+        deadline = time.monotonic() + 60
+        while execution_engine.is_running(execution_id):
+            assert time.monotonic() < deadline, "execução não terminou em 60s"
+            time.sleep(0.05)
+        db.expire_all()
+        return db.get(Execution, execution_id), execution_plan.progress(db, execution_id)
+    finally:
+        db.close()
+
+def test_transient_driver_failures_are_retried(scraping):
+    from config import settings
+
+    FakeScraper.start_failures = settings.MAX_DRIVER_RESTARTS
+    execution, progress = run_execution()
+
+    assert execution.status == "completed"
+    assert progress["pending"] == 0
+    assert progress["completed"] == progress["total"] > 0
+
+def test_execution_with_unprocessed_keywords_is_not_completed(scraping):
+    FakeScraper.start_failures = 1000
+    execution, progress = run_execution(workers=2)
+
+    assert execution.status == "error"
+    assert "keywords left unprocessed" in execution.error_message
+    assert progress["pending"] == 0
+    assert progress["failed"] == progress["total"] > 0
+
+def test_counters_continue_from_the_execution_totals(scraping, monkeypatch):
+    from database import SessionLocal
+    from models import Execution, Keyword
+    from services.event_bus import event_bus
+    from services.worker_pool import ScrapingWorkerPool
+
+    db = SessionLocal()
+    try:
+        # Execução retomada: o snapshot já mostra as pesquisas da rodada anterior
+        execution = Execution(total_searches=5, total_clicks=3, total_lidery_found=2)
+        db.add(execution)
+        db.commit()
+        execution_id = execution.id
+        keyword_id = db.query(Keyword.id).first()[0]
+    finally:
+        db.close()
+
+    events = []
+    monkeypatch.setattr(event_bus, "publish", lambda execution_id, event_type, **data: events.append((event_type, data)))
+    ScrapingWorkerPool(execution_id, headless=True, delay_profile="test").run([keyword_id])
+
+    counters = [data for event_type, data in events if event_type == "counters"]
+    assert counters[0] == {"searches": 6, "clicks": 3, "lidery_found": 2, "errors": 0}
@@ -19,10 +19,12 @@ import {
   InputAdornment,
   Box,
   Button,
+  CircularProgress,
 } from '@mui/material';
 import {
   WhatsApp as WhatsAppIcon,
   Phone as PhoneIcon,
+  Email as EmailIcon,
   Search as SearchIcon,
   ContentCopy as CopyIcon,
   Launch as LaunchIcon,
@@ -30,24 +32,52 @@ import {
 import { format } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 import { useSnackbar } from 'notistack';
+import { Contact } from '../../types';
+import { contactService } from '../../services/contactService';
 
-interface Contact {
-  id: number;
-  competitor_id: number;
-  competitor_domain: string;
-  type: 'whatsapp' | 'phone';
-  value: string;
-  first_seen: string;
-  last_seen: string;
-  times_found: number;
-}
+const PAGE_SIZE = 50;
+const SEARCH_DEBOUNCE_MS = 400;
 
 export const ContactsTable: React.FC = () => {
   const [contacts, setContacts] = React.useState<Contact[]>([]);
   const [search, setSearch] = React.useState('');
+  const [nextCursor, setNextCursor] = React.useState<string | null>(null);
+  const [total, setTotal] = React.useState<number | null>(null);
   const [loading, setLoading] = React.useState(false);
   const { enqueueSnackbar } = useSnackbar();
 
+  // Carrega uma página; sem cursor recomeça a lista (e pede o total)
+  const loadContacts = React.useCallback(async (term: string, cursor: string | null = null) => {
+    try {
+      setLoading(true);
+      const page = await contactService.listContacts({
+        search: term || undefined,
+        cursor,
+        limit: PAGE_SIZE,
+        include_total: cursor === null,
+      });
+      setContacts(prev => (cursor ? [...prev, ...page.items] : page.items));
+      setNextCursor(page.next_cursor);
+      if (cursor === null) {
+        setTotal(page.total_estimate);
+      }
+    } catch (error) {
+      enqueueSnackbar('Erro ao carregar contatos', { variant: 'error' });
+    } finally {
+      setLoading(false);
+    }
+  }, [enqueueSnackbar]);
+
+  // Busca no servidor com debounce
+  React.useEffect(() => {
+    const timer = setTimeout(() => loadContacts(search.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [search, loadContacts]);
+
+  const handleExport = () => {
+    window.open(contactService.getExportUrl('csv'), '_blank');
+  };
+
   const handleCopy = (value: string) => {
     navigator.clipboard.writeText(value);
     enqueueSnackbar('Contato copiado para a área de transferência', {
@@ -66,6 +96,8 @@ export const ContactsTable: React.FC = () => {
         return <WhatsAppIcon color="success" />;
       case 'phone':
         return <PhoneIcon color="primary" />;
+      case 'email':
+        return <EmailIcon color="action" />;
       default:
         return null;
     }
@@ -76,15 +108,11 @@ export const ContactsTable: React.FC = () => {
     window.open(`https://wa.me/${formattedNumber}`, '_blank');
   };
 
-  const filteredContacts = contacts.filter(contact => 
-    contact.competitor_domain.toLowerCase().includes(search.toLowerCase()) ||
-    contact.value.includes(search)
-  );
-
   return (
     <Card>
       <CardHeader 
         title="Contatos Capturados"
+        subheader={total !== null ? `${total} contatos` : undefined}
         action={
           <Box sx={{ display: 'flex', gap: 2 }}>
             <TextField
@@ -102,7 +130,7 @@ export const ContactsTable: React.FC = () => {
             />
             <Button
               variant="contained"
-              onClick={() => {/* Implementar exportação */}}
+              onClick={handleExport}
             >
               Exportar
             </Button>
@@ -124,7 +152,7 @@ export const ContactsTable: React.FC = () => {
               </TableRow>
             </TableHead>
             <TableBody>
-              {filteredContacts.map((contact) => (
+              {contacts.map((contact) => (
                 <TableRow key={contact.id}>
                   <TableCell>
                     <Typography variant="body2">
@@ -192,6 +220,17 @@ export const ContactsTable: React.FC = () => {
             </TableBody>
           </Table>
         </TableContainer>
+        {(nextCursor || loading) && (
+          <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+            <Button
+              onClick={() => loadContacts(search.trim(), nextCursor)}
+              disabled={loading || !nextCursor}
+              startIcon={loading ? <CircularProgress size={20} /> : null}
+            >
+              Carregar mais
+            </Button>
+          </Box>
+        )}
       </CardContent>
     </Card>
   );
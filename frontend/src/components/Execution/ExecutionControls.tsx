@@ -25,6 +25,7 @@ export const ExecutionControls: React.FC = () => {
   const dispatch = useDispatch<AppDispatch>();
   const { enqueueSnackbar } = useSnackbar();
   const [headless, setHeadless] = React.useState(false);
+  const [serpOnly, setSerpOnly] = React.useState(false);
   
   const { currentExecution, loading } = useSelector(
     (state: RootState) => state.execution
@@ -32,7 +33,7 @@ export const ExecutionControls: React.FC = () => {
 
   const handleStart = async () => {
     try {
-      await dispatch(startExecution(headless)).unwrap();
+      await dispatch(startExecution({ headless, mode: serpOnly ? 'serp_only' : 'full' })).unwrap();
       enqueueSnackbar('Execução iniciada com sucesso', { variant: 'success' });
     } catch (error) {
       enqueueSnackbar('Erro ao iniciar execução', { variant: 'error' });
@@ -85,6 +86,16 @@ export const ExecutionControls: React.FC = () => {
             }
             label="Modo Headless"
           />
+          <FormControlLabel
+            control={
+              <Switch
+                checked={serpOnly}
+                onChange={(e) => setSerpOnly(e.target.checked)}
+                disabled={loading || !!currentExecution}
+              />
+            }
+            label="Somente posições (sem visitar anunciantes)"
+          />
         </Stack>
       </CardContent>
     </Card>
@@ -0,0 +1,56 @@
+// frontend/src/components/Execution/ExecutionEventsContext.tsx
+
+import React from 'react';
+import { useSelector } from 'react-redux';
+import { RootState } from '../../store';
+import { executionService } from '../../services/executionService';
+import { ExecutionEvent } from '../../types';
+
+type ExecutionEventListener = (event: ExecutionEvent) => void;
+type Subscribe = (listener: ExecutionEventListener) => () => void;
+
+const ExecutionEventsContext = React.createContext<Subscribe | null>(null);
+
+// Abre uma única assinatura (SSE) da execução atual e repassa os eventos
+// a todos os componentes da página que usam useExecutionEvents
+export const ExecutionEventsProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
+  const { currentExecution } = useSelector((state: RootState) => state.execution);
+  const listeners = React.useRef(new Set<ExecutionEventListener>());
+
+  // Os efeitos dos filhos rodam antes: os listeners já estão registrados
+  // quando o stream abre, e o snapshot inicial não se perde
+  React.useEffect(() => {
+    if (!currentExecution?.id) return;
+
+    return executionService.subscribeToEvents(currentExecution.id, (event) => {
+      listeners.current.forEach((listener) => listener(event));
+    });
+  }, [currentExecution?.id]);
+
+  const subscribe = React.useCallback<Subscribe>((listener) => {
+    listeners.current.add(listener);
+    return () => {
+      listeners.current.delete(listener);
+    };
+  }, []);
+
+  return (
+    <ExecutionEventsContext.Provider value={subscribe}>
+      {children}
+    </ExecutionEventsContext.Provider>
+  );
+};
+
+// Recebe os eventos da execução atual pela assinatura compartilhada
+export const useExecutionEvents = (onEvent: ExecutionEventListener) => {
+  const subscribe = React.useContext(ExecutionEventsContext);
+  if (!subscribe) {
+    throw new Error('useExecutionEvents must be used within an ExecutionEventsProvider');
+  }
+
+  // Sempre o handler do último render, sem reabrir a inscrição
+  const handler = React.useRef(onEvent);
+  handler.current = onEvent;
+
+  React.useEffect(() => subscribe((event) => handler.current(event)), [subscribe]);
+};
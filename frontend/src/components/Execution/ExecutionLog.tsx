@@ -10,24 +10,56 @@ import {
   Paper
 } from '@mui/material';
 import { Clear as ClearIcon } from '@mui/icons-material';
-import { useSelector } from 'react-redux';
-import { RootState } from '../../store';
+import { ExecutionEvent } from '../../types';
+import { useExecutionEvents } from './ExecutionEventsContext';
+
+// Texto de cada evento da execução; eventos sem texto não entram no log
+const formatEvent = (event: ExecutionEvent): string | null => {
+  const { data } = event;
+  switch (event.type) {
+    case 'execution_started':
+      return `Execução #${event.execution_id} iniciada (${data.headless ? 'headless' : 'visível'}` +
+        `${data.mode === 'serp_only' ? ', somente posições' : ''})`;
+    case 'search_started':
+      return `Pesquisando "${data.keyword}"`;
+    case 'ad_found':
+      return `Anúncio na posição ${data.position}: ${data.domain}${data.is_lidery ? ' (Lidery)' : ''}`;
+    case 'competitor_clicked':
+      return `Site visitado: ${data.domain}`;
+    case 'competitor_skipped':
+      return `Site visitado recentemente, ignorado: ${data.domain}` +
+        (data.http_checked ? ' (contatos conferidos via HTTP)' : '');
+    case 'contact_found':
+      return `Contato encontrado em ${data.domain}: ${data.type} ${data.value}`;
+    case 'search_finished':
+      return `Pesquisa concluída: ${data.total_ads} anúncios, ${data.clicks} cliques` +
+        (data.lidery_position ? `, Lidery na posição ${data.lidery_position}` : '');
+    case 'keyword_retry':
+      return `Falha na pesquisa (tentativa ${data.attempt}), nova tentativa em ${data.retry_in}s: ${data.message}`;
+    case 'keyword_failed':
+      return `Keyword abandonada após ${data.attempts} tentativa(s): ${data.message}`;
+    case 'error':
+      return `Erro: ${data.message}`;
+    case 'execution_finished':
+      return `Execução finalizada: ${data.status}${data.error_message ? ` (${data.error_message})` : ''}`;
+    default:
+      return null;
+  }
+};
 
 export const ExecutionLog: React.FC = () => {
   const [logs, setLogs] = React.useState<string[]>([]);
   const logContainerRef = React.useRef<HTMLDivElement>(null);
   
-  // Simular recebimento de logs (substituir por WebSocket ou polling real)
-  React.useEffect(() => {
-    const interval = setInterval(() => {
-      setLogs(prev => [
-        ...prev,
-        `[${new Date().toISOString()}] Ação executada...`
-      ].slice(-100)); // Manter apenas os últimos 100 logs
-    }, 5000);
-
-    return () => clearInterval(interval);
-  }, []);
+  // Receber os eventos da execução atual pela assinatura compartilhada (SSE)
+  useExecutionEvents((event) => {
+    const message = formatEvent(event);
+    if (!message) return;
+    setLogs(prev => [
+      ...prev,
+      `[${new Date().toISOString()}] ${message}`
+    ].slice(-100)); // Manter apenas os últimos 100 logs
+  });
 
   React.useEffect(() => {
     if (logContainerRef.current) {
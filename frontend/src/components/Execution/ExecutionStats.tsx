@@ -14,7 +14,7 @@ import { useSelector } from 'react-redux';
 import { RootState } from '../../store';
 import { formatDistanceToNow } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
-import { executionService } from '../../services/executionService';
+import { useExecutionEvents } from './ExecutionEventsContext';
 import { useSnackbar } from 'notistack';
 
 interface StatCardProps {
@@ -60,39 +60,29 @@ export const ExecutionStats: React.FC = () => {
   });
   const { enqueueSnackbar } = useSnackbar();
 
-  const loadStats = async () => {
-    if (!currentExecution?.id) return;
-    
-    try {
-      setLoading(true);
-      const status = await executionService.getExecutionStatus(currentExecution.id);
+  // Stats chegam pelo stream de eventos: snapshot inicial e depois os contadores
+  React.useEffect(() => {
+    if (currentExecution?.id) setLoading(true);
+  }, [currentExecution?.id]);
+
+  useExecutionEvents((event) => {
+    if (event.type === 'snapshot') {
       setStats({
-        totalSearches: status.total_searches,
-        totalClicks: status.total_clicks,
-        totalLidery: status.total_lidery_found,
+        totalSearches: event.data.total_searches,
+        totalClicks: event.data.total_clicks,
+        totalLidery: event.data.total_lidery_found,
       });
-    } catch (error) {
-      enqueueSnackbar('Erro ao carregar estatísticas', { variant: 'error' });
-    } finally {
       setLoading(false);
+    } else if (event.type === 'counters') {
+      setStats({
+        totalSearches: event.data.searches,
+        totalClicks: event.data.clicks,
+        totalLidery: event.data.lidery_found,
+      });
+    } else if (event.type === 'error') {
+      enqueueSnackbar(event.data.message, { variant: 'error' });
     }
-  };
-
-  React.useEffect(() => {
-    loadStats();
-    
-    // Atualizar stats a cada 5 segundos se houver uma execução ativa
-    let interval: NodeJS.Timeout;
-    if (currentExecution?.is_running) {
-      interval = setInterval(loadStats, 5000);
-    }
-    
-    return () => {
-      if (interval) {
-        clearInterval(interval);
-      }
-    };
-  }, [currentExecution?.id, currentExecution?.is_running]);
+  });
 
   const getRunningTime = () => {
     if (!currentExecution?.start_time) return 'N/A';
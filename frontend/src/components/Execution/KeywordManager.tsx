@@ -33,6 +33,8 @@ import { keywordService } from '../../services/keywordService';
 import { format } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 
+const PAGE_SIZE = 50;
+
 export const KeywordManager: React.FC = () => {
   const dispatch = useDispatch<AppDispatch>();
   const { enqueueSnackbar } = useSnackbar();
@@ -42,13 +44,15 @@ export const KeywordManager: React.FC = () => {
   const [openDialog, setOpenDialog] = React.useState(false);
   const [loading, setLoading] = React.useState(false);
   const [keywords, setKeywords] = React.useState<Keyword[]>([]);
+  const [nextCursor, setNextCursor] = React.useState<string | null>(null);
 
-  // Função para carregar keywords
-  const loadKeywords = async () => {
+  // Carrega uma página de keywords; sem cursor recomeça da primeira
+  const loadKeywords = async (cursor: string | null = null) => {
     try {
       setLoading(true);
-      const data = await keywordService.listKeywords();
-      setKeywords(data);
+      const page = await keywordService.listKeywords({ cursor, limit: PAGE_SIZE });
+      setKeywords(prev => (cursor ? [...prev, ...page.items] : page.items));
+      setNextCursor(page.next_cursor);
     } catch (error) {
       enqueueSnackbar('Erro ao carregar palavras-chave', { variant: 'error' });
     } finally {
@@ -172,6 +176,17 @@ export const KeywordManager: React.FC = () => {
               ))}
             </Box>
           )}
+
+          {nextCursor && (
+            <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+              <Button
+                onClick={() => loadKeywords(nextCursor)}
+                disabled={loading}
+              >
+                Carregar mais
+              </Button>
+            </Box>
+          )}
         </CardContent>
       </Card>
 
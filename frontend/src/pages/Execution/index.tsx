@@ -6,14 +6,18 @@ import { ExecutionControls } from '../../components/Execution/ExecutionControls'
 import { ExecutionStats } from '../../components/Execution/ExecutionStats';
 import { KeywordManager } from '../../components/Execution/KeywordManager';
 import { ExecutionLog } from '../../components/Execution/ExecutionLog';
+import { ExecutionEventsProvider } from '../../components/Execution/ExecutionEventsContext';
 
 const Execution: React.FC = () => {
   return (
     <Container maxWidth="xl">
-      <ExecutionControls />
-      <ExecutionStats />
-      <KeywordManager />
-      <ExecutionLog />
+      {/* Stats e log compartilham uma única assinatura dos eventos da execução */}
+      <ExecutionEventsProvider>
+        <ExecutionControls />
+        <ExecutionStats />
+        <KeywordManager />
+        <ExecutionLog />
+      </ExecutionEventsProvider>
     </Container>
   );
 };
@@ -1,18 +1,30 @@
 // frontend/src/services/contactService.ts
 
 import api from './api';
-import { Contact } from '../types';
+import { Contact, Page, PageParams } from '../types';
+
+interface ContactFilters extends PageParams {
+  contact_type?: string;
+  days?: number;
+  search?: string;
+}
 
 export const contactService = {
-  listContacts: async (contactType?: string, days: number = 30) => {
-    const response = await api.get<Contact[]>('/contacts', {
-      params: { contact_type: contactType, days }
+  listContacts: async (filters: ContactFilters = {}) => {
+    const response = await api.get<Page<Contact>>('/contacts', {
+      params: { days: 30, ...filters }
     });
     return response.data;
   },
 
-  getCompetitorContacts: async (competitorId: number) => {
-    const response = await api.get<Contact[]>(`/contacts/competitor/${competitorId}`);
+  getCompetitorContacts: async (competitorId: number, params: PageParams = {}) => {
+    const response = await api.get<Page<Contact>>(`/contacts/competitor/${competitorId}`, {
+      params
+    });
     return response.data;
   },
-};
\ No newline at end of file
+
+  // URL do CSV de contatos (download direto pelo navegador, em streaming)
+  getExportUrl: (format: 'csv' | 'xlsx' = 'csv') =>
+    `${api.defaults.baseURL}/exports/contacts?format=${format}`,
+};
@@ -1,7 +1,7 @@
 // frontend/src/services/executionService.ts
 
 import api from './api';
-import { Execution } from '../types';
+import { Execution, ExecutionEvent, ExecutionEventType, ExecutionMode, Page } from '../types';
 
 interface LogEntry {
   timestamp: string;
@@ -9,10 +9,31 @@ interface LogEntry {
   type: 'info' | 'error' | 'success' | 'warning';
 }
 
+const EXECUTION_EVENT_TYPES: ExecutionEventType[] = [
+  'snapshot',
+  'execution_started',
+  'search_started',
+  'ad_found',
+  'competitor_clicked',
+  'competitor_skipped',
+  'contact_found',
+  'search_finished',
+  'keyword_retry',
+  'keyword_failed',
+  'counters',
+  'error',
+  'execution_finished'
+];
+
 export const executionService = {
-  startExecution: async (headless: boolean) => {
-    const response = await api.post<Execution>('/execution/start', { headless });
-    return response.data;
+  startExecution: async (headless: boolean, mode: ExecutionMode = 'full') => {
+    // A API só devolve o ID; o registro completo vem do status
+    const response = await api.post<{ message: string; execution_id: number }>(
+      '/execution/start',
+      null,
+      { params: { headless, mode } }
+    );
+    return executionService.getExecutionStatus(response.data.execution_id);
   },
 
   stopExecution: async (executionId: number) => {
@@ -25,13 +46,32 @@ export const executionService = {
     return response.data;
   },
 
-  listExecutions: async (limit: number = 10, offset: number = 0) => {
-    const response = await api.get<Execution[]>('/execution/list', {
-      params: { limit, offset }
+  listExecutions: async (limit: number = 10, cursor?: string | null) => {
+    const response = await api.get<Page<Execution>>('/execution/list', {
+      params: { limit, cursor }
     });
     return response.data;
   },
 
+  // Stream (SSE) dos eventos da execução; retorna a função que encerra a assinatura
+  subscribeToEvents: (executionId: number, onEvent: (event: ExecutionEvent) => void) => {
+    const source = new EventSource(`${api.defaults.baseURL}/execution/events/${executionId}`);
+
+    EXECUTION_EVENT_TYPES.forEach((type) => {
+      source.addEventListener(type, (message) => {
+        const event: ExecutionEvent = JSON.parse((message as MessageEvent).data);
+        onEvent(event);
+
+        // O servidor encerra o stream ao fim da execução; evitar a reconexão automática
+        if (type === 'execution_finished' || (type === 'snapshot' && !event.data.is_running)) {
+          source.close();
+        }
+      });
+    });
+
+    return () => source.close();
+  },
+
   // Adicionando o novo método
   getExecutionLogs: async (executionId: number) => {
     const response = await api.get<LogEntry[]>(`/execution/${executionId}/logs`);
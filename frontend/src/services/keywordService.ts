@@ -1,11 +1,16 @@
 // frontend/src/services/keywordService.ts
 
 import api from './api';
-import { Keyword } from '../types';
+import { Keyword, Page, PageParams } from '../types';
+
+interface KeywordFilters extends PageParams {
+  search?: string;
+  is_active?: boolean;
+}
 
 export const keywordService = {
-  listKeywords: async () => {
-    const response = await api.get<Keyword[]>('/keywords');
+  listKeywords: async (filters: KeywordFilters = {}) => {
+    const response = await api.get<Page<Keyword>>('/keywords', { params: filters });
     return response.data;
   },
 
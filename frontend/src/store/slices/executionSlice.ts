@@ -2,7 +2,7 @@
 
 import { createSlice, createAsyncThunk } from '@reduxjs/toolkit';
 import { executionService } from '../../services/executionService';
-import { Execution } from '../../types';
+import { Execution, ExecutionMode } from '../../types';
 
 interface ExecutionState {
   currentExecution: Execution | null;
@@ -21,8 +21,8 @@ const initialState: ExecutionState = {
 // Agora usamos o executionService em vez do axios diretamente
 export const startExecution = createAsyncThunk(
   'execution/start',
-  async (headless: boolean) => {
-    return await executionService.startExecution(headless);
+  async ({ headless, mode }: { headless: boolean; mode: ExecutionMode }) => {
+    return await executionService.startExecution(headless, mode);
   }
 );
 
@@ -36,7 +36,8 @@ export const stopExecution = createAsyncThunk(
 export const fetchExecutions = createAsyncThunk(
   'execution/fetchAll',
   async () => {
-    return await executionService.listExecutions();
+    const page = await executionService.listExecutions();
+    return page.items;
   }
 );
 
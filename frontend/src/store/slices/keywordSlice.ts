@@ -1,7 +1,7 @@
 // frontend/src/store/slices/keywordSlice.ts
 
 import { createSlice, createAsyncThunk } from '@reduxjs/toolkit';
-import axios from 'axios';
+import { keywordService } from '../../services/keywordService';
 import { Keyword } from '../../types';
 
 interface KeywordState {
@@ -16,26 +16,35 @@ const initialState: KeywordState = {
   error: null,
 };
 
+// Maior página aceita pela API (MAX_PAGE_SIZE)
+const PAGE_SIZE = 500;
+
+// A listagem é paginada por cursor: percorre todas as páginas
 export const fetchKeywords = createAsyncThunk(
   'keywords/fetchAll',
   async () => {
-    const response = await axios.get('/api/v1/keywords');
-    return response.data;
+    const items: Keyword[] = [];
+    let cursor: string | null = null;
+    do {
+      const page = await keywordService.listKeywords({ cursor, limit: PAGE_SIZE });
+      items.push(...page.items);
+      cursor = page.next_cursor;
+    } while (cursor);
+    return items;
   }
 );
 
 export const addKeywords = createAsyncThunk(
   'keywords/add',
   async (keywords: string[]) => {
-    const response = await axios.post('/api/v1/keywords', { keywords });
-    return response.data;
+    return await keywordService.addKeywords(keywords);
   }
 );
 
 export const deleteKeyword = createAsyncThunk(
   'keywords/delete',
   async (id: number) => {
-    await axios.delete(`/api/v1/keywords/${id}`);
+    await keywordService.deleteKeyword(id);
     return id;
   }
 );
@@ -43,8 +52,7 @@ export const deleteKeyword = createAsyncThunk(
 export const toggleKeyword = createAsyncThunk(
   'keywords/toggle',
   async (id: number) => {
-    const response = await axios.put(`/api/v1/keywords/${id}/toggle`);
-    return response.data;
+    return await keywordService.toggleKeyword(id);
   }
 );
 
@@ -1,5 +1,8 @@
 // frontend/src/types/index.ts
 
+// full visita os sites dos anunciantes; serp_only só registra as posições
+export type ExecutionMode = 'full' | 'serp_only';
+
 export interface Execution {
     id: number;
     start_time: string;
@@ -8,9 +11,46 @@ export interface Execution {
     total_clicks: number;
     total_lidery_found: number;
     is_running: boolean;
-    execution_mode: 'visible' | 'headless';
+    execution_mode: ExecutionMode;
+    headless: boolean;
+    workers?: number | null;
+    delay_profile?: string | null;
     status: 'running' | 'completed' | 'error';
     error_message?: string;
+    metrics_summary?: ExecutionMetricsSummary | null;
+    progress?: ExecutionProgress;
+  }
+
+  // Keywords do plano da execução por estado
+  export interface ExecutionProgress {
+    pending: number;
+    running: number;
+    completed: number;
+    failed: number;
+    total: number;
+  }
+
+  // Resumo das métricas da execução (tempos por etapa, contadores e erros)
+  export interface ExecutionMetricsSummary {
+    stages: Record<string, {
+      count: number;
+      total_seconds: number;
+      avg_seconds: number;
+      max_seconds: number;
+    }>;
+    counters: Record<string, number>;
+    // Bytes trazidos do navegador para extrair contatos, por método (in_page, page_source)
+    transferred_bytes?: Record<string, number>;
+    // Esperas de prontidão: tempo real contra o orçamento e desfechos (ready, no_ads, timeout)
+    waits?: Record<string, {
+      count: number;
+      total_seconds: number;
+      avg_seconds: number;
+      max_seconds: number;
+      budget_used: number;
+      outcomes: Record<string, number>;
+    }>;
+    errors: Record<string, number>;
   }
   
   export interface Keyword {
@@ -29,6 +69,7 @@ export interface Execution {
     first_seen: string;
     last_seen: string;
     total_appearances: number;
+    last_visited?: string | null;
   }
   
   export interface Contact {
@@ -63,4 +104,41 @@ export interface Execution {
       appearances: number;
       average_position: number;
     }[];
-  }
\ No newline at end of file
+  }
+
+  export type ExecutionEventType =
+    | 'snapshot'
+    | 'execution_started'
+    | 'search_started'
+    | 'ad_found'
+    | 'competitor_clicked'
+    | 'competitor_skipped'
+    | 'contact_found'
+    | 'search_finished'
+    | 'keyword_retry'
+    | 'keyword_failed'
+    | 'counters'
+    | 'error'
+    | 'execution_finished';
+
+  export interface ExecutionEvent {
+    id: number;
+    type: ExecutionEventType;
+    execution_id: number;
+    timestamp: string;
+    data: Record<string, any>;
+  }
+
+  // Página de uma listagem paginada por cursor (keyset)
+  export interface Page<T> {
+    items: T[];
+    next_cursor: string | null;
+    total_estimate: number | null;
+  }
+
+  export interface PageParams {
+    cursor?: string | null;
+    limit?: number;
+    sort?: string;
+    include_total?: boolean;
+  }